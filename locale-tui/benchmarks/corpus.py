@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""Synthetic Android project generator for benchmarks.
+
+Builds one module with a given number of keys, target locales and Kotlin
+source files. Most keys are referenced from code or layouts, the rest are
+dead; some translations are missing and some are stale.
+
+    uv run python benchmarks/corpus.py /tmp/corpus --keys 10000 --locales 5
+    LOCALE_TUI_CONFIG=/tmp/corpus/config.yml uv run python src/main.py
+"""
+
+import json
+import random
+import sys
+from dataclasses import dataclass, asdict
+from pathlib import Path
+
+import click
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from services.source_tracker import SourceTracker
+
+LOCALES = [
+    "zh", "ja", "ko", "de", "fr", "es", "pt-rBR", "ru", "it", "tr",
+    "vi", "th", "pl", "nl", "id", "ar", "uk", "cs", "sv", "zh-rTW",
+]
+
+PREFIXES = [
+    "setting", "chat", "assistant", "provider", "model", "message", "search",
+    "history", "backup", "share", "about", "menu", "dialog", "error", "toast",
+]
+
+WORDS = (
+    "the a new open close save delete edit copy share send retry cancel confirm "
+    "message model provider assistant setting history backup server token key "
+    "failed success loading empty select enable disable default custom remove "
+    "download upload update version network image file text voice search"
+).split()
+
+PLACEHOLDERS = ["%1$s", "%1$d", "%2$s", "%s", "%d"]
+
+RES_PATH = "app/src/main/res"
+SOURCE_PATTERN = "app/src/main/java/**/*.kt"
+
+
+@dataclass
+class CorpusSpec:
+    """Shape of a generated project."""
+
+    keys: int
+    locales: int = 5
+    source_files: int = 0  # 0 picks keys / 100
+    seed: int = 0
+    # Share of keys referenced from code or layouts
+    referenced: float = 0.9
+    # Share of translations present in each locale
+    translated: float = 0.9
+    # Share of present translations made from an older source text
+    stale: float = 0.05
+
+    def __post_init__(self):
+        if not self.source_files:
+            self.source_files = max(10, self.keys // 100)
+
+
+def _value(rng: random.Random) -> str:
+    words = rng.choices(WORDS, k=rng.randint(1, 8))
+    if rng.random() < 0.2:
+        words.insert(rng.randint(0, len(words)), rng.choice(PLACEHOLDERS))
+    return " ".join(words).capitalize()
+
+
+def _strings_xml(values: dict[str, str]) -> str:
+    lines = ['<?xml version="1.0" encoding="utf-8"?>', "<resources>"]
+    lines.extend(
+        f'  <string name="{key}">{value}</string>' for key, value in values.items()
+    )
+    lines.append("</resources>\n")
+    return "\n".join(lines)
+
+
+def write_corpus(root: Path, spec: CorpusSpec) -> Path:
+    """Write a project described by spec under root, returns its config path."""
+    rng = random.Random(spec.seed)
+    root.mkdir(parents=True, exist_ok=True)
+
+    keys = [f"{PREFIXES[i % len(PREFIXES)]}_item_{i}" for i in range(spec.keys)]
+    source = {key: _value(rng) for key in keys}
+    locales = [f"values-{code}" for code in LOCALES[: spec.locales]]
+
+    res = root / RES_PATH
+    (res / "values").mkdir(parents=True, exist_ok=True)
+    (res / "values" / "strings.xml").write_text(_strings_xml(source), encoding="utf-8")
+
+    state: dict[str, dict[str, str]] = {}
+    for lang in locales:
+        values = {}
+        for key, text in source.items():
+            if rng.random() >= spec.translated:
+                continue
+            values[key] = f"[{lang[7:]}] {text}"
+            recorded = text if rng.random() >= spec.stale else f"old {text}"
+            state.setdefault(key, {})[lang] = SourceTracker.fingerprint(recorded)
+        (res / lang).mkdir(parents=True, exist_ok=True)
+        (res / lang / "strings.xml").write_text(_strings_xml(values), encoding="utf-8")
+
+    # Referenced keys are spread over Kotlin files, every tenth one is used
+    # from a layout instead
+    referenced = [key for key in keys if rng.random() < spec.referenced]
+    calls = ["R.string.{}", "getString(R.string.{})", "stringResource(R.string.{})"]
+    sources: list[list[str]] = [[] for _ in range(spec.source_files)]
+    layout: list[str] = []
+    for i, key in enumerate(referenced):
+        if i % 10 == 9:
+            layout.append(f'    <TextView android:text="@string/{key}" />')
+        else:
+            call = calls[i % len(calls)].format(key)
+            sources[i % spec.source_files].append(f"    val s{i} = {call}")
+
+    java = root / "app/src/main/java/com/example/bench"
+    java.mkdir(parents=True, exist_ok=True)
+    for n, lines in enumerate(sources):
+        body = "\n".join(["    // generated"] * rng.randint(5, 40) + lines)
+        (java / f"Screen{n}.kt").write_text(
+            f"package com.example.bench\n\nclass Screen{n} {{\n{body}\n}}\n",
+            encoding="utf-8",
+        )
+    (res / "layout").mkdir(parents=True, exist_ok=True)
+    (res / "layout" / "bench.xml").write_text(
+        '<?xml version="1.0" encoding="utf-8"?>\n<LinearLayout>\n'
+        + "\n".join(layout)
+        + "\n</LinearLayout>\n",
+        encoding="utf-8",
+    )
+
+    (root / ".locale-state.json").write_text(
+        json.dumps({"bench": state}, sort_keys=True), encoding="utf-8"
+    )
+
+    config_path = root / "config.yml"
+    config_path.write_text(
+        "project_root: \".\"\n"
+        "modules:\n"
+        "  - name: bench\n"
+        f"    res_path: {RES_PATH}\n"
+        "    source_patterns:\n"
+        f"      - \"{SOURCE_PATTERN}\"\n"
+        "languages:\n"
+        "  - code: values\n"
+        "    name: English\n"
+        "    is_source: true\n"
+        + "".join(f"  - code: {lang}\n    name: {lang[7:]}\n" for lang in locales),
+        encoding="utf-8",
+    )
+    (root / "corpus.json").write_text(json.dumps(asdict(spec)), encoding="utf-8")
+    return config_path
+
+
+def ensure_corpus(root: Path, spec: CorpusSpec) -> Path:
+    """Reuse a corpus generated with the same spec, otherwise write it."""
+    marker = root / "corpus.json"
+    if marker.exists() and json.loads(marker.read_text()) == asdict(spec):
+        return root / "config.yml"
+    return write_corpus(root, spec)
+
+
+@click.command()
+@click.argument("output", type=click.Path(file_okay=False, path_type=Path))
+@click.option("--keys", "-k", default=10_000, show_default=True, help="条目数量")
+@click.option("--locales", "-l", default=5, show_default=True, help="目标语言数量")
+@click.option("--sources", "-s", default=0, help="Kotlin 源文件数量（默认条目数 / 100）")
+@click.option("--seed", default=0, show_default=True, help="随机种子")
+def main(output: Path, keys: int, locales: int, sources: int, seed: int):
+    """生成用于性能测试的 Android 项目"""
+    if not 1 <= locales <= len(LOCALES):
+        raise click.BadParameter(f"应在 1 到 {len(LOCALES)} 之间", param_hint="--locales")
+    spec = CorpusSpec(keys=keys, locales=locales, source_files=sources, seed=seed)
+    config_path = write_corpus(output, spec)
+    click.echo(f"✓ 已生成 {keys} 个条目 × {locales} 种语言，{spec.source_files} 个源文件")
+    click.echo(f"  LOCALE_TUI_CONFIG={config_path}")
+
+
+if __name__ == "__main__":
+    main()
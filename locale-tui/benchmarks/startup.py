@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""Cold start benchmark for locale-tui CLI subcommands.
+
+Runs each subcommand in a fresh interpreter against a small throwaway
+project and reports wall time and import time. Commands that never touch the
+TUI or the network must not import Textual or the openai SDK.
+
+    uv run python benchmarks/startup.py
+    uv run python benchmarks/startup.py --json --max-ms 150
+"""
+
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import click
+
+MAIN = Path(__file__).resolve().parent.parent / "src" / "main.py"
+
+# Modules that only the TUI or translation commands may import
+HEAVY_MODULES = ("textual", "openai", "httpx")
+
+# (name, argv, heavy modules allowed)
+COMMANDS = [
+    ("help", ["--help"], False),
+    ("set --help", ["set", "--help"], False),
+    ("list-keys", ["list-keys"], False),
+    ("set", ["set", "bench_key", "Bench value", "-l", "values-zh"], False),
+    ("search", ["search", "key:bench_*"], False),
+]
+
+IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s+)(\S+)")
+
+
+def write_project(root: Path) -> Path:
+    """Create a tiny project with one module and return its config path."""
+    res = root / "res"
+    for lang in ("values", "values-zh"):
+        (res / lang).mkdir(parents=True)
+        (res / lang / "strings.xml").write_text(
+            '<?xml version="1.0" encoding="utf-8"?>\n<resources>\n'
+            + "".join(
+                f'  <string name="bench_{i}">Value {i}</string>\n' for i in range(50)
+            )
+            + "</resources>\n",
+            encoding="utf-8",
+        )
+
+    config_path = root / "config.yml"
+    config_path.write_text(
+        "project_root: \".\"\n"
+        "modules:\n"
+        "  - name: bench\n"
+        "    res_path: res\n"
+        "languages:\n"
+        "  - code: values\n"
+        "    name: English\n"
+        "    is_source: true\n"
+        "  - code: values-zh\n"
+        "    name: Chinese\n",
+        encoding="utf-8",
+    )
+    return config_path
+
+
+def run_once(argv: list[str], env: dict[str, str]) -> float:
+    """Run a command once, returns wall time in milliseconds."""
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, str(MAIN), *argv],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=True,
+    )
+    return (time.perf_counter() - start) * 1000
+
+
+def import_profile(argv: list[str], env: dict[str, str]) -> tuple[float, set[str]]:
+    """Run with -X importtime, returns (total import ms, top-level packages)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", str(MAIN), *argv],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+    total_us = 0
+    packages = set()
+    for line in result.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if not match:
+            continue
+        packages.add(match.group(4).split(".")[0])
+        # Only top-level imports carry the cumulative time of their subtree
+        if len(match.group(3)) == 1:
+            total_us += int(match.group(2))
+    return total_us / 1000, packages
+
+
+@click.command()
+@click.option("--runs", "-n", default=5, show_default=True, help="每个命令运行次数")
+@click.option("--json", "as_json", is_flag=True, help="输出 JSON 结果")
+@click.option(
+    "--max-ms",
+    type=float,
+    default=None,
+    help="中位耗时超过该值（毫秒）时以非零状态退出",
+)
+def main(runs: int, as_json: bool, max_ms: float | None):
+    """测量各子命令的冷启动耗时"""
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, LOCALE_TUI_CONFIG=str(write_project(Path(tmp))))
+
+        for name, argv, heavy_allowed in COMMANDS:
+            # Warm up the file system cache
+            run_once(argv, env)
+            times = [run_once(argv, env) for _ in range(runs)]
+            import_ms, packages = import_profile(argv, env)
+            heavy = sorted(p for p in packages if p in HEAVY_MODULES)
+            results.append(
+                {
+                    "command": name,
+                    "median_ms": round(statistics.median(times), 1),
+                    "min_ms": round(min(times), 1),
+                    "import_ms": round(import_ms, 1),
+                    "heavy_imports": heavy if not heavy_allowed else [],
+                }
+            )
+
+    failed = [
+        r
+        for r in results
+        if r["heavy_imports"] or (max_ms is not None and r["median_ms"] > max_ms)
+    ]
+
+    if as_json:
+        click.echo(json.dumps(results, indent=2))
+    else:
+        click.echo(f"{'command':16} {'median':>9} {'min':>9} {'imports':>9}  heavy")
+        for r in results:
+            click.echo(
+                f"{r['command']:16} {r['median_ms']:>7.1f}ms {r['min_ms']:>7.1f}ms "
+                f"{r['import_ms']:>7.1f}ms  {', '.join(r['heavy_imports']) or '-'}"
+            )
+
+    if failed:
+        click.echo(
+            f"失败：{', '.join(r['command'] for r in failed)}", err=True
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
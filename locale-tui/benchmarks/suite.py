@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""Benchmarks of the parse, scan, load, filter and save paths.
+
+Generates synthetic projects (see corpus.py) and times the services the TUI
+and the CLI are built on. Results can be saved as JSON and compared against
+an earlier run.
+
+    uv run python benchmarks/suite.py
+    uv run python benchmarks/suite.py -s 1k -s 10k -s 100k -o baseline.json
+    uv run python benchmarks/suite.py -b baseline.json --max-regression 20
+"""
+
+import json
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+import click
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from corpus import CorpusSpec, ensure_corpus
+from config import Config
+from services.dead_entry_finder import DeadEntryFinder
+from services.examples import ExampleIndex
+from services.module_loader import ModuleLoader
+from services.query import QueryCompiler
+from services.search_index import SearchIndex
+from services.source_tracker import SourceTracker
+from services.workspace import WorkspaceIndex
+from services.xml_parser import StringsXmlParser
+
+SIZES = {"1k": 1_000, "10k": 10_000, "100k": 100_000}
+
+# Search box inputs, filtered the way TranslationTableScreen.apply_filters does
+QUERIES = [
+    "save",
+    "failed to",
+    "key:setting_*",
+    "missing:ja",
+    "dead",
+    "stale -key:chat_*",
+    "/item_1\\d{2}$/",
+]
+
+
+class Bench:
+    """Shared state of the benchmarks of one corpus."""
+
+    def __init__(self, config: Config, scratch: Path):
+        self.config = config
+        self.module = config.modules[0]
+        self.lang_codes = config.get_language_codes()
+        self.loader = ModuleLoader(config, self.tracker())
+        self.entries = self.loader.load(self.module)
+        self.index = SearchIndex(self.entries)
+        # Trigrams are built on first use, search must not time the build
+        len(self.index)
+        self.workspace = WorkspaceIndex(config, self.loader)
+        self.workspace.refresh()
+        self.examples = ExampleIndex(self.workspace)
+        # Ten batches of ten texts close to, but not equal to, existing ones
+        texts = {
+            e.key: f"{e.get_translation('values')} now" for e in self.entries[:100]
+        }
+        keys = list(texts)
+        self.batches = [
+            {key: texts[key] for key in keys[i : i + 10]} for i in range(0, 100, 10)
+        ]
+        # save and update write here so cached corpora stay unchanged
+        self.scratch = scratch
+        self.scratch.mkdir(parents=True, exist_ok=True)
+        self.update_path = self.scratch / "update.xml"
+        shutil.copyfile(self.path(self.lang_codes[-1]), self.update_path)
+        self.rounds = 0
+
+    def tracker(self) -> SourceTracker:
+        # Benchmarks must not change the corpus state file
+        return SourceTracker(self.config.state_path, autosave=False)
+
+    def path(self, lang_code: str) -> Path:
+        return self.loader.strings_path(self.module, lang_code)
+
+    def parse(self) -> None:
+        for code in self.lang_codes:
+            StringsXmlParser.parse(self.path(code))
+
+    def scan(self) -> None:
+        finder = DeadEntryFinder(self.config.project_root)
+        finder.find_references(self.module.source_patterns)
+
+    def scan_cached(self) -> None:
+        self.loader.finder.find_references(self.module.source_patterns)
+
+    def load(self) -> None:
+        ModuleLoader(self.config, self.tracker()).load(self.module)
+
+    def load_cached_scan(self) -> None:
+        self.loader.load(self.module, use_cache=False)
+
+    def index_build(self) -> None:
+        # The constructor only stores entries, len() builds the trigrams
+        len(SearchIndex(self.entries))
+
+    def search(self) -> None:
+        compiler = QueryCompiler(self.lang_codes, self.index)
+        for text in QUERIES:
+            compiler.compile(text).filter(self.entries, self.index.search)
+
+    def status(self) -> tuple[int, int, int]:
+        missing = sum(
+            1 for e in self.entries if e.has_missing_translations(self.lang_codes)
+        )
+        dead = sum(1 for e in self.entries if e.is_dead)
+        stale = sum(1 for e in self.entries if e.is_stale)
+        return missing, dead, stale
+
+    def examples_index(self) -> None:
+        index = ExampleIndex(self.workspace)
+        index.select(self.batches[0], self.lang_codes[-1])
+
+    def examples_select(self) -> None:
+        # All ten batches, divide by ten for the time per batch
+        for batch in self.batches:
+            self.examples.select(batch, self.lang_codes[-1])
+
+    def save(self) -> None:
+        for code in self.lang_codes:
+            translations = {}
+            for entry in self.entries:
+                value = entry.get_translation(code)
+                if value:
+                    translations[entry.key] = value
+            StringsXmlParser.write(self.scratch / f"{code}.xml", translations)
+
+    def update(self) -> None:
+        # 100 changed values in one file, the path of add, import and translate
+        self.rounds += 1
+        updates = {
+            entry.key: f"{entry.get_translation('values')} {self.rounds}"
+            for entry in self.entries[:100]
+        }
+        StringsXmlParser.update_entries(self.update_path, updates)
+
+
+# (name, method) in run order
+BENCHMARKS: list[tuple[str, Callable[[Bench], object]]] = [
+    ("parse", Bench.parse),
+    ("scan", Bench.scan),
+    ("scan_cached", Bench.scan_cached),
+    ("load", Bench.load),
+    ("load_cached_scan", Bench.load_cached_scan),
+    ("index", Bench.index_build),
+    ("search", Bench.search),
+    ("status", Bench.status),
+    ("examples_index", Bench.examples_index),
+    ("examples_select", Bench.examples_select),
+    ("update", Bench.update),
+    ("save", Bench.save),
+]
+
+
+def measure(fn: Callable[[], object], runs: int) -> dict[str, float]:
+    """Run fn once to warm up and then runs times, returns timings in ms."""
+    fn()
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return {
+        "median_ms": round(statistics.median(times), 2),
+        "min_ms": round(min(times), 2),
+    }
+
+
+def compare(
+    results: dict[str, dict[str, dict]], baseline: dict[str, dict[str, dict]]
+) -> dict[tuple[str, str], float]:
+    """Median change in percent against the baseline for every shared benchmark."""
+    changes = {}
+    for size, benches in results.items():
+        for name, timing in benches.items():
+            before = baseline.get(size, {}).get(name)
+            if before and before["median_ms"] > 0:
+                changes[(size, name)] = (
+                    timing["median_ms"] / before["median_ms"] - 1
+                ) * 100
+    return changes
+
+
+@click.command()
+@click.option(
+    "--size",
+    "-s",
+    "sizes",
+    multiple=True,
+    type=click.Choice(list(SIZES)),
+    help="语料规模（可多次指定，默认 1k 和 10k）",
+)
+@click.option("--locales", "-l", default=5, show_default=True, help="目标语言数量")
+@click.option("--sources", default=0, help="Kotlin 源文件数量（默认条目数 / 100）")
+@click.option("--runs", "-n", default=5, show_default=True, help="每项测试运行次数")
+@click.option(
+    "--only", "-k", multiple=True, help="只运行指定测试（可多次指定）"
+)
+@click.option(
+    "--corpus-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help="语料目录，相同参数的语料会被复用（默认使用临时目录）",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="结果 JSON 输出文件",
+)
+@click.option(
+    "--baseline",
+    "-b",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help="与之比较的基线结果 JSON",
+)
+@click.option(
+    "--max-regression",
+    type=float,
+    default=None,
+    help="中位耗时比基线慢超过该百分比时以非零状态退出",
+)
+@click.option("--json", "as_json", is_flag=True, help="输出 JSON 结果")
+def main(
+    sizes: tuple[str, ...],
+    locales: int,
+    sources: int,
+    runs: int,
+    only: tuple[str, ...],
+    corpus_dir: Path | None,
+    output: Path | None,
+    baseline: Path | None,
+    max_regression: float | None,
+    as_json: bool,
+):
+    """测量解析、Dead 扫描、加载、搜索过滤、状态统计和保存的耗时"""
+    unknown = sorted(set(only) - {name for name, _ in BENCHMARKS})
+    if unknown:
+        raise click.BadParameter(f"未知测试 '{', '.join(unknown)}'", param_hint="--only")
+    benchmarks = [(name, fn) for name, fn in BENCHMARKS if not only or name in only]
+
+    results: dict[str, dict[str, dict]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        base_dir = corpus_dir or Path(tmp)
+        for size in sizes or ("1k", "10k"):
+            spec = CorpusSpec(keys=SIZES[size], locales=locales, source_files=sources)
+            if not as_json:
+                click.echo(f"生成 {size} 语料…", err=True)
+            config_path = ensure_corpus(base_dir / f"corpus-{size}-{locales}", spec)
+
+            bench = Bench(
+                Config.load(config_path, load_env=False), Path(tmp) / "scratch" / size
+            )
+            results[size] = {}
+            for name, fn in benchmarks:
+                results[size][name] = measure(lambda: fn(bench), runs)
+
+    report = {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "locales": locales,
+            "runs": runs,
+        },
+        "results": results,
+    }
+    if output:
+        output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+    changes = {}
+    if baseline:
+        changes = compare(results, json.loads(baseline.read_text())["results"])
+    regressions = [
+        key
+        for key, change in changes.items()
+        if max_regression is not None and change > max_regression
+    ]
+
+    if as_json:
+        if baseline:
+            report["changes"] = {
+                f"{size}/{name}": round(change, 1)
+                for (size, name), change in changes.items()
+            }
+        click.echo(json.dumps(report, indent=2))
+    else:
+        header = f"{'size':6} {'benchmark':18} {'median':>11} {'min':>11}"
+        click.echo(header + ("  vs baseline" if baseline else ""))
+        for size, benches in results.items():
+            for name, timing in benches.items():
+                line = (
+                    f"{size:6} {name:18} {timing['median_ms']:>9.2f}ms "
+                    f"{timing['min_ms']:>9.2f}ms"
+                )
+                if (size, name) in changes:
+                    line += f"  {changes[(size, name)]:+7.1f}%"
+                click.echo(line)
+
+    if regressions:
+        click.echo(
+            "变慢超过阈值：" + ", ".join(f"{size}/{name}" for size, name in regressions),
+            err=True,
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,8 @@ from textual.app import App
 from textual.binding import Binding
 
 from screens.module_select import ModuleSelectScreen
+from services.module_loader import ModuleLoader
+from services.workspace import WorkspaceIndex
 
 if TYPE_CHECKING:
     from config import Config
@@ -24,15 +26,29 @@ class LocaleTuiApp(App):
     BINDINGS = [
         Binding("q", "quit", "Quit"),
         Binding("question_mark", "help", "Help"),
+        Binding("f2", "toggle_perf_hud", "Perf"),
     ]
 
     def __init__(self, config: "Config"):
         super().__init__()
         self.config = config
+        # Shared by all screens so parsed modules are cached across them
+        self.loader = ModuleLoader(config)
+        self.workspace = WorkspaceIndex(config, self.loader)
 
     def on_mount(self) -> None:
         """Show module selection screen on app start."""
-        self.push_screen(ModuleSelectScreen(self.config))
+        self.push_screen(ModuleSelectScreen(self.config, self.workspace))
+
+    def action_toggle_perf_hud(self) -> None:
+        """Show or hide the performance overlay on the current screen."""
+        from widgets.perf_hud import PerfHud
+
+        existing = self.screen.query(PerfHud)
+        if existing:
+            existing.remove()
+        else:
+            self.screen.mount(PerfHud())
 
     def action_help(self) -> None:
         """Show help information."""
@@ -40,9 +56,17 @@ class LocaleTuiApp(App):
             "Key bindings:\n"
             "  Enter - Select/Edit\n"
             "  t - Translate missing\n"
+            "  z - Pause/resume translation\n"
+            "  Escape - Cancel translation\n"
             "  d - Toggle dead filter\n"
             "  / - Search\n"
-            "  Delete - Delete entry\n"
+            "  Space / Shift+Up/Down - Select rows\n"
+            "  a - Select all filtered rows\n"
+            "  Delete - Delete entry or selection\n"
+            "  u - Toggle untranslatable\n"
+            "  c - Copy values between languages\n"
+            "  p - Prune dead entries\n"
             "  s - Save changes\n"
+            "  F2 - Performance overlay\n"
             "  q - Quit/Back"
         )
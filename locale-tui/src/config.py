@@ -1,12 +1,48 @@
 """Configuration loader for locale-tui."""
 
 import os
+import re
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import Optional
 
 import yaml
-from dotenv import load_dotenv
+
+
+# Names that refer to the source language
+SOURCE_ALIASES = {"values", "en", "source", "src"}
+
+DEFAULT_BASE_URL = "https://api.openai.com/v1"
+
+# Several API keys in one variable are separated by whitespace or commas
+KEY_SEPARATOR = re.compile(r"[\s,]+")
+
+
+def split_keys(keys: str) -> list[str]:
+    """Distinct API keys of a key list, in order."""
+    return list(dict.fromkeys(k for k in KEY_SEPARATOR.split(keys) if k))
+
+
+def resolve_language_code(code: str, lang_codes: list[str]) -> Optional[str]:
+    """Resolve zh, zh-TW, zh-rTW or values-zh-rTW to a configured code."""
+    lowered = code.strip().lower().replace("_", "-")
+    if lowered in SOURCE_ALIASES:
+        lowered = "values"
+    else:
+        lowered = lowered.removeprefix("values-")
+        # BCP 47 region (zh-TW) to Android resource qualifier (zh-rTW)
+        lowered = re.sub(r"^([a-z]{2,3})-([a-z]{2})$", r"\1-r\2", lowered)
+        lowered = f"values-{lowered}"
+
+    for known in lang_codes:
+        if known.lower() == lowered:
+            return known
+
+    # Fall back from an unconfigured region (zh-rCN) to the bare language
+    bare = re.sub(r"-r[a-z]{2}$", "", lowered)
+    if bare != lowered:
+        return resolve_language_code(bare, lang_codes)
+    return None
 
 
 @dataclass
@@ -17,6 +53,15 @@ class LanguageConfig:
     is_source: bool = False
 
 
+@dataclass
+class EndpointConfig:
+    """API endpoint and key translation requests can be sent to."""
+    base_url: str
+    api_key: str
+    # Share of requests relative to the other endpoints
+    weight: float = 1.0
+
+
 @dataclass
 class ModuleConfig:
     """Module configuration."""
@@ -31,25 +76,50 @@ class Config:
     # OpenAI configuration
     openai_api_key: str
     openai_base_url: str
+    # One entry per key, translation requests are balanced over them
+    api_endpoints: list[EndpointConfig]
 
     # Project configuration
     project_root: Path
     modules: list[ModuleConfig]
     languages: list[LanguageConfig]
+    state_path: Path
 
     # Translation configuration
     translation_model: str
     translation_prompt: str
     batch_size: int
+    max_concurrency: int
+    # Numeric key aliases and minified JSON in prompts instead of full keys
+    compact_prompt: bool
+    # Request a JSON schema response_format from endpoints that support it
+    structured_output: bool
+    # Similar existing translations added to each prompt, 0 disables them
+    example_count: int
+    example_max_tokens: int
+    # USD per million prompt and completion tokens, 0 when unknown
+    input_price: float
+    output_price: float
+    # No new requests once the estimated cost reaches it, 0 for no limit
+    budget: float
 
     # Display configuration
     column_widths: dict[str, int]
     page_size: int
 
+    # Check configuration, {metric: maximum allowed count}
+    check_thresholds: dict[str, int]
+
     @classmethod
-    def load(cls, config_path: Path) -> "Config":
-        """Load configuration from file."""
-        load_dotenv()
+    def load(cls, config_path: Path, load_env: bool = True) -> "Config":
+        """Load configuration from file.
+
+        load_env reads the .env file, only commands that call the API need it.
+        """
+        if load_env:
+            from dotenv import load_dotenv
+
+            load_dotenv()
 
         with open(config_path, "r", encoding="utf-8") as f:
             data = yaml.safe_load(f)
@@ -80,23 +150,55 @@ class Config:
 
         # Translation configuration
         trans_config = data.get("translation", {})
+        examples_config = trans_config.get("examples") or {}
+        pricing_config = trans_config.get("pricing") or {}
 
         # Display configuration
         display_config = data.get("display", {})
 
+        # Check configuration
+        check_config = data.get("check", {})
+
+        api_key = os.getenv("OPENAI_API_KEY", "")
+        base_url = os.getenv("OPENAI_BASE_URL", DEFAULT_BASE_URL)
+        endpoints = [
+            EndpointConfig(
+                base_url=item.get("base_url", base_url),
+                api_key=key,
+                weight=float(item.get("weight", 1)),
+            )
+            for item in trans_config.get("endpoints") or [{}]
+            for key in split_keys(
+                os.getenv(item["api_key_env"], "")
+                if "api_key_env" in item
+                else api_key
+            )
+        ]
+
         return cls(
-            openai_api_key=os.getenv("OPENAI_API_KEY", ""),
-            openai_base_url=os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1"),
+            openai_api_key=api_key,
+            openai_base_url=base_url,
+            api_endpoints=endpoints,
             project_root=project_root,
             modules=modules,
             languages=languages,
+            state_path=config_dir / data.get("state_file", ".locale-state.json"),
             translation_model=trans_config.get("model", "gpt-4o-mini"),
             translation_prompt=trans_config.get("prompt_template", ""),
             batch_size=trans_config.get("batch_size", 10),
+            max_concurrency=trans_config.get("max_concurrency", 4),
+            compact_prompt=trans_config.get("compact_prompt", True),
+            structured_output=trans_config.get("structured_output", False),
+            example_count=examples_config.get("count", 5),
+            example_max_tokens=examples_config.get("max_tokens", 400),
+            input_price=float(pricing_config.get("input", 0)),
+            output_price=float(pricing_config.get("output", 0)),
+            budget=float(trans_config.get("budget") or 0),
             column_widths=display_config.get(
                 "column_widths", {"key": 30, "translation": 25}
             ),
             page_size=display_config.get("page_size", 50),
+            check_thresholds=check_config.get("thresholds") or {},
         )
 
     def get_language_name(self, code: str) -> str:
@@ -110,6 +212,10 @@ class Config:
         """Get all language codes."""
         return [lang.code for lang in self.languages]
 
+    def resolve_language(self, code: str) -> Optional[str]:
+        """Resolve a user supplied language code to a configured one."""
+        return resolve_language_code(code, self.get_language_codes())
+
     def get_source_language(self) -> Optional[LanguageConfig]:
         """Get source language configuration."""
         for lang in self.languages:
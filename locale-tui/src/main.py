@@ -1,24 +1,70 @@
 #!/usr/bin/env python3
 """Android Locale Manager TUI Application."""
 
+import os
 import sys
-import asyncio
+import time
 from pathlib import Path
+from typing import Optional
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
 import click
 from config import Config
-from app import LocaleTuiApp
-from services.xml_parser import StringsXmlParser
-from services.translator import AITranslator
-from models.entry import TranslationEntry
+from services.perf import recorder, span, Span
 
+# Heavy dependencies (Textual, openai, lxml) are imported inside the commands
+# that need them, keeping scripted calls like `locale-tui set` fast to start.
 
-def load_config() -> Config:
-    """Load configuration from file."""
-    config_path = Path(__file__).parent.parent / "config.yml"
+
+def config_file_path() -> Path:
+    """Path of the configuration file in use."""
+    return Path(
+        os.environ.get(
+            "LOCALE_TUI_CONFIG", Path(__file__).parent.parent / "config.yml"
+        )
+    )
+
+
+def daemon_session():
+    """Session of the daemon running this command, None outside the daemon."""
+    return getattr(sys.modules.get("services.daemon"), "session", None)
+
+
+def get_workspace(config: Config):
+    """Workspace index, shared with other commands inside the daemon."""
+    session = daemon_session()
+    if session is not None and session.config is config:
+        return session.workspace
+
+    from services.workspace import WorkspaceIndex
+
+    return WorkspaceIndex(config)
+
+
+def perf_log_path() -> Optional[Path]:
+    """Timing log path, None when LOCALE_TUI_PERF_LOG is set but empty."""
+    from services.perf_log import LOG_NAME
+
+    value = os.environ.get("LOCALE_TUI_PERF_LOG")
+    if value is None:
+        return config_file_path().resolve().parent / LOG_NAME
+    return Path(value) if value else None
+
+
+def load_config(need_api: bool = False) -> Config:
+    """Load configuration from file.
+
+    need_api loads .env and warns about a missing API key, only commands that
+    call the translation API need it. Inside the daemon the already loaded
+    configuration is returned.
+    """
+    session = daemon_session()
+    if session is not None:
+        return session.config
+
+    config_path = config_file_path()
 
     if not config_path.exists():
         click.echo(f"错误：未找到配置文件 {config_path}", err=True)
@@ -26,52 +72,226 @@ def load_config() -> Config:
         sys.exit(1)
 
     try:
-        config = Config.load(config_path)
+        with span("config"):
+            config = Config.load(config_path, load_env=need_api)
     except Exception as e:
         click.echo(f"错误：加载配置失败 - {e}", err=True)
         sys.exit(1)
 
     # Validate configuration
-    if not config.openai_api_key:
+    if need_api and not config.api_endpoints:
         click.echo("警告：未设置 OPENAI_API_KEY。AI 翻译功能将无法使用。", err=True)
 
     return config
 
 
+def print_timings(spans: list[Span]) -> None:
+    """Print recorded spans as an indented tree."""
+    click.echo("耗时统计：", err=True)
+    for s in sorted(spans, key=lambda s: s.start):
+        details = ", ".join(f"{k} {v}" for k, v in s.attrs.items())
+        label = "  " * s.depth + s.name
+        click.echo(f"  {label:24} {s.duration_ms:9.1f} ms  {details}", err=True)
+
+
+def forward_to_daemon(ctx: click.Context) -> None:
+    """Run the command in a running daemon and exit with its result.
+
+    Returns without doing anything when no daemon accepts the connection,
+    the command is not handled by the daemon or LOCALE_TUI_NO_DAEMON is
+    set. Once the command was sent it is never run again locally: a
+    daemon failing to answer is an error.
+    """
+    from services.daemon import (
+        ROUTED_COMMANDS,
+        RUN_TIMEOUT,
+        DaemonError,
+        request,
+        socket_path,
+    )
+
+    if os.environ.get("LOCALE_TUI_NO_DAEMON"):
+        return
+    command = ctx.invoked_subcommand
+    if command not in ROUTED_COMMANDS:
+        return
+    # Input piped to add is only available to this process
+    if command == "add" and not sys.stdin.isatty():
+        return
+
+    try:
+        response = request(
+            socket_path(config_file_path()),
+            {"command": "run", "argv": sys.argv[1:], "cwd": os.getcwd()},
+            # add waits for the translation API, it has no fixed limit
+            timeout=None if command == "add" else RUN_TIMEOUT,
+        )
+    except DaemonError as e:
+        click.echo(
+            f"错误：守护进程未返回结果（{e}），命令可能已执行，"
+            "请检查后重试或使用 daemon stop 停止守护进程",
+            err=True,
+        )
+        ctx.exit(1)
+    if response is None:
+        return
+    if not response.get("ok"):
+        click.echo(f"错误：守护进程执行失败：{response.get('error')}", err=True)
+        ctx.exit(1)
+
+    click.echo(response["stdout"], nl=False)
+    click.echo(response["stderr"], nl=False, err=True)
+    ctx.exit(response["exit_code"])
+
+
 @click.group(invoke_without_command=True)
+@click.option("--timings", is_flag=True, help="命令结束后输出各阶段耗时")
+@click.option(
+    "--profile",
+    "profile_prefix",
+    type=click.Path(dir_okay=False, path_type=Path),
+    envvar="LOCALE_TUI_PROFILE",
+    default=None,
+    metavar="PREFIX",
+    help="记录 cProfile 统计和 Chrome trace，写入 PREFIX.prof 和 PREFIX.trace.json"
+    "（也可用环境变量 LOCALE_TUI_PROFILE，适用于 TUI）",
+)
 @click.pass_context
-def cli(ctx):
+def cli(ctx, timings: bool, profile_prefix: Path):
     """Android Locale Manager - 管理和翻译 Android 字符串资源
 
     不带参数启动 TUI 界面，使用子命令进行命令行操作。
     """
+    # Profiled commands run in this process so the profile covers them
+    if (
+        ctx.invoked_subcommand is not None
+        and daemon_session() is None
+        and profile_prefix is None
+    ):
+        forward_to_daemon(ctx)
+
+    if profile_prefix is not None and daemon_session() is None:
+        from services.profiler import Profiler
+
+        profiler = Profiler(profile_prefix)
+
+        def finish_profile() -> None:
+            profiler.stop()
+            click.echo(
+                f"性能数据：{profiler.stats_path}，{profiler.trace_path}", err=True
+            )
+
+        ctx.call_on_close(finish_profile)
+        profiler.start()
+
+    if timings:
+        spans: list[Span] = []
+        recorder.add_listener(spans.append)
+
+        def finish() -> None:
+            recorder.remove_listener(spans.append)
+            print_timings(spans)
+
+        ctx.call_on_close(finish)
+
+    # The daemon process installed its log when it started
+    log_path = perf_log_path()
+    if log_path is not None and daemon_session() is None:
+        from services.perf_log import PerfLog
+
+        PerfLog(log_path).install()
+
+    started = time.perf_counter()
+
+    def finish_command() -> None:
+        recorder.record(
+            "command",
+            time.perf_counter() - started,
+            command=ctx.invoked_subcommand or "tui",
+        )
+
+    # Registered last so it runs before the timings and profile output
+    ctx.call_on_close(finish_command)
+
     if ctx.invoked_subcommand is None:
         # No command provided, launch TUI
-        config = load_config()
+        from app import LocaleTuiApp
+
+        config = load_config(need_api=True)
         app = LocaleTuiApp(config)
         app.run()
 
 
+def read_pairs(pairs: tuple[str, ...], stream) -> dict[str, str]:
+    """Collect KEY VALUE arguments and key=value / JSON lines from a stream."""
+    import json
+
+    if len(pairs) % 2:
+        raise click.UsageError("KEY 和 VALUE 必须成对出现")
+    result = dict(zip(pairs[::2], pairs[1::2]))
+    if stream is None:
+        return result
+
+    text = stream.read()
+    if text.lstrip().startswith("{"):
+        try:
+            data = json.loads(text)
+        except ValueError as e:
+            raise click.UsageError(f"无法解析 JSON 输入 - {e}")
+        result.update({str(k): str(v) for k, v in data.items()})
+        return result
+
+    for line_no, line in enumerate(text.splitlines(), 1):
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        separator = "\t" if "\t" in line else "="
+        key, sep, value = line.partition(separator)
+        if not sep or not key.strip():
+            raise click.UsageError(f"第 {line_no} 行格式错误，应为 key=value")
+        result[key.strip()] = value.strip()
+    return result
+
+
 @cli.command()
-@click.argument("key")
-@click.argument("value")
+@click.argument("pairs", nargs=-1, metavar="[KEY VALUE]...")
 @click.option(
     "--module",
     "-m",
     default=None,
     help="模块名称（默认使用配置文件中的第一个模块）",
 )
+@click.option(
+    "--input",
+    "-i",
+    "input_file",
+    type=click.File("r", encoding="utf-8"),
+    default=None,
+    help="从文件读取条目（- 为标准输入），每行 key=value 或一个 JSON 对象",
+)
 @click.option("--skip-translate", is_flag=True, help="跳过自动翻译，仅添加源语言条目")
-def add(key: str, value: str, module: str, skip_translate: bool):
+def add(pairs: tuple[str, ...], module: str, input_file, skip_translate: bool):
     """添加新的语言条目并自动翻译
 
+    所有条目同时翻译到各目标语言，每个语言文件只写入一次。
+    未提供参数且标准输入不是终端时从标准输入读取。
+
     \b
     示例：
         locale-tui add hello_world "Hello, World!"
-        locale-tui add greeting "Welcome" -m app
+        locale-tui add greeting "Welcome" farewell "Goodbye" -m app
         locale-tui add test_key "Test" --skip-translate
+        locale-tui add -i new_strings.txt
+        cat strings.json | locale-tui add
     """
-    config = load_config()
+    from services.xml_parser import StringsXmlParser
+
+    if input_file is None and not pairs and not sys.stdin.isatty():
+        input_file = sys.stdin
+    entries = read_pairs(pairs, input_file)
+    if not entries:
+        raise click.UsageError("未提供任何条目")
+
+    config = load_config(need_api=not skip_translate)
 
     # Select module
     if module:
@@ -100,59 +320,85 @@ def add(key: str, value: str, module: str, skip_translate: bool):
         click.echo(f"错误：资源目录不存在 {res_dir}", err=True)
         sys.exit(1)
 
-    # Add entry to source language file
+    # Add entries to source language file
     source_file = res_dir / "values" / "strings.xml"
-    click.echo(f"添加条目到 {source_file.relative_to(config.project_root)}...")
+    click.echo(
+        f"添加 {len(entries)} 个条目到 {source_file.relative_to(config.project_root)}..."
+    )
 
     try:
-        StringsXmlParser.update_entry(source_file, key, value)
-        click.echo(f"✓ 已添加条目: {key} = {value}")
+        with span("save", files=1, entries=len(entries)):
+            StringsXmlParser.update_entries(source_file, entries)
+        if len(entries) == 1:
+            key, value = next(iter(entries.items()))
+            click.echo(f"✓ 已添加条目: {key} = {value}")
+        else:
+            click.echo(f"✓ 已添加 {len(entries)} 个条目")
     except Exception as e:
         click.echo(f"错误：添加条目失败 - {e}", err=True)
         sys.exit(1)
 
-    # Translate to other languages
-    if not skip_translate:
-        target_languages = [lang.code for lang in config.languages if not lang.is_source]
-
-        if not target_languages:
-            click.echo("未配置目标语言，跳过翻译。")
-            return
-
-        click.echo(f"开始翻译到 {len(target_languages)} 种语言...")
+    if skip_translate:
+        return
 
-        # Create entry for translation
-        entry = TranslationEntry(key=key, translations={"values": value})
+    # Translate to other languages
+    target_languages = [lang.code for lang in config.languages if not lang.is_source]
+    if not target_languages:
+        click.echo("未配置目标语言，跳过翻译。")
+        return
 
-        async def translate_async():
-            translator = AITranslator(config)
+    click.echo(f"开始翻译到 {len(target_languages)} 种语言...")
 
-            for lang_code in target_languages:
-                lang_name = config.get_language_name(lang_code)
-                click.echo(f"翻译到 {lang_name}...", nl=False)
+    import asyncio
+    from models.entry import TranslationEntry
+    from services.placeholders import placeholder_mismatch
+    from services.source_tracker import SourceTracker
+    from services.translator import AITranslator
 
-                try:
-                    translations = await translator.translate_batch(
-                        {key: value}, lang_name
-                    )
+    with span("translate", languages=len(target_languages), entries=len(entries)):
+        translator = AITranslator(config)
+        translations, errors = asyncio.run(
+            translator.translate_languages(entries, target_languages)
+        )
 
-                    if key in translations:
-                        translated_value = translations[key]
-                        entry.set_translation(lang_code, translated_value)
+    tracker = SourceTracker(config.state_path)
+    failed = False
+    for lang_code in target_languages:
+        lang_name = config.get_language_name(lang_code)
+        translated = translations.get(lang_code, {})
 
-                        # Save to file
-                        target_file = res_dir / lang_code / "strings.xml"
-                        StringsXmlParser.update_entry(target_file, key, translated_value)
+        # Keep only translations with the same placeholders as the source
+        accepted = {}
+        for key, value in translated.items():
+            mismatch = placeholder_mismatch(entries[key], value)
+            if mismatch:
+                click.echo(f"  ✗ {lang_name} {key}: 占位符不一致（{mismatch}）", err=True)
+            else:
+                accepted[key] = value
 
-                        click.echo(f" ✓ {translated_value}")
-                    else:
-                        click.echo(" ✗ 翻译失败（未返回结果）", err=True)
+        if accepted:
+            with span("save", files=1, language=lang_code):
+                StringsXmlParser.update_entries(
+                    res_dir / lang_code / "strings.xml", accepted
+                )
+            for key in accepted:
+                entry = TranslationEntry(key=key, translations={"values": entries[key]})
+                tracker.record(selected_module.name, entry, [lang_code])
 
-                except Exception as e:
-                    click.echo(f" ✗ 错误: {e}", err=True)
+        if len(entries) == 1 and accepted:
+            click.echo(f"{lang_name}: ✓ {next(iter(accepted.values()))}")
+        else:
+            click.echo(f"{lang_name}: ✓ {len(accepted)}/{len(entries)}")
+        if lang_code in errors:
+            click.echo(f"  ✗ 错误: {errors[lang_code]}", err=True)
+        if len(accepted) < len(entries):
+            failed = True
 
-        asyncio.run(translate_async())
-        click.echo("完成！")
+    tracker.save()
+    if failed:
+        click.echo("完成，部分条目未能翻译。", err=True)
+        sys.exit(1)
+    click.echo("完成！")
 
 
 @cli.command()
@@ -179,6 +425,8 @@ def set(key: str, value: str, lang: str, module: str):
         locale-tui set greeting "Welcome" -l values
         locale-tui set test_key "テスト" -l values-ja -m app
     """
+    from services.xml_parser import StringsXmlParser
+
     config = load_config()
 
     # Select module
@@ -212,7 +460,8 @@ def set(key: str, value: str, lang: str, module: str):
     click.echo(f"目标文件: {target_file.relative_to(config.project_root)}")
 
     try:
-        StringsXmlParser.update_entry(target_file, key, value)
+        with span("save", files=1):
+            StringsXmlParser.update_entry(target_file, key, value)
         click.echo(f"✓ 设置成功")
     except Exception as e:
         click.echo(f"错误：设置失败 - {e}", err=True)
@@ -234,6 +483,8 @@ def list_keys(module: str):
         locale-tui list-keys
         locale-tui list-keys -m app
     """
+    from services.xml_parser import StringsXmlParser
+
     config = load_config()
 
     # Select module
@@ -257,7 +508,9 @@ def list_keys(module: str):
         sys.exit(1)
 
     # Parse and display
-    entries = StringsXmlParser.parse(source_file)
+    with span("parse", files=1) as parse_span:
+        entries = StringsXmlParser.parse(source_file)
+        parse_span.attrs["entries"] = len(entries)
 
     click.echo(f"模块 '{selected_module.name}' 共有 {len(entries)} 个条目：")
     click.echo()
@@ -270,6 +523,868 @@ def list_keys(module: str):
         click.echo(f"  {key:40} {value}")
 
 
+@cli.command()
+@click.argument("query")
+@click.option(
+    "--module",
+    "-m",
+    multiple=True,
+    help="模块名称（可多次指定，默认搜索所有模块）",
+)
+@click.option(
+    "--lang",
+    "-l",
+    default="values",
+    help="显示指定语言的值（默认为源语言）",
+)
+def search(query: str, module: tuple[str, ...], lang: str):
+    """按查询语法搜索所有模块的条目
+
+    \b
+    查询语法：
+        text               键或任意翻译包含 text
+        key:setting_*      键匹配（支持 * 通配和 /正则/）
+        zh:%1$s            指定语言的翻译包含 %1$s（也可写作 lang:zh:%1$s）
+        missing[:ja]       缺少翻译 / 缺少指定语言的翻译
+        stale[:ja]         源文本变更后未更新的翻译
+        dead               代码中未引用的条目
+        -term / NOT term   取反，OR 表示或，括号分组
+
+    \b
+    示例：
+        locale-tui search "missing:ja key:setting_*"
+        locale-tui search 'zh:%1$s' -m app
+        locale-tui search "dead OR stale" -l values-zh
+    """
+    from services.query import compile_query, QueryError
+
+    config = load_config()
+
+    if module:
+        known = {m.name for m in config.modules}
+        unknown = [name for name in module if name not in known]
+        if unknown:
+            click.echo(f"错误：未找到模块 '{', '.join(unknown)}'", err=True)
+            click.echo(f"可用模块：{', '.join(m.name for m in config.modules)}", err=True)
+            sys.exit(1)
+        selected_modules = [m for m in config.modules if m.name in module]
+    else:
+        selected_modules = config.modules
+
+    # Compile once, apply to every module
+    try:
+        compiled = compile_query(query, config.get_language_codes())
+    except QueryError as e:
+        click.echo(f"错误：查询语法无效 - {e}", err=True)
+        sys.exit(1)
+
+    workspace = get_workspace(config)
+    workspace.refresh(selected_modules)
+    total = 0
+    for selected_module in selected_modules:
+        entries = workspace.entries(selected_module.name)
+        with span("filter", module=selected_module.name, entries=len(entries)):
+            matched = compiled.filter(entries)
+        total += len(matched)
+
+        for entry in matched:
+            value = entry.get_translation(lang) or ""
+            # Truncate long values
+            if len(value) > 60:
+                value = value[:57] + "..."
+            click.echo(f"  {selected_module.name:10} {entry.key:40} {value}")
+
+    click.echo()
+    click.echo(f"共找到 {total} 个匹配条目")
+
+
+@cli.command()
+@click.argument("target")
+@click.option("--text", "-t", "by_text", is_flag=True, help="按源语言文本（完全匹配）查找")
+@click.option(
+    "--lang",
+    "-l",
+    default="values",
+    help="显示指定语言的值（默认为源语言）",
+)
+def where(target: str, by_text: bool, lang: str):
+    """在所有模块中查找键或源文本
+
+    显示定义该键的模块、翻译值和代码中的引用位置。
+    使用 --text 时查找源语言文本相同的条目，例如确认某个字符串是否已在其他模块翻译。
+
+    \b
+    示例：
+        locale-tui where setting_page_title
+        locale-tui where --text "Save" -l values-ja
+    """
+    config = load_config()
+    code = config.resolve_language(lang)
+    if code is None:
+        click.echo(f"错误：未知语言 '{lang}'", err=True)
+        sys.exit(1)
+
+    workspace = get_workspace(config)
+    workspace.refresh()
+
+    if by_text:
+        matches = workspace.find_source(target)
+    else:
+        matches = [
+            (name, workspace.entry(name, target))
+            for name in workspace.modules_for_key(target)
+        ]
+
+    if not matches:
+        click.echo("未找到匹配条目")
+        sys.exit(1)
+
+    for module_name, entry in matches:
+        value = entry.get_translation(code) or ""
+        click.echo(f"  {module_name:10} {entry.key:40} {value}")
+        for path, line in workspace.references(module_name, entry.key):
+            click.echo(f"      {os.path.relpath(path, config.project_root)}:{line}")
+
+
+@cli.command("import")
+@click.argument("file", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option(
+    "--format",
+    "-f",
+    "fmt",
+    type=click.Choice(["csv", "json", "jsonl", "xliff"]),
+    default=None,
+    help="文件格式（默认根据扩展名判断）",
+)
+@click.option(
+    "--module",
+    "-m",
+    default=None,
+    help="导入到指定模块，忽略文件中的模块（默认按文件指定，未指定时使用第一个模块）",
+)
+@click.option(
+    "--lang",
+    "-l",
+    default=None,
+    help="文件中未指定语言时使用的语言代码",
+)
+@click.option("--dry-run", is_flag=True, help="只校验并报告，不写入文件")
+@click.option("--no-validate", is_flag=True, help="跳过占位符校验")
+def import_(
+    file: Path,
+    fmt: str,
+    module: str,
+    lang: str,
+    dry_run: bool,
+    no_validate: bool,
+):
+    """批量导入 CSV/JSON/JSONL/XLIFF 翻译文件
+
+    按模块和语言分组，每个语言文件只写入一次。文件流式读取：记录逐条解析，
+    JSON 对象格式每次解析一个语言的键值表。
+
+    \b
+    支持的格式：
+        CSV    key,lang,value[,module] 或 key[,module],values-zh,values-ja,...
+        JSON   [{"key", "lang", "value"}] 或 {"zh": {key: value}}
+               或 {"app": {"zh": {key: value}}}
+        JSONL  每行一个 {"key", "lang", "value"} 或 {"key", "translations"} 记录
+        XLIFF  1.2，file 的 target-language 为语言，original 为模块
+
+    \b
+    示例：
+        locale-tui import vendor.csv
+        locale-tui import delivery.xlf -m app --dry-run
+        locale-tui import ja.json -l ja
+    """
+    from services.importer import (
+        TranslationImporter,
+        ImportFileError,
+        detect_format,
+        read_rows,
+    )
+
+    config = load_config()
+
+    fmt = fmt or detect_format(file)
+    if fmt is None:
+        click.echo(f"错误：无法识别文件格式 {file.name}，请使用 --format 指定", err=True)
+        sys.exit(1)
+
+    # Select module
+    if module:
+        selected_module = next((m for m in config.modules if m.name == module), None)
+        if not selected_module:
+            click.echo(f"错误：未找到模块 '{module}'", err=True)
+            click.echo(f"可用模块：{', '.join(m.name for m in config.modules)}", err=True)
+            sys.exit(1)
+    else:
+        if not config.modules:
+            click.echo("错误：配置文件中未定义模块", err=True)
+            sys.exit(1)
+        selected_module = config.modules[0]
+
+    start = time.perf_counter()
+    importer = TranslationImporter(config)
+    try:
+        report = importer.run(
+            read_rows(file, fmt),
+            default_module=selected_module,
+            default_lang=lang,
+            validate=not no_validate,
+            dry_run=dry_run,
+            override_module=module is not None,
+        )
+    except ImportFileError as e:
+        click.echo(f"错误：读取导入文件失败 - {e}", err=True)
+        sys.exit(1)
+    elapsed = time.perf_counter() - start
+
+    for (module_name, lang_code), count in sorted(report.per_file.items()):
+        click.echo(f"  {module_name:10} {lang_code:16} {count:6} 条")
+
+    if report.issues:
+        click.echo()
+        click.echo(f"跳过 {report.skipped} 条：", err=True)
+        for issue in report.issues[:50]:
+            click.echo(
+                f"  {issue.module:10} {issue.lang:16} {issue.key:40} {issue.reason}",
+                err=True,
+            )
+        if len(report.issues) > 50:
+            click.echo(f"  ... 另有 {len(report.issues) - 50} 条", err=True)
+
+    click.echo()
+    action = "将更新" if dry_run else "已更新"
+    click.echo(
+        f"读取 {report.rows} 条，{action} {report.applied} 条，"
+        f"未变化 {report.unchanged} 条，跳过 {report.skipped} 条，"
+        f"写入 {report.files_written} 个文件，耗时 {elapsed:.2f}s"
+    )
+
+
+@cli.command()
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="输出文件（默认输出到标准输出）",
+)
+@click.option(
+    "--format",
+    "-f",
+    "fmt",
+    type=click.Choice(["csv", "jsonl", "xliff"]),
+    default=None,
+    help="导出格式（默认根据输出文件扩展名判断，否则为 jsonl）",
+)
+@click.option(
+    "--module",
+    "-m",
+    multiple=True,
+    help="模块名称（可多次指定，默认导出所有模块）",
+)
+@click.option(
+    "--lang",
+    "-l",
+    multiple=True,
+    help="导出的语言代码（可多次指定，默认所有语言，源语言始终包含）",
+)
+@click.option("--missing", is_flag=True, help="只导出缺少所选语言翻译的条目")
+@click.option("--dead", is_flag=True, help="只导出未被引用的条目")
+@click.option("--stale", is_flag=True, help="只导出源文本修改后未更新翻译的条目")
+@click.option("--query", "-q", default=None, help="按搜索语法进一步过滤")
+def export(
+    output: Path,
+    fmt: str,
+    module: tuple[str, ...],
+    lang: tuple[str, ...],
+    missing: bool,
+    dead: bool,
+    stale: bool,
+    query: str,
+):
+    """流式导出模块条目到 CSV/JSONL/XLIFF
+
+    --missing、--dead、--stale 同时指定时导出满足任一条件的条目。
+
+    \b
+    示例：
+        locale-tui export -o all.csv
+        locale-tui export --missing --stale -l ja -o delta.xlf
+        locale-tui export -m app -q "key:setting_*" > setting.jsonl
+    """
+    from services.exporter import TranslationExporter
+    from services.importer import detect_format
+    from services.query import compile_query, QueryError
+
+    config = load_config()
+
+    if module:
+        known = {m.name for m in config.modules}
+        unknown = [name for name in module if name not in known]
+        if unknown:
+            click.echo(f"错误：未找到模块 '{', '.join(unknown)}'", err=True)
+            click.echo(f"可用模块：{', '.join(m.name for m in config.modules)}", err=True)
+            sys.exit(1)
+        selected_modules = [m for m in config.modules if m.name in module]
+    else:
+        selected_modules = config.modules
+
+    # Resolve languages, the source language always comes first
+    lang_codes = ["values"]
+    for code in lang or config.get_language_codes():
+        resolved = config.resolve_language(code)
+        if resolved is None:
+            click.echo(f"错误：未知语言 '{code}'", err=True)
+            sys.exit(1)
+        if resolved not in lang_codes:
+            lang_codes.append(resolved)
+
+    fmt = fmt or (detect_format(output) if output else None) or "jsonl"
+    if fmt == "json":
+        fmt = "jsonl"
+
+    compiled = None
+    if query:
+        try:
+            compiled = compile_query(query, config.get_language_codes())
+        except QueryError as e:
+            click.echo(f"错误：查询语法无效 - {e}", err=True)
+            sys.exit(1)
+
+    def entry_filter(entry) -> bool:
+        if missing or dead or stale:
+            wanted = (
+                (missing and entry.has_missing_translations(lang_codes))
+                or (dead and entry.is_dead)
+                or (stale and any(c in entry.stale_languages for c in lang_codes))
+            )
+            if not wanted:
+                return False
+        return compiled is None or compiled.matches(entry)
+
+    exporter = TranslationExporter(config)
+    writers = {
+        "csv": exporter.write_csv,
+        "jsonl": exporter.write_jsonl,
+        "xliff": exporter.write_xliff,
+    }
+
+    # XLIFF is written as bytes by lxml
+    if fmt == "xliff":
+        stream = open(output, "wb") if output else sys.stdout.buffer
+    elif output:
+        stream = open(output, "w", encoding="utf-8", newline="")
+    else:
+        stream = sys.stdout
+
+    try:
+        report = writers[fmt](stream, selected_modules, lang_codes, entry_filter)
+    finally:
+        if output:
+            stream.close()
+        else:
+            stream.flush()
+
+    click.echo(f"已导出 {report.modules} 个模块共 {report.rows} 个条目", err=True)
+
+
+@cli.command()
+@click.option(
+    "--module",
+    "-m",
+    multiple=True,
+    help="模块名称（可多次指定，默认所有模块）",
+)
+@click.option(
+    "--lang",
+    "-l",
+    multiple=True,
+    help="目标语言代码（可多次指定，默认所有目标语言）",
+)
+@click.option("--stale", is_flag=True, help="同时重新翻译源文本修改后未更新的条目")
+@click.option("--dry-run", is_flag=True, help="只统计待翻译条目，不调用 API")
+@click.option(
+    "--no-reuse", is_flag=True, help="不复用其他条目中源文本相同的已有翻译"
+)
+@click.option(
+    "--report",
+    "-o",
+    "report_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="JSON 报告输出文件（默认输出到标准输出）",
+)
+def translate(
+    module: tuple[str, ...],
+    lang: tuple[str, ...],
+    stale: bool,
+    dry_run: bool,
+    no_reuse: bool,
+    report_path: Path,
+):
+    """无交互翻译所有模块的缺失条目（适用于 CI）
+
+    并行加载所有模块并并发翻译，每个语言文件只以原子方式写入一次。
+    源文本（忽略大小写和空白差异）已在任一模块中有翻译的条目直接复用，
+    不调用 API。
+    结束时输出 JSON 报告（数量、失败、Token 用量及节省量、耗时），
+    有条目翻译失败时退出码为 1。
+
+    \b
+    示例：
+        locale-tui translate
+        locale-tui translate --stale -l ja -o report.json
+        locale-tui translate -m app --dry-run
+    """
+    import json
+    from services.backfill import Backfiller
+
+    config = load_config(need_api=not dry_run)
+
+    if module:
+        known = {m.name for m in config.modules}
+        unknown = [name for name in module if name not in known]
+        if unknown:
+            click.echo(f"错误：未找到模块 '{', '.join(unknown)}'", err=True)
+            click.echo(f"可用模块：{', '.join(m.name for m in config.modules)}", err=True)
+            sys.exit(1)
+        selected_modules = [m for m in config.modules if m.name in module]
+    else:
+        selected_modules = config.modules
+
+    lang_codes = []
+    for code in lang or [l.code for l in config.languages if not l.is_source]:
+        resolved = config.resolve_language(code)
+        if resolved is None or resolved == "values":
+            click.echo(f"错误：未知目标语言 '{code}'", err=True)
+            sys.exit(1)
+        if resolved not in lang_codes:
+            lang_codes.append(resolved)
+
+    report = Backfiller(config).run(
+        selected_modules,
+        lang_codes,
+        include_stale=stale,
+        dry_run=dry_run,
+        reuse=not no_reuse,
+    )
+    data = json.dumps(report.to_dict(), ensure_ascii=False, indent=2)
+    if report_path:
+        report_path.write_text(data + "\n", encoding="utf-8")
+    else:
+        click.echo(data)
+
+    totals = report.totals()
+    action = "待翻译" if dry_run else "已翻译"
+    pending = totals.missing + totals.stale - totals.reused
+    count = pending if dry_run else totals.translated
+    click.echo(
+        f"{action} {count} 条，复用 {totals.reused} 条，失败 {totals.failed} 条，"
+        f"写入 {report.files_written} 个文件，耗时 {report.wall_time:.2f}s",
+        err=True,
+    )
+    if report.usage and report.usage.saved_tokens:
+        click.echo(f"紧凑提示词约节省 {report.usage.saved_tokens:,} Token", err=True)
+    if report.cost:
+        click.echo(f"预估费用 ${report.cost:.4f}", err=True)
+    if totals.failed:
+        sys.exit(1)
+
+
+@cli.command()
+@click.option(
+    "--module",
+    "-m",
+    multiple=True,
+    help="模块名称（可多次指定，默认检查所有模块）",
+)
+@click.option(
+    "--format",
+    "-f",
+    "fmt",
+    type=click.Choice(["table", "json"]),
+    default="table",
+    help="输出格式",
+)
+@click.option(
+    "--threshold",
+    "-t",
+    multiple=True,
+    metavar="METRIC=N",
+    help="覆盖配置文件中的阈值（可多次指定）",
+)
+@click.option("--jobs", "-j", type=int, default=None, help="并行进程数（默认 CPU 核数）")
+def check(module: tuple[str, ...], fmt: str, threshold: tuple[str, ...], jobs: int):
+    """检查所有模块的翻译健康状况
+
+    统计每种语言的缺失、过期、占位符不一致和重复值条目以及每个模块的
+    Dead 条目。任一总数超过阈值（配置文件 check.thresholds 或 -t）时
+    退出码为 1。
+
+    \b
+    指标：missing, dead, stale, placeholder_mismatch, duplicates
+
+    \b
+    示例：
+        locale-tui check
+        locale-tui check -f json -t missing=0 -t placeholder_mismatch=0
+        locale-tui check -m app
+    """
+    import json
+    from services.checker import HealthChecker, METRICS
+
+    config = load_config()
+
+    if module:
+        known = {m.name for m in config.modules}
+        unknown = [name for name in module if name not in known]
+        if unknown:
+            click.echo(f"错误：未找到模块 '{', '.join(unknown)}'", err=True)
+            click.echo(f"可用模块：{', '.join(m.name for m in config.modules)}", err=True)
+            sys.exit(1)
+        selected_modules = [m for m in config.modules if m.name in module]
+    else:
+        selected_modules = config.modules
+
+    thresholds = dict(config.check_thresholds)
+    for item in threshold:
+        metric, sep, limit = item.partition("=")
+        if not sep or not limit.strip().isdigit():
+            raise click.BadParameter(f"'{item}' 应为 METRIC=N", param_hint="--threshold")
+        thresholds[metric.strip()] = int(limit)
+    unknown_metrics = sorted(thresholds.keys() - METRICS)
+    if unknown_metrics:
+        click.echo(f"错误：未知指标 '{', '.join(unknown_metrics)}'", err=True)
+        click.echo(f"可用指标：{', '.join(METRICS)}", err=True)
+        sys.exit(1)
+
+    session = daemon_session()
+    checker = HealthChecker(config, session.workspace if session else None)
+    report = checker.run(selected_modules, workers=jobs)
+    violations = report.violations(thresholds)
+
+    if fmt == "json":
+        click.echo(json.dumps(report.to_dict(thresholds), ensure_ascii=False, indent=2))
+    else:
+        click.echo(
+            f"  {'模块':8} {'语言':14} {'缺失':>4} {'过期':>4} {'占位符':>5} {'重复值':>5}"
+        )
+        for health in report.modules:
+            # Modules without strings only get the summary line
+            languages = health.languages.items() if health.total else []
+            for code, lang in languages:
+                click.echo(
+                    f"  {health.module:10} {code:16} {lang.missing:6} {lang.stale:6} "
+                    f"{lang.placeholder_mismatch:8} {lang.duplicates:8}"
+                )
+            click.echo(f"  {health.module:10} 共 {health.total} 个条目，Dead {health.dead} 个")
+        totals = report.totals()
+        click.echo()
+        click.echo(
+            "合计：" + "，".join(f"{metric} {totals[metric]}" for metric in METRICS)
+            + f"，耗时 {report.wall_time:.2f}s"
+        )
+
+    for metric, value, limit in violations:
+        click.echo(f"✗ {metric} {value} 超过阈值 {limit}", err=True)
+    if violations:
+        sys.exit(1)
+
+
+@cli.command("prune-dead")
+@click.option(
+    "--module",
+    "-m",
+    multiple=True,
+    help="模块名称（可多次指定，默认所有模块）",
+)
+@click.option("--key", "-k", multiple=True, help="只删除指定条目（可多次指定）")
+@click.option("--dry-run", is_flag=True, help="只输出将要产生的 diff，不写入文件")
+@click.option("--yes", "-y", is_flag=True, help="不询问直接删除")
+def prune_dead(module: tuple[str, ...], key: tuple[str, ...], dry_run: bool, yes: bool):
+    """批量删除未被引用的条目
+
+    删除前会重新扫描所有模块的源码并检查其他字符串中的 @string/ 引用，
+    仍被引用的条目会保留。每个语言文件只写入一次。
+
+    \b
+    示例：
+        locale-tui prune-dead --dry-run
+        locale-tui prune-dead -m app --yes
+        locale-tui prune-dead -m app -k old_title -k old_hint
+    """
+    from services.pruner import DeadEntryPruner
+
+    config = load_config()
+
+    if module:
+        known = {m.name for m in config.modules}
+        unknown = [name for name in module if name not in known]
+        if unknown:
+            click.echo(f"错误：未找到模块 '{', '.join(unknown)}'", err=True)
+            click.echo(f"可用模块：{', '.join(m.name for m in config.modules)}", err=True)
+            sys.exit(1)
+        selected_modules = [m for m in config.modules if m.name in module]
+    else:
+        selected_modules = config.modules
+
+    pruner = DeadEntryPruner(config, get_workspace(config))
+    plans = [pruner.plan(m, key or None) for m in selected_modules]
+
+    reasons = {
+        "reserved": "保留键",
+        "not dead": "仍被引用",
+        "referenced": "被其他模块或字符串引用",
+        "not found": "不存在",
+    }
+    for plan in plans:
+        for kept_key, reason in plan.kept.items():
+            click.echo(f"  跳过 {plan.module.name}/{kept_key}（{reasons[reason]}）", err=True)
+
+    plans = [plan for plan in plans if plan.keys]
+    count = sum(len(plan.keys) for plan in plans)
+    if not count:
+        click.echo("没有可删除的条目")
+        return
+
+    if dry_run:
+        for plan in plans:
+            click.echo(pruner.diff(plan), nl=False)
+        click.echo(f"将删除 {count} 个条目（{len(plans)} 个模块）", err=True)
+        return
+
+    for plan in plans:
+        click.echo(f"{plan.module.name}：{', '.join(plan.keys)}")
+    if not yes and not click.confirm(f"删除以上 {count} 个条目？"):
+        click.echo("已取消")
+        sys.exit(1)
+
+    files = sum(pruner.apply(plan) for plan in plans)
+    click.echo(f"✓ 已删除 {count} 个条目，写入 {files} 个文件")
+
+
+@cli.command("perf-report")
+@click.option("--name", "-n", multiple=True, help="只显示指定操作（可多次指定）")
+@click.option("--module", "-m", multiple=True, help="只显示指定模块或命令（可多次指定）")
+@click.option("--buckets", "-b", default=5, show_default=True, help="趋势分段数")
+@click.option(
+    "--format",
+    "-f",
+    "fmt",
+    type=click.Choice(["table", "json"]),
+    default="table",
+    help="输出格式",
+)
+@click.option(
+    "--log",
+    "log_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="耗时日志文件（默认为配置文件目录下的 .locale-perf.jsonl）",
+)
+def perf_report(
+    name: tuple[str, ...], module: tuple[str, ...], buckets: int, fmt: str, log_path: Path
+):
+    """汇总历次运行的耗时日志
+
+    所有命令和 TUI 操作（模块加载、Dead 扫描、翻译、保存）都会把耗时、
+    条目数、文件数和缓存命中情况追加到 .locale-perf.jsonl（超过 1 MB
+    自动轮转，设置 LOCALE_TUI_PERF_LOG= 可关闭）。本命令按操作和模块
+    分组，输出中位数、P95、最近一次耗时以及按时间分段的中位数趋势。
+
+    \b
+    示例：
+        locale-tui perf-report
+        locale-tui perf-report -n load -m app -b 10
+        locale-tui perf-report -f json
+    """
+    import json
+    from datetime import datetime
+    from services.perf_log import PerfLog, summarize
+
+    log_path = log_path or perf_log_path()
+    if log_path is None:
+        click.echo("错误：耗时日志已通过 LOCALE_TUI_PERF_LOG 关闭", err=True)
+        sys.exit(1)
+
+    records = [
+        record
+        for record in PerfLog(log_path).records()
+        if not name or record.get("name") in name
+    ]
+    trends = [
+        trend
+        for trend in summarize(records, buckets)
+        if not module or trend.subject in module
+    ]
+    if not trends:
+        click.echo(f"没有耗时记录（{log_path}）")
+        return
+
+    if fmt == "json":
+        data = [{**vars(trend), "change": trend.change} for trend in trends]
+        click.echo(json.dumps(data, ensure_ascii=False, indent=2))
+        return
+
+    first = datetime.fromtimestamp(min(t.first_time for t in trends))
+    last = datetime.fromtimestamp(max(t.last_time for t in trends))
+    click.echo(
+        f"{log_path}：{len(records)} 条记录，"
+        f"{first:%Y-%m-%d %H:%M} 至 {last:%Y-%m-%d %H:%M}"
+    )
+    click.echo()
+    # Chinese headers are two columns wide per character
+    click.echo(
+        f"  {'操作':10} {'对象':10} {'次数':>3} {'中位':>6} {'P95':>9} {'最近':>6} "
+        f"{'条目':>6} {'缓存':>5}  趋势（中位 ms，旧 → 新）"
+    )
+    for trend in trends:
+        entries = trend.latest.get("entries", "")
+        hit_rate = (
+            f"{trend.cache_hit_rate:.0%}" if trend.cache_hit_rate is not None else "-"
+        )
+        buckets_text = " → ".join(f"{ms:.0f}" for ms in trend.buckets)
+        change = f" ({trend.change:+.0f}%)" if trend.change is not None else ""
+        click.echo(
+            f"  {trend.name:12} {trend.subject or '-':12} {trend.count:5} "
+            f"{trend.median_ms:8.1f} {trend.p95_ms:9.1f} {trend.last_ms:8.1f} "
+            f"{entries:>8} {hit_rate:>7}  {buckets_text}{change}"
+        )
+
+
+@cli.group()
+def daemon():
+    """常驻后台进程，加速命令行调用
+
+    守护进程在内存中保留已解析的模块和引用索引，并轮询文件变化。
+    运行中时 add、set、list-keys、search、where、check 会自动交由它执行
+    （设置 LOCALE_TUI_NO_DAEMON=1 可禁用）。编辑器插件可以直接通过
+    配置文件旁的 .locale-tui.sock 套接字发送 JSON 请求。
+
+    \b
+    示例：
+        locale-tui daemon start
+        locale-tui daemon status
+        locale-tui daemon stop
+    """
+
+
+@daemon.command("run")
+@click.option("--interval", type=float, default=1.0, help="文件变化轮询间隔（秒）")
+def daemon_run(interval: float):
+    """在前台运行守护进程"""
+    from services.daemon import DaemonServer, socket_path
+
+    config_path = config_file_path()
+    load_config(need_api=True)
+
+    def run_command(argv: list[str]) -> int:
+        try:
+            cli.main(args=argv, prog_name="locale-tui", standalone_mode=True)
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                return e.code or 0
+            click.echo(e.code, err=True)
+            return 1
+        return 0
+
+    try:
+        server = DaemonServer(
+            socket_path(config_path),
+            config_path,
+            lambda: load_config(need_api=True),
+            run_command,
+            interval=interval,
+        )
+    except RuntimeError as e:
+        click.echo(f"错误：{e}", err=True)
+        sys.exit(1)
+
+    click.echo(f"守护进程已启动：{server.path}", err=True)
+    try:
+        server.serve()
+    except KeyboardInterrupt:
+        pass
+
+
+@daemon.command("start")
+@click.option("--interval", type=float, default=1.0, help="文件变化轮询间隔（秒）")
+def daemon_start(interval: float):
+    """在后台启动守护进程"""
+    import subprocess
+    from services.daemon import probe, socket_path
+
+    path = socket_path(config_file_path())
+    if probe(path) is not None:
+        click.echo(f"守护进程已在运行：{path}")
+        return
+
+    process = subprocess.Popen(
+        [sys.executable, __file__, "daemon", "run", "--interval", str(interval)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+    # Wait until the modules are indexed and the socket accepts requests
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        status = probe(path)
+        if status is not None:
+            click.echo(f"✓ 守护进程已启动（PID {status['pid']}）：{path}")
+            return
+        if process.poll() is not None:
+            break
+        time.sleep(0.05)
+
+    click.echo("错误：守护进程启动失败，可使用 daemon run 查看错误信息", err=True)
+    sys.exit(1)
+
+
+@daemon.command("stop")
+def daemon_stop():
+    """停止守护进程"""
+    from services.daemon import DaemonError, request, socket_path
+
+    path = socket_path(config_file_path())
+    try:
+        response = request(path, {"command": "stop"}, timeout=5)
+    except DaemonError as e:
+        click.echo(f"错误：守护进程未响应（{e}）", err=True)
+        sys.exit(1)
+    if response is None:
+        click.echo("守护进程未运行")
+        return
+
+    # The socket is removed once the server loop has exited
+    deadline = time.monotonic() + 5
+    while path.exists() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    click.echo("✓ 守护进程已停止")
+
+
+@daemon.command("status")
+def daemon_status():
+    """查看守护进程状态"""
+    from services.daemon import probe, socket_path
+
+    path = socket_path(config_file_path())
+    status = probe(path, timeout=5)
+    if status is None:
+        click.echo("守护进程未运行")
+        sys.exit(1)
+
+    click.echo(f"PID: {status['pid']}")
+    click.echo(f"配置: {status['config']}")
+    click.echo(f"运行时间: {status['uptime']}s，已处理 {status['requests']} 个请求")
+    for name, count in status["modules"].items():
+        click.echo(f"  {name:10} {count} 个条目")
+
+
 def main():
     """Main entry point."""
     cli()
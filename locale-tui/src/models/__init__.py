@@ -1,3 +1,4 @@
 from .entry import TranslationEntry
+from .stats import ModuleStats
 
-__all__ = ["TranslationEntry"]
+__all__ = ["TranslationEntry", "ModuleStats"]
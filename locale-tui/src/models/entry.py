@@ -12,6 +12,15 @@ class TranslationEntry:
     translations: dict[str, Optional[str]] = field(default_factory=dict)
     # translations: {"values": "Hello", "values-zh": "你好", ...}
     is_dead: bool = False  # whether this is an unreferenced dead entry
+    # languages whose translation was made from an older source text
+    stale_languages: set[str] = field(default_factory=set)
+    # False for strings marked translatable="false" in the source file
+    translatable: bool = True
+
+    @property
+    def is_stale(self) -> bool:
+        """Check if any translation is outdated."""
+        return bool(self.stale_languages)
 
     def get_translation(self, lang_code: str) -> Optional[str]:
         """Get translation for a specific language."""
@@ -24,7 +33,7 @@ class TranslationEntry:
     def has_missing_translations(self, lang_codes: list[str]) -> bool:
         """Check if there are missing translations."""
         source = self.translations.get("values")
-        if not source:
+        if not source or not self.translatable:
             return False
         for code in lang_codes:
             if code != "values" and not self.translations.get(code):
@@ -34,6 +43,8 @@ class TranslationEntry:
     def get_missing_languages(self, lang_codes: list[str]) -> list[str]:
         """Get list of languages with missing translations."""
         missing = []
+        if not self.translatable:
+            return missing
         for code in lang_codes:
             if code != "values" and not self.translations.get(code):
                 missing.append(code)
@@ -0,0 +1,42 @@
+"""Module statistics data model."""
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from models.entry import TranslationEntry
+
+
+@dataclass
+class ModuleStats:
+    """Translation health counters of a module."""
+
+    total: int = 0
+    missing_by_lang: dict[str, int] = field(default_factory=dict)
+    dead: int = 0
+    stale: int = 0
+
+    @property
+    def missing(self) -> int:
+        """Total missing translations across languages."""
+        return sum(self.missing_by_lang.values())
+
+    @classmethod
+    def from_entries(
+        cls, entries: list["TranslationEntry"], lang_codes: list[str]
+    ) -> "ModuleStats":
+        """Compute statistics from loaded entries."""
+        stats = cls(
+            total=len(entries),
+            missing_by_lang={code: 0 for code in lang_codes if code != "values"},
+        )
+        for entry in entries:
+            if entry.is_dead:
+                stats.dead += 1
+            if entry.is_stale:
+                stats.stale += 1
+            if not entry.get_translation("values"):
+                continue
+            for code in entry.get_missing_languages(lang_codes):
+                stats.missing_by_lang[code] += 1
+        return stats
@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.widgets import Header, Footer, Static, ListView, ListItem, Label
 from textual.containers import Container, Vertical
+from textual import work
+
+from models.stats import ModuleStats
+from services.workspace import WorkspaceIndex
 
 if TYPE_CHECKING:
-    from config import Config
+    from config import Config, ModuleConfig
 
 
 class ModuleSelectScreen(Screen):
@@ -20,9 +24,11 @@ class ModuleSelectScreen(Screen):
         ("q", "quit", "Quit"),
     ]
 
-    def __init__(self, config: "Config"):
+    def __init__(self, config: "Config", workspace: Optional[WorkspaceIndex] = None):
         super().__init__()
         self.config = config
+        self.workspace = workspace or WorkspaceIndex(config)
+        self.stats: dict[str, ModuleStats] = {}
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -36,6 +42,11 @@ class ModuleSelectScreen(Screen):
                     *[
                         ListItem(
                             Label(f"[bold]{m.name}[/bold] - {m.res_path}"),
+                            Label(
+                                "[dim]Loading...[/dim]",
+                                id=f"stats-{m.name}",
+                                classes="module-stats",
+                            ),
                             id=f"module-{m.name}",
                         )
                         for m in self.config.modules
@@ -48,6 +59,55 @@ class ModuleSelectScreen(Screen):
         )
         yield Footer()
 
+    def on_mount(self) -> None:
+        """Start loading module statistics in the background."""
+        for module in self.config.modules:
+            self.load_stats(module)
+
+    def on_screen_resume(self) -> None:
+        """Refresh statistics after returning from a module."""
+        if not self.stats:
+            return
+        for module in self.config.modules:
+            self.load_stats(module)
+
+    @work(thread=True, group="module-stats")
+    def load_stats(self, module: "ModuleConfig") -> None:
+        """Index a module in a worker thread and report its statistics."""
+        try:
+            self.workspace.refresh([module])
+            entries = self.workspace.entries(module.name)
+        except Exception as e:
+            self.app.call_from_thread(self.show_error, module, str(e))
+            return
+        stats = ModuleStats.from_entries(entries, self.config.get_language_codes())
+        self.app.call_from_thread(self.show_stats, module, stats)
+
+    def show_stats(self, module: "ModuleConfig", stats: ModuleStats) -> None:
+        """Display statistics next to a module."""
+        self.stats[module.name] = stats
+
+        missing = ", ".join(
+            f"{code.removeprefix('values-')} {count}"
+            for code, count in stats.missing_by_lang.items()
+            if count
+        )
+        parts = [f"Total: {stats.total}"]
+        if missing:
+            parts.append(f"[red]Missing: {missing}[/red]")
+        else:
+            parts.append("[green]Missing: 0[/green]")
+        parts.append(f"Dead: {stats.dead}")
+        parts.append(f"Stale: {stats.stale}")
+
+        self.query_one(f"#stats-{module.name}", Label).update(" | ".join(parts))
+
+    def show_error(self, module: "ModuleConfig", message: str) -> None:
+        """Display a load failure next to a module."""
+        self.query_one(f"#stats-{module.name}", Label).update(
+            f"[red]Failed to load: {message}[/red]"
+        )
+
     def on_list_view_selected(self, event: ListView.Selected) -> None:
         """Handle module selection."""
         from screens.translation_table import TranslationTableScreen
@@ -63,7 +123,9 @@ class ModuleSelectScreen(Screen):
             )
 
             if module:
-                self.app.push_screen(TranslationTableScreen(self.config, module))
+                self.app.push_screen(
+                    TranslationTableScreen(self.config, module, self.workspace)
+                )
 
     def action_quit(self) -> None:
         self.app.exit()
@@ -2,22 +2,33 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+import os
+from typing import Iterable, Optional, TYPE_CHECKING
 
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.widgets import Header, Footer, DataTable, Input, Static, ProgressBar
 from textual.containers import Container, Horizontal, Vertical
 from textual.binding import Binding
+from textual.timer import Timer
 from textual import work
 
 from models.entry import TranslationEntry
 from services.xml_parser import StringsXmlParser
-from services.translator import AITranslator
-from services.dead_entry_finder import DeadEntryFinder
+from services.workspace import WorkspaceIndex
+from services.pruner import DeadEntryPruner, PrunePlan
+from services.reuse import TranslationMemory
+from services.examples import build_example_index
+from services.placeholders import placeholder_mismatch
+from services.scheduler import TranslationScheduler
+from services.search_index import SearchIndex
+from services.query import Query, QueryCompiler, QueryError
+from services.perf import span
 
 if TYPE_CHECKING:
     from config import Config, ModuleConfig
+    from services.translator import AITranslator
 
 
 class TranslationTableScreen(Screen):
@@ -26,25 +37,66 @@ class TranslationTableScreen(Screen):
     BINDINGS = [
         Binding("escape", "go_back", "Back"),
         Binding("t", "translate_missing", "Translate"),
+        Binding("z", "pause_translation", "Pause", show=False),
         Binding("d", "toggle_dead_filter", "Dead Filter"),
         Binding("m", "toggle_missing_filter", "Missing Filter"),
         Binding("slash", "focus_search", "Search"),
         Binding("delete", "delete_entry", "Delete"),
+        Binding("space", "toggle_select", "Select"),
+        Binding("shift+down", "extend_selection(1)", "Select Down", show=False),
+        Binding("shift+up", "extend_selection(-1)", "Select Up", show=False),
+        Binding("a", "select_filtered", "Select All"),
+        Binding("u", "toggle_translatable", "Untranslatable"),
+        Binding("c", "copy_language", "Copy Lang"),
+        Binding("p", "prune_dead", "Prune Dead"),
         Binding("s", "save_all", "Save"),
         Binding("enter", "edit_entry", "Edit"),
         Binding("r", "refresh", "Refresh"),
     ]
 
-    def __init__(self, config: "Config", module: "ModuleConfig"):
+    # Seconds to wait after the last keystroke before searching
+    SEARCH_DEBOUNCE = 0.15
+
+    def __init__(
+        self,
+        config: "Config",
+        module: "ModuleConfig",
+        workspace: Optional[WorkspaceIndex] = None,
+    ):
         super().__init__()
         self.config = config
         self.module = module
+        self.workspace = workspace or WorkspaceIndex(config)
+        self.loader = self.workspace.loader
         self.entries: list[TranslationEntry] = []
+        self.entries_by_key: dict[str, TranslationEntry] = {}
         self.filtered_entries: list[TranslationEntry] = []
         self.show_dead_only = False
         self.show_missing_only = False
         self.search_query = ""
         self.has_unsaved_changes = False
+        # {key: lang_codes} of unsaved translations, recorded in the
+        # tracker on save so other writes don't persist discarded edits
+        self._pending_records: dict[str, set[str]] = {}
+        # Status counters, adjusted by deltas after the initial load
+        self.missing_count = 0
+        self.dead_count = 0
+        self.stale_count = 0
+        self.search_index = SearchIndex()
+        self.compiled_query: Optional[Query] = None
+        self.query_error: Optional[str] = None
+        self._search_timer: Optional[Timer] = None
+        # {needle: matched keys} of recent searches, reused to narrow results
+        self._search_cache: dict[str, set[str]] = {}
+        # Keys of selected rows, batch actions apply to all of them
+        self.selected: set[str] = set()
+        # (action, keys) of a batch action waiting for a second key press
+        self._pending_confirm: Optional[tuple[str, list[str]]] = None
+        # Batches of the running translation, reordered when the view changes
+        self._scheduler: Optional[TranslationScheduler] = None
+        self._translator: Optional[AITranslator] = None
+        self._translating = False
+        self._pruning = False
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -61,6 +113,7 @@ class TranslationTableScreen(Screen):
                 Input(placeholder="Search entries... (press / to focus)", id="search"),
                 # Progress bar (hidden)
                 ProgressBar(total=100, show_eta=False, id="progress"),
+                Static("", id="run-status"),
                 # Translation table
                 DataTable(id="table", cursor_type="row", zebra_stripes=True),
                 id="content",
@@ -73,6 +126,7 @@ class TranslationTableScreen(Screen):
         """Initialize data when screen loads."""
         # Hide progress bar
         self.query_one("#progress", ProgressBar).display = False
+        self.query_one("#run-status", Static).display = False
 
         # Setup table columns
         table = self.query_one("#table", DataTable)
@@ -88,104 +142,218 @@ class TranslationTableScreen(Screen):
         # Focus table by default
         table.focus()
 
-    def load_entries(self) -> None:
+    def load_entries(self, use_cache: bool = True) -> None:
         """Load all translation entries."""
-        self.entries = []
-        all_keys: set[str] = set()
-        translations_by_lang: dict[str, dict[str, str]] = {}
+        self.entries = self.loader.load(self.module, use_cache=use_cache)
+        self.workspace.refresh([self.module])
+        self._pending_records = {}
+
+        self.entries_by_key = {e.key: e for e in self.entries}
+        self.search_index = SearchIndex(self.entries)
+        self._search_cache = {}
+        self.compile_search()
+        self.missing_count = sum(1 for e in self.entries if self._is_missing(e))
+        self.dead_count = sum(1 for e in self.entries if e.is_dead)
+        self.stale_count = sum(1 for e in self.entries if e.is_stale)
 
-        # Collect translations from all languages
-        for lang in self.config.languages:
-            path = (
-                self.config.project_root
-                / self.module.res_path
-                / lang.code
-                / "strings.xml"
-            )
-            translations = StringsXmlParser.parse(path)
-            translations_by_lang[lang.code] = translations
-            all_keys.update(translations.keys())
-
-        # Create entries
-        for key in sorted(all_keys):
-            entry = TranslationEntry(key=key)
-            for lang_code, translations in translations_by_lang.items():
-                entry.translations[lang_code] = translations.get(key)
-            self.entries.append(entry)
-
-        # Mark dead entries
         if self.module.source_patterns:
-            finder = DeadEntryFinder(self.config.project_root)
-            dead_count = finder.mark_dead_entries(
-                self.entries, self.module.source_patterns
-            )
-            self.notify(f"Found {dead_count} dead entries")
+            self.notify(f"Found {self.dead_count} dead entries")
 
         self.apply_filters()
         self.update_status()
 
     def apply_filters(self) -> None:
         """Apply search and filter conditions."""
-        self.filtered_entries = self.entries.copy()
+        with span("filter", entries=len(self.entries)) as filter_span:
+            self.filtered_entries = self.entries.copy()
 
-        # Apply dead filter
-        if self.show_dead_only:
-            self.filtered_entries = [e for e in self.filtered_entries if e.is_dead]
+            # Apply dead filter
+            if self.show_dead_only:
+                self.filtered_entries = [e for e in self.filtered_entries if e.is_dead]
 
-        # Apply missing filter
-        if self.show_missing_only:
-            lang_codes = self.config.get_language_codes()
-            self.filtered_entries = [
-                e for e in self.filtered_entries
-                if e.has_missing_translations(lang_codes)
-            ]
+            # Apply missing filter
+            if self.show_missing_only:
+                lang_codes = self.config.get_language_codes()
+                self.filtered_entries = [
+                    e for e in self.filtered_entries
+                    if e.has_missing_translations(lang_codes)
+                ]
 
-        # Apply search
-        if self.search_query:
-            query = self.search_query.lower()
-            self.filtered_entries = [
-                e
-                for e in self.filtered_entries
-                if query in e.key.lower()
-                or any(query in (v or "").lower() for v in e.translations.values())
-            ]
+            # Apply search
+            if self.compiled_query is not None:
+                self.filtered_entries = self.compiled_query.filter(
+                    self.filtered_entries, self._search
+                )
+
+            filter_span.attrs["rows"] = len(self.filtered_entries)
 
         self.refresh_table()
+        self._prioritize()
+
+    def compile_search(self) -> None:
+        """Compile the search box content into a query."""
+        self.compiled_query = None
+        self.query_error = None
+        if not self.search_query.strip():
+            return
+
+        compiler = QueryCompiler(self.config.get_language_codes(), self.search_index)
+        try:
+            self.compiled_query = compiler.compile(self.search_query)
+        except QueryError as e:
+            # Fall back to plain text search while the query is incomplete
+            self.query_error = str(e)
+            escaped = self.search_query.replace("\\", "\\\\").replace('"', '\\"')
+            self.compiled_query = compiler.compile(f'"{escaped}"')
+
+    def _search(self, needle: str) -> set[str]:
+        """Search the index, narrowing earlier results when possible."""
+        cached = self._search_cache.get(needle)
+        if cached is not None:
+            return cached
+
+        # A longer needle can only match a subset of a shorter one's matches
+        candidates = None
+        for previous, matched in self._search_cache.items():
+            if previous in needle and (
+                candidates is None or len(matched) < len(candidates)
+            ):
+                candidates = matched
+
+        if len(self._search_cache) >= 32:
+            self._search_cache.clear()
+        matched = self.search_index.search(needle, candidates)
+        self._search_cache[needle] = matched
+        return matched
+
+    def _reindex(self, entries: list[TranslationEntry]) -> None:
+        """Update search index after entries changed."""
+        for entry in entries:
+            self.search_index.update(entry)
+        self._search_cache = {}
+        self.workspace.update_module(self.module)
+
+    def _is_missing(self, entry: TranslationEntry) -> bool:
+        """Check whether an entry counts as missing."""
+        return entry.has_missing_translations(self.config.get_language_codes())
+
+    def _matches_filters(self, entry: TranslationEntry) -> bool:
+        """Check a single entry against the active filters."""
+        if self.show_dead_only and not entry.is_dead:
+            return False
+        if self.show_missing_only and not self._is_missing(entry):
+            return False
+        if self.compiled_query is not None:
+            return self.compiled_query.matches(entry)
+        return True
+
+    def _format_cell(self, entry: TranslationEntry, lang_code: str) -> str:
+        """Format a single translation cell."""
+        value = entry.translations.get(lang_code, "")
+        # Highlight missing translations
+        if not value and lang_code != "values":
+            if not entry.translatable:
+                return "[dim]-[/dim]"
+            return "[red]MISSING[/red]"
+        if entry.is_dead:
+            return f"[dim]{value or ''}[/dim]"
+        # Truncate long values for display
+        display_value = value or ""
+        if len(display_value) > 30:
+            display_value = display_value[:27] + "..."
+        return display_value
+
+    def _format_key(self, entry: TranslationEntry) -> str:
+        """Format the key cell, marking selected rows."""
+        if entry.key in self.selected:
+            return f"[bold]● {entry.key}[/bold]"
+        return entry.key
 
     def refresh_table(self) -> None:
         """Refresh table display."""
+        with span("render", rows=len(self.filtered_entries)):
+            table = self.query_one("#table", DataTable)
+            table.clear()
+
+            for entry in self.filtered_entries:
+                row_data = [self._format_key(entry)]
+                for lang in self.config.languages:
+                    row_data.append(self._format_cell(entry, lang.code))
+
+                table.add_row(*row_data, key=entry.key)
+
+    def _counter_state(self, entry: TranslationEntry) -> tuple[bool, bool]:
+        """Snapshot (missing, stale) of an entry before changing it."""
+        return self._is_missing(entry), entry.is_stale
+
+    def update_rows(
+        self,
+        entries: list[TranslationEntry],
+        before: dict[str, tuple[bool, bool]],
+    ) -> None:
+        """Update changed rows in place instead of rebuilding the table.
+
+        Rows that no longer match the active filters are removed. before
+        holds the counter state of each entry before the change so the status
+        counters can be adjusted by the difference.
+        """
+        with span("render", rows=len(entries), incremental=True):
+            table = self.query_one("#table", DataTable)
+            removed: set[str] = set()
+
+            for entry in entries:
+                was_missing, was_stale = before[entry.key]
+                self.missing_count += self._is_missing(entry) - was_missing
+                self.stale_count += entry.is_stale - was_stale
+
+                if entry.key not in table.rows:
+                    continue
+                if not self._matches_filters(entry):
+                    table.remove_row(entry.key)
+                    removed.add(entry.key)
+                    continue
+                for lang in self.config.languages:
+                    table.update_cell(
+                        entry.key, lang.code, self._format_cell(entry, lang.code)
+                    )
+
+            if removed:
+                self.filtered_entries = [
+                    e for e in self.filtered_entries if e.key not in removed
+                ]
+
+    def remove_rows(self, keys: set[str]) -> None:
+        """Drop entries from memory and remove only their rows."""
         table = self.query_one("#table", DataTable)
-        table.clear()
 
-        for entry in self.filtered_entries:
-            row_data = [entry.key]
-            for lang in self.config.languages:
-                value = entry.translations.get(lang.code, "")
-                # Highlight missing translations
-                if not value and lang.code != "values":
-                    row_data.append("[red]MISSING[/red]")
-                elif entry.is_dead:
-                    row_data.append(f"[dim]{value or ''}[/dim]")
-                else:
-                    # Truncate long values for display
-                    display_value = value or ""
-                    if len(display_value) > 30:
-                        display_value = display_value[:27] + "..."
-                    row_data.append(display_value)
+        for key in keys:
+            entry = self.entries_by_key.pop(key, None)
+            if entry is None:
+                continue
+            self.missing_count -= self._is_missing(entry)
+            self.dead_count -= entry.is_dead
+            self.stale_count -= entry.is_stale
+            self.search_index.remove(key)
+            if key in table.rows:
+                table.remove_row(key)
+
+        self.selected -= keys
 
-            table.add_row(*row_data, key=entry.key)
+        # In place, the module loader caches this list
+        self.entries[:] = [e for e in self.entries if e.key not in keys]
+        self.filtered_entries = [e for e in self.filtered_entries if e.key not in keys]
+        self._search_cache = {}
+        self.workspace.update_module(self.module)
 
     def update_status(self) -> None:
         """Update status bar."""
         total = len(self.entries)
-        missing = sum(
-            1
-            for e in self.entries
-            if e.has_missing_translations(self.config.get_language_codes())
+        status = (
+            f"Total: {total} | Missing: {self.missing_count} | "
+            f"Dead: {self.dead_count} | Stale: {self.stale_count}"
         )
-        dead = sum(1 for e in self.entries if e.is_dead)
-
-        status = f"Total: {total} | Missing: {missing} | Dead: {dead}"
+        if self.selected:
+            status += f" | Selected: {len(self.selected)}"
         if self.has_unsaved_changes:
             status += " | [yellow]Unsaved[/yellow]"
 
@@ -197,7 +365,9 @@ class TranslationTableScreen(Screen):
             filter_text.append("[cyan]Dead Only[/cyan]")
         if self.show_missing_only:
             filter_text.append("[cyan]Missing Only[/cyan]")
-        if self.search_query:
+        if self.query_error:
+            filter_text.append(f"[red]Query: {self.query_error}[/red]")
+        elif self.search_query:
             filter_text.append(f"[cyan]Search: {self.search_query}[/cyan]")
 
         self.query_one("#filter-status", Static).update(" | ".join(filter_text))
@@ -206,16 +376,36 @@ class TranslationTableScreen(Screen):
         """Search box content changed."""
         if event.input.id == "search":
             self.search_query = event.value
-            self.apply_filters()
-            self.update_status()
+            if self._search_timer is not None:
+                self._search_timer.stop()
+            self._search_timer = self.set_timer(
+                self.SEARCH_DEBOUNCE, self._run_search
+            )
+
+    def _run_search(self) -> None:
+        """Run the debounced search."""
+        self._search_timer = None
+        self.compile_search()
+        self.apply_filters()
+        self.update_status()
 
     def action_go_back(self) -> None:
         """Go back to previous screen."""
-        if self.has_unsaved_changes:
+        if self._scheduler is not None and not self._scheduler.cancelled:
+            # New requests stop, the ones in flight still finish and are kept
+            self._scheduler.cancel()
+            self._update_run_status()
+            self.notify("Cancelling translation...")
+        elif self.selected:
+            self.action_clear_selection()
+        elif self.has_unsaved_changes:
             self.notify(
                 "You have unsaved changes! Press 's' to save or 'escape' again to discard."
             )
             self.has_unsaved_changes = False  # Allow second escape to exit
+            # Cached entries hold the unsaved edits, reload them next time
+            self.loader.invalidate(self.module)
+            self._pending_records = {}
         else:
             self.app.pop_screen()
 
@@ -223,6 +413,80 @@ class TranslationTableScreen(Screen):
         """Focus search box."""
         self.query_one("#search", Input).focus()
 
+    def _cursor_key(self) -> Optional[str]:
+        """Key of the row under the cursor."""
+        table = self.query_one("#table", DataTable)
+        if not table.row_count:
+            return None
+        row_key, _ = table.coordinate_to_cell_key(table.cursor_coordinate)
+        return row_key.value
+
+    def _target_entries(self) -> list[TranslationEntry]:
+        """Selected entries, or the entry under the cursor without a selection."""
+        if self.selected:
+            return [e for e in self.entries if e.key in self.selected]
+        entry = self.entries_by_key.get(self._cursor_key())
+        return [entry] if entry else []
+
+    def _update_selection(self, keys: Iterable[str]) -> None:
+        """Redraw the key cells of rows whose selection changed."""
+        table = self.query_one("#table", DataTable)
+        for key in keys:
+            entry = self.entries_by_key.get(key)
+            if entry is not None and key in table.rows:
+                table.update_cell(key, "key", self._format_key(entry))
+        self.update_status()
+
+    def _confirmed(self, action: str, keys: list[str], message: str) -> bool:
+        """Ask for a second key press before a destructive batch action."""
+        if self._pending_confirm == (action, keys):
+            self._pending_confirm = None
+            return True
+        self._pending_confirm = (action, keys)
+        self.notify(message)
+        return False
+
+    def action_toggle_select(self) -> None:
+        """Toggle selection of the row under the cursor and move down."""
+        key = self._cursor_key()
+        if key is None:
+            return
+        self.selected ^= {key}
+        self._update_selection([key])
+
+        table = self.query_one("#table", DataTable)
+        table.move_cursor(row=min(table.cursor_row + 1, table.row_count - 1))
+
+    def action_extend_selection(self, step: int) -> None:
+        """Move the cursor and select every row it passes."""
+        table = self.query_one("#table", DataTable)
+        key = self._cursor_key()
+        if key is None:
+            return
+        row = min(max(table.cursor_row + step, 0), table.row_count - 1)
+        table.move_cursor(row=row)
+
+        changed = {key, self._cursor_key()} - self.selected
+        self.selected |= changed
+        self._update_selection(changed)
+
+    def action_select_filtered(self) -> None:
+        """Select all rows matching the current filters, or unselect them."""
+        keys = {e.key for e in self.filtered_entries}
+        if keys and keys <= self.selected:
+            self.selected -= keys
+            self._update_selection(keys)
+            return
+        changed = keys - self.selected
+        self.selected |= changed
+        self._update_selection(changed)
+
+    def action_clear_selection(self) -> None:
+        """Unselect all rows."""
+        changed = self.selected
+        self.selected = set()
+        self._update_selection(changed)
+
     def action_toggle_dead_filter(self) -> None:
         """Toggle dead entry filter."""
         self.show_dead_only = not self.show_dead_only
@@ -246,120 +510,554 @@ class TranslationTableScreen(Screen):
             return
 
         row_key, _ = table.coordinate_to_cell_key(table.cursor_coordinate)
-        entry = next((e for e in self.entries if e.key == row_key.value), None)
+        entry = self.entries_by_key.get(row_key.value)
 
         if entry:
             self.app.push_screen(
-                EditModal(entry, self.config.languages), callback=self.on_edit_complete
+                EditModal(entry, self.config.languages, self.edit_context(entry)),
+                callback=self.on_edit_complete,
             )
 
+    def edit_context(self, entry: TranslationEntry) -> list[str]:
+        """Cross-module hints about an entry for the edit modal."""
+        lines = []
+
+        others = [
+            name
+            for name in self.workspace.modules_for_key(entry.key)
+            if name != self.module.name
+        ]
+        if others:
+            lines.append(f"Also defined in: {', '.join(others)}")
+
+        source = entry.get_translation("values")
+        if source:
+            same = [
+                f"{name}:{other.key}"
+                for name, other in self.workspace.find_source(source)
+                if other is not entry
+            ]
+            if same:
+                more = f" (+{len(same) - 5})" if len(same) > 5 else ""
+                lines.append(f"Same source text: {', '.join(same[:5])}{more}")
+
+        sites = self.workspace.references(self.module.name, entry.key)
+        if sites:
+            shown = [
+                f"{os.path.relpath(path, self.config.project_root)}:{line}"
+                for path, line in sites[:3]
+            ]
+            more = f" (+{len(sites) - 3})" if len(sites) > 3 else ""
+            lines.append(f"Used in: {', '.join(shown)}{more}")
+        elif entry.is_dead:
+            lines.append("Not referenced in code")
+
+        return lines
+
     def on_edit_complete(self, result: dict | None) -> None:
         """Edit complete callback."""
         if result:
             entry_key = result["key"]
-            entry = next((e for e in self.entries if e.key == entry_key), None)
+            entry = self.entries_by_key.get(entry_key)
             if entry:
+                before = {entry.key: self._counter_state(entry)}
+                changed = [
+                    lang_code
+                    for lang_code, value in result["translations"].items()
+                    if value != (entry.get_translation(lang_code) or "")
+                ]
                 for lang_code, value in result["translations"].items():
                     entry.set_translation(lang_code, value)
+
+                if "values" in changed:
+                    # Translations kept from before the edit become stale
+                    self._pending_records.pop(entry.key, None)
+                    self.loader.tracker.refresh_entry(
+                        self.module.name, entry, record_new=False
+                    )
+                self._record(
+                    entry, [code for code in changed if entry.get_translation(code)]
+                )
+
+                self._reindex([entry])
                 self.has_unsaved_changes = True
-                self.refresh_table()
+                self.update_rows([entry], before)
                 self.update_status()
                 self.notify(f"Updated: {entry_key}")
 
+    def _record(self, entry: TranslationEntry, lang_codes: list[str]) -> None:
+        """Mark translations current, the tracker records them on save."""
+        codes = self._pending_records.setdefault(entry.key, set())
+        for code in lang_codes:
+            if code != "values":
+                codes.add(code)
+                entry.stale_languages.discard(code)
+
     def action_delete_entry(self) -> None:
-        """Delete current selected entry."""
-        table = self.query_one("#table", DataTable)
-        if table.cursor_row is None:
+        """Delete the selected entries, or the entry under the cursor."""
+        keys = [e.key for e in self._target_entries()]
+        if not keys:
+            return
+        if len(keys) > 1 and not self._confirmed(
+            "delete", keys, f"Press 'delete' again to delete {len(keys)} entries."
+        ):
             return
 
-        row_key, _ = table.coordinate_to_cell_key(table.cursor_coordinate)
-        entry_key = row_key.value
-
-        # Delete from all language files
-        for lang in self.config.languages:
-            path = (
-                self.config.project_root
-                / self.module.res_path
-                / lang.code
-                / "strings.xml"
-            )
-            StringsXmlParser.delete_entry(path, entry_key)
+        # Delete from all language files, one write per file
+        with span("save", module=self.module.name, keys=len(keys)):
+            for lang in self.config.languages:
+                StringsXmlParser.delete_entries(
+                    self.loader.strings_path(self.module, lang.code), keys
+                )
 
         # Delete from memory
-        self.entries = [e for e in self.entries if e.key != entry_key]
-        self.apply_filters()
+        self.remove_rows(set(keys))
+        self.loader.tracker.forget(self.module.name, keys)
+        self.loader.tracker.save()
+        self.loader.touch(self.module, self.entries)
         self.update_status()
-        self.notify(f"Deleted: {entry_key}")
+        if len(keys) == 1:
+            self.notify(f"Deleted: {keys[0]}")
+        else:
+            self.notify(f"Deleted {len(keys)} entries")
 
-    @work(exclusive=True)
-    async def action_translate_missing(self) -> None:
-        """Translate all missing entries."""
-        translator = AITranslator(self.config)
-        progress = self.query_one("#progress", ProgressBar)
-        progress.display = True
+    def action_toggle_translatable(self) -> None:
+        """Mark target entries untranslatable, or translatable again.
 
-        try:
-            # Collect entries needing translation
-            entries_to_translate = [
-                e
-                for e in self.entries
-                if e.has_missing_translations(self.config.get_language_codes())
-            ]
+        Untranslatable entries keep only their source value, translations
+        are removed from the other language files.
+        """
+        entries = self._target_entries()
+        if not entries:
+            return
+        keys = [e.key for e in entries]
+        translatable = all(not e.translatable for e in entries)
 
-            if not entries_to_translate:
-                self.notify("No missing translations found!")
-                progress.display = False
+        if not translatable:
+            dropped = sum(
+                1
+                for e in entries
+                for code, value in e.translations.items()
+                if code != "values" and value
+            )
+            if dropped and not self._confirmed(
+                "untranslatable",
+                keys,
+                f"Press 'u' again to mark {len(keys)} entries untranslatable "
+                f"and remove {dropped} translations.",
+            ):
                 return
 
-            self.notify(f"Translating {len(entries_to_translate)} entries...")
+        with span("save", module=self.module.name, keys=len(keys)) as save_span:
+            written = bool(
+                StringsXmlParser.set_translatable(
+                    self.loader.strings_path(self.module, "values"), keys, translatable
+                )
+            )
+            if not translatable:
+                for lang in self.config.languages:
+                    if lang.code != "values" and StringsXmlParser.delete_entries(
+                        self.loader.strings_path(self.module, lang.code), keys
+                    ):
+                        written += 1
+            save_span.attrs["files"] = written
+
+        before = {e.key: self._counter_state(e) for e in entries}
+        for entry in entries:
+            entry.translatable = translatable
+            if not translatable:
+                for code in entry.translations:
+                    if code != "values":
+                        entry.translations[code] = None
+                entry.stale_languages.clear()
+        if not translatable:
+            self.loader.tracker.forget(self.module.name, keys)
+            self.loader.tracker.save()
+        self.loader.touch(self.module, self.entries)
+
+        self._reindex(entries)
+        self.update_rows(entries, before)
+        self.update_status()
+        state = "translatable" if translatable else "untranslatable"
+        self.notify(f"Marked {len(entries)} entries {state}")
+
+    def action_copy_language(self) -> None:
+        """Copy values of the target entries from one language to another."""
+        from widgets.copy_modal import CopyLanguageModal
+
+        entries = self._target_entries()
+        if not entries:
+            return
+        self.app.push_screen(
+            CopyLanguageModal(self.config.languages, len(entries)),
+            callback=lambda result: self.on_copy_complete(entries, result),
+        )
+
+    def on_copy_complete(
+        self, entries: list[TranslationEntry], result: dict | None
+    ) -> None:
+        """Copy values once languages were chosen."""
+        if not result:
+            return
+        source, target = result["from"], result["to"]
+
+        before = {e.key: self._counter_state(e) for e in entries}
+        changed = []
+        for entry in entries:
+            value = entry.get_translation(source)
+            current = entry.get_translation(target)
+            if not value or not entry.translatable or current == value:
+                continue
+            if current and not result["overwrite"]:
+                continue
+            entry.set_translation(target, value)
+            self._record(entry, [target])
+            changed.append(entry)
+
+        if not changed:
+            self.notify("No values copied")
+            return
+
+        self._reindex(changed)
+        self.has_unsaved_changes = True
+        self.update_rows(changed, before)
+        self.update_status()
+        self.notify(f"Copied {len(changed)} values from {source} to {target}")
+
+    def action_prune_dead(self) -> None:
+        """Delete the dead entries shown in the table, press twice to confirm."""
+        if self._pruning:
+            self.notify("Still checking dead entries", severity="warning")
+            return
+        self._pruning = True
+        self.prune_dead([e.key for e in self.filtered_entries if e.is_dead])
 
-            def update_progress(
-                lang_code: str, current: int, total: int, message: str
-            ) -> None:
-                progress.update(progress=(current / total) * 100)
-                self.query_one("#status", Static).update(message)
+    @work(thread=True, group="prune")
+    def prune_dead(self, keys: list[str]) -> None:
+        """Check references and delete in a worker thread.
 
-            count = await translator.translate_all_missing(
-                entries_to_translate,
-                self.config.get_language_codes(),
-                progress_callback=update_progress,
+        Planning refreshes every module and rescans their sources, so it
+        runs on both presses, the second one checks references again.
+        """
+        plan = None
+        try:
+            pruner = DeadEntryPruner(self.config, self.workspace)
+            plan = pruner.plan(self.module, keys)
+            if self.app.call_from_thread(self._confirm_prune, keys, plan):
+                pruner.apply(plan)
+            else:
+                plan = None
+        except Exception as e:
+            plan = None
+            self.app.call_from_thread(
+                self.notify, f"Prune failed: {e}", severity="error"
             )
+        finally:
+            self.app.call_from_thread(self._prune_finished, plan)
 
-            self.has_unsaved_changes = True
-            self.refresh_table()
-            self.update_status()
-            self.notify(f"Translated {count} entries!")
+    def _confirm_prune(self, keys: list[str], plan: PrunePlan) -> bool:
+        """Whether a planned prune is confirmed and should be applied."""
+        if not plan.keys:
+            self.notify("No dead entries to prune")
+            return False
+        kept = f", {len(plan.kept)} still referenced" if plan.kept else ""
+        return self._confirmed(
+            "prune",
+            keys,
+            f"Press 'p' again to delete {len(plan.keys)} dead entries{kept}.",
+        )
 
+    def _prune_finished(self, plan: Optional[PrunePlan]) -> None:
+        """Drop the pruned rows, plan is None when nothing was deleted."""
+        self._pruning = False
+        if plan is None:
+            return
+        self.remove_rows(set(plan.keys))
+        self.loader.touch(self.module, self.entries)
+        self.update_status()
+        self.notify(f"Pruned {len(plan.keys)} dead entries")
+
+    @work(group="translate")
+    async def action_translate_missing(self) -> None:
+        """Translate the selected entries, or all missing entries."""
+        if self._translating:
+            self.notify("A translation is already running", severity="warning")
+            return
+        self._translating = True
+        try:
+            with span("translate", module=self.module.name) as translate_span:
+                if self.selected:
+                    counts = await self.translate_selection(self._target_entries())
+                else:
+                    counts = await self.translate_missing()
+                if counts is not None:
+                    translate_span.attrs.update(counts)
         except Exception as e:
             self.notify(f"Translation failed: {e}", severity="error")
         finally:
-            progress.display = False
+            self._translating = False
+
+    async def translate_missing(self) -> Optional[dict[str, int]]:
+        """Translate all missing entries, returns the counts."""
+        lang_codes = self.config.get_language_codes()
+        entries_to_translate = [
+            e for e in self.entries if e.has_missing_translations(lang_codes)
+        ]
+        if not entries_to_translate:
+            self.notify("No missing translations found!")
+            return None
+
+        self.notify(f"Translating {len(entries_to_translate)} entries...")
+        pending: dict[str, dict[str, str]] = {}
+        for entry in entries_to_translate:
+            source = entry.get_translation("values")
+            for code in entry.get_missing_languages(lang_codes):
+                pending.setdefault(code, {})[entry.key] = source
+        return await self._translate_pending(pending)
+
+    async def translate_selection(
+        self, entries: list[TranslationEntry]
+    ) -> Optional[dict[str, int]]:
+        """Translate missing and stale languages of the given entries."""
+        lang_codes = self.config.get_language_codes()
+        # {lang_code: {key: source}}
+        pending: dict[str, dict[str, str]] = {}
+        for entry in entries:
+            source = entry.get_translation("values")
+            if not source or not entry.translatable:
+                continue
+            codes = entry.get_missing_languages(lang_codes)
+            codes.extend(sorted(entry.stale_languages - set(codes)))
+            for code in codes:
+                pending.setdefault(code, {})[entry.key] = source
+
+        if not pending:
+            self.notify("Nothing to translate in the selection")
+            return None
+        return await self._translate_pending(pending)
+
+    async def _translate_pending(
+        self, pending: dict[str, dict[str, str]]
+    ) -> dict[str, int]:
+        """Fill {lang_code: {key: source}} from existing translations and the API.
+
+        Results are shown as batches finish, rows on screen and filtered rows
+        go first. Returns the translated, reused, failed and skipped counts.
+        """
+        from services.translator import AITranslator
+
+        # Fill strings translated elsewhere before paying for them
+        memory = await self._translation_memory()
+        reused: dict[str, TranslationEntry] = {}
+        before: dict[str, tuple[bool, bool]] = {}
+        reused_count = 0
+        for code, sources in pending.items():
+            for key, value in memory.match(sources, code).items():
+                entry = self.entries_by_key[key]
+                before.setdefault(key, self._counter_state(entry))
+                entry.set_translation(code, value)
+                self._record(entry, [code])
+                reused[key] = entry
+                del sources[key]
+                reused_count += 1
+        if reused:
+            self._apply_translated(list(reused.values()), before)
+        pending = {code: sources for code, sources in pending.items() if sources}
+
+        translator = AITranslator(self.config)
+        scheduler = TranslationScheduler(pending, self.config.batch_size)
+        translated = failed = 0
+        progress = self.query_one("#progress", ProgressBar)
+        run_status = self.query_one("#run-status", Static)
+
+        def on_result(
+            code: str,
+            batch: dict[str, str],
+            result: dict[str, str] | Exception,
+        ) -> None:
+            nonlocal translated, failed
+            progress.update(progress=scheduler.finished / scheduler.total * 100)
+            if isinstance(result, Exception):
+                failed += len(batch)
+            else:
+                changed = []
+                states = {}
+                for key, source in batch.items():
+                    entry = self.entries_by_key.get(key)
+                    if entry is None:
+                        continue
+                    value = result.get(key)
+                    if not value or placeholder_mismatch(source, value):
+                        failed += 1
+                        continue
+                    states[key] = self._counter_state(entry)
+                    entry.set_translation(code, value)
+                    self._record(entry, [code])
+                    changed.append(entry)
+                translated += len(changed)
+                if changed:
+                    self._apply_translated(changed, states)
+            # The viewport may have scrolled since the last batch
+            self._prioritize()
+            self._update_run_status()
+
+        if scheduler.total:
+            translator.examples = build_example_index(self.workspace)
+            self._scheduler = scheduler
+            self._translator = translator
+            self._prioritize()
+            progress.update(progress=0)
+            progress.display = True
+            run_status.display = True
+            self._update_run_status()
+            timer = self.set_interval(0.25, self._update_run_status)
+            try:
+                await translator.translate_scheduled(scheduler, on_result)
+            finally:
+                timer.stop()
+                self._scheduler = None
+                self._translator = None
+                progress.display = False
+                run_status.display = False
+
+        self._reindex([])
+        counts = {
+            "translated": translated,
+            "reused": reused_count,
+            "failed": failed,
+            "skipped": len(scheduler),
+        }
+        message = f"Translated {translated} strings, reused {reused_count}"
+        if failed:
+            message += f", {failed} failed"
+        if scheduler.cancelled and len(scheduler):
+            reason = "budget reached" if translator.over_budget() else "cancelled"
+            message += f", {len(scheduler)} not sent ({reason})"
+        if translator.usage.saved_tokens:
+            message += f", ~{translator.usage.saved_tokens:,} tokens saved"
+        if translator.cost:
+            message += f", ${translator.cost:.4f}"
+        severity = "warning" if failed or len(scheduler) else "information"
+        self.notify(message, severity=severity)
+        return counts
+
+    def _update_run_status(self) -> None:
+        """Show progress, requests, tokens and cost of the running translation."""
+        scheduler, translator = self._scheduler, self._translator
+        if scheduler is None or translator is None:
+            return
+        usage = translator.usage
+        parts = [
+            f"{scheduler.finished}/{scheduler.total} strings",
+            f"In flight: {usage.in_flight}",
+            f"Requests: {usage.requests}",
+            f"Tokens: {usage.total_tokens:,}",
+        ]
+        if usage.saved_tokens:
+            parts[-1] += f" (~{usage.saved_tokens:,} saved)"
+        if self.config.input_price or self.config.output_price:
+            cost = f"Cost: ${translator.cost:.4f}"
+            if self.config.budget:
+                cost += f" / ${self.config.budget:.2f}"
+            parts.append(cost)
+        if scheduler.cancelled:
+            state = "[red]Stopping[/red]"
+        elif scheduler.paused:
+            state = "[yellow]Paused[/yellow] (z resume, escape cancel)"
+        else:
+            state = "Translating (z pause, escape cancel)"
+        self.query_one("#run-status", Static).update(
+            " | ".join([state, *parts])
+        )
+
+    def action_pause_translation(self) -> None:
+        """Pause or resume the running translation."""
+        scheduler = self._scheduler
+        if scheduler is None or scheduler.cancelled:
+            return
+        if scheduler.paused:
+            scheduler.resume()
+        else:
+            scheduler.pause()
+        self._update_run_status()
+
+    def _apply_translated(
+        self,
+        entries: list[TranslationEntry],
+        before: dict[str, tuple[bool, bool]],
+    ) -> None:
+        """Show entries translated during a run.
+
+        The workspace index is updated once when the run ends.
+        """
+        for entry in entries:
+            self.search_index.update(entry)
+        self._search_cache = {}
+        self.has_unsaved_changes = True
+        self.update_rows(entries, before)
+        self.update_status()
+
+    def _prioritize(self) -> None:
+        """Translate rows on screen, then filtered rows, first."""
+        if self._scheduler is None:
+            return
+        table = self.query_one("#table", DataTable)
+        top = int(table.scroll_y)
+        visible = self.filtered_entries[top : top + table.size.height]
+        filtered = (
+            self.filtered_entries
+            if len(self.filtered_entries) < len(self.entries)
+            else ()
+        )
+        self._scheduler.prioritize(
+            [e.key for e in visible], [e.key for e in filtered]
+        )
+
+    async def _translation_memory(self) -> TranslationMemory:
+        """Translations of all modules, loading the ones not opened yet."""
+        others = [m for m in self.config.modules if m.name != self.module.name]
+        await asyncio.to_thread(self.workspace.refresh, others)
+        return TranslationMemory(self.workspace)
 
     def action_save_all(self) -> None:
         """Save all changes."""
-        for lang in self.config.languages:
-            path = (
-                self.config.project_root
-                / self.module.res_path
-                / lang.code
-                / "strings.xml"
-            )
+        untranslatable = [e.key for e in self.entries if not e.translatable]
+        with span("save", module=self.module.name) as save_span:
+            written = 0
+            for lang in self.config.languages:
+                path = (
+                    self.config.project_root
+                    / self.module.res_path
+                    / lang.code
+                    / "strings.xml"
+                )
 
-            # Collect translations for this language
-            translations = {}
-            for entry in self.entries:
-                value = entry.get_translation(lang.code)
-                if value:
-                    translations[entry.key] = value
+                # Collect translations for this language
+                translations = {}
+                for entry in self.entries:
+                    value = entry.get_translation(lang.code)
+                    if value:
+                        translations[entry.key] = value
 
-            if translations:
-                StringsXmlParser.write(path, translations)
+                if translations:
+                    StringsXmlParser.write(path, translations, untranslatable)
+                    written += 1
 
+            save_span.attrs["files"] = written
+
+        tracker = self.loader.tracker
+        for key, codes in self._pending_records.items():
+            entry = self.entries_by_key.get(key)
+            if entry is not None:
+                tracker.record(self.module.name, entry, codes)
+        self._pending_records = {}
+        tracker.save()
+        self.loader.touch(self.module, self.entries)
         self.has_unsaved_changes = False
         self.update_status()
         self.notify("All changes saved!")
 
     def action_refresh(self) -> None:
         """Refresh data."""
-        self.load_entries()
+        self.load_entries(use_cache=False)
         self.notify("Data refreshed!")
@@ -1,5 +1,21 @@
-from .xml_parser import StringsXmlParser
-from .translator import AITranslator, TranslationError
-from .dead_entry_finder import DeadEntryFinder
+"""Services are imported lazily so CLI commands only pay for what they use."""
 
-__all__ = ["StringsXmlParser", "AITranslator", "TranslationError", "DeadEntryFinder"]
+import importlib
+
+_EXPORTS = {
+    "StringsXmlParser": ".xml_parser",
+    "AITranslator": ".translator",
+    "TranslationError": ".translator",
+    "DeadEntryFinder": ".dead_entry_finder",
+    "SearchIndex": ".search_index",
+    "WorkspaceIndex": ".workspace",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module, __name__), name)
@@ -0,0 +1,310 @@
+"""Headless translation of missing and stale strings across modules."""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Optional, TYPE_CHECKING
+
+from models.entry import TranslationEntry
+from services.workspace import WorkspaceIndex
+from services.examples import build_example_index
+from services.placeholders import placeholder_mismatch
+from services.reuse import TranslationMemory
+from services.xml_parser import StringsXmlParser
+from services.perf import span
+
+if TYPE_CHECKING:
+    from config import Config, ModuleConfig
+    from services.translator import AITranslator, TokenUsage
+
+
+@dataclass
+class BackfillFailure:
+    """Keys of a module language that were not translated."""
+
+    module: str
+    lang: str
+    keys: list[str]
+    error: str
+
+
+@dataclass
+class BackfillCounts:
+    """Work done for one module language."""
+
+    missing: int = 0
+    stale: int = 0
+    # Filled from an existing translation of the same source text
+    reused: int = 0
+    translated: int = 0
+    failed: int = 0
+
+
+@dataclass
+class BackfillReport:
+    """Result of a backfill run."""
+
+    # {module: {lang_code: counts}}
+    modules: dict[str, dict[str, BackfillCounts]] = field(default_factory=dict)
+    failures: list[BackfillFailure] = field(default_factory=list)
+    usage: Optional["TokenUsage"] = None
+    # Estimated from translation.pricing, in USD
+    cost: float = 0.0
+    # {endpoint name: {"requests": n, "errors": n, "rate_limited": n}}
+    endpoints: dict[str, dict[str, int]] = field(default_factory=dict)
+    files_written: int = 0
+    wall_time: float = 0.0
+
+    def counts(self, module: str, lang_code: str) -> BackfillCounts:
+        return self.modules.setdefault(module, {}).setdefault(
+            lang_code, BackfillCounts()
+        )
+
+    def totals(self) -> BackfillCounts:
+        total = BackfillCounts()
+        for languages in self.modules.values():
+            for counts in languages.values():
+                total.missing += counts.missing
+                total.stale += counts.stale
+                total.reused += counts.reused
+                total.translated += counts.translated
+                total.failed += counts.failed
+        return total
+
+    def to_dict(self) -> dict:
+        """JSON serializable report."""
+        usage = self.usage
+        return {
+            "totals": vars(self.totals()),
+            "modules": {
+                module: {code: vars(counts) for code, counts in languages.items()}
+                for module, languages in self.modules.items()
+            },
+            "failures": [vars(failure) for failure in self.failures],
+            "tokens": {
+                "requests": usage.requests if usage else 0,
+                "prompt": usage.prompt_tokens if usage else 0,
+                "completion": usage.completion_tokens if usage else 0,
+                "total": usage.total_tokens if usage else 0,
+                "saved": usage.saved_tokens if usage else 0,
+            },
+            "cost": round(self.cost, 6),
+            "endpoints": self.endpoints,
+            "files_written": self.files_written,
+            "wall_time": round(self.wall_time, 3),
+        }
+
+
+class Backfiller:
+    """Translate missing (and optionally stale) strings of many modules.
+
+    Modules are loaded in parallel, all batches of all modules share one
+    bounded pool of API requests and every language file is written once.
+    """
+
+    def __init__(self, config: "Config", workspace: Optional[WorkspaceIndex] = None):
+        self.config = config
+        self.workspace = workspace or WorkspaceIndex(config)
+        self.loader = self.workspace.loader
+
+    def run(
+        self,
+        modules: list["ModuleConfig"],
+        lang_codes: list[str],
+        include_stale: bool = False,
+        dry_run: bool = False,
+        reuse: bool = True,
+    ) -> BackfillReport:
+        """Translate and write pending strings, returns the report.
+
+        With reuse, strings whose source text already has a translation in
+        any module are filled from it and only the rest go to the API.
+        """
+        start = time.perf_counter()
+        report = BackfillReport()
+
+        # Reuse and prompt examples look up translations in every module
+        every_module = reuse or self.config.example_count > 0
+        self.workspace.refresh(None if every_module else modules)
+        memory = TranslationMemory(self.workspace) if reuse else None
+
+        # {(module, lang_code): {key: source}} of every pending string
+        pending: dict[tuple[str, str], dict[str, str]] = {}
+        # {(module, lang_code): {key: translation}} filled from the memory
+        reused: dict[tuple[str, str], dict[str, str]] = {}
+        for module in modules:
+            entries = self.workspace.entries(module.name)
+            for lang_code in lang_codes:
+                sources = self._collect(report, module, lang_code, entries, include_stale)
+                if not sources:
+                    continue
+                pending[(module.name, lang_code)] = sources
+                if memory is not None:
+                    matches = memory.match(sources, lang_code)
+                    if matches:
+                        reused[(module.name, lang_code)] = matches
+                        report.counts(module.name, lang_code).reused = len(matches)
+
+        if pending and not dry_run:
+            # {(module, lang_code): {key: source}} left for the API
+            remaining: dict[tuple[str, str], dict[str, str]] = {}
+            for target, sources in pending.items():
+                matches = reused.get(target, {})
+                left = {k: v for k, v in sources.items() if k not in matches}
+                if left:
+                    remaining[target] = left
+            translations: dict[tuple[str, str], dict[str, str]] = {}
+            errors: dict[tuple[str, str], list[tuple[list[str], str]]] = {}
+            if remaining:
+                from services.translator import AITranslator
+
+                translator = AITranslator(self.config)
+                translator.examples = build_example_index(self.workspace)
+                report.usage = translator.usage
+                translations, errors = asyncio.run(
+                    self._translate(translator, remaining)
+                )
+                report.endpoints = translator.pool.stats()
+                report.cost = translator.cost
+            modules_by_name = {m.name: m for m in modules}
+            with span("save", files=len(pending)):
+                for target in pending:
+                    module_name, lang_code = target
+                    self._apply(
+                        report,
+                        modules_by_name[module_name],
+                        lang_code,
+                        pending[target],
+                        remaining.get(target, {}),
+                        translations.get(target, {}),
+                        errors.get(target, []),
+                        reused.get(target, {}),
+                    )
+            self.loader.tracker.save()
+
+        report.wall_time = time.perf_counter() - start
+        return report
+
+    @staticmethod
+    def _collect(
+        report: BackfillReport,
+        module: "ModuleConfig",
+        lang_code: str,
+        entries: list[TranslationEntry],
+        include_stale: bool,
+    ) -> dict[str, str]:
+        """Source texts of the entries a language still needs."""
+        sources = {}
+        counts = None
+        for entry in entries:
+            source = entry.get_translation("values")
+            if not source or not entry.translatable:
+                continue
+            missing = not entry.get_translation(lang_code)
+            stale = include_stale and lang_code in entry.stale_languages
+            if not (missing or stale):
+                continue
+            counts = counts or report.counts(module.name, lang_code)
+            if missing:
+                counts.missing += 1
+            else:
+                counts.stale += 1
+            sources[entry.key] = source
+        return sources
+
+    async def _translate(
+        self,
+        translator: "AITranslator",
+        pending: dict[tuple[str, str], dict[str, str]],
+    ) -> tuple[
+        dict[tuple[str, str], dict[str, str]],
+        dict[tuple[str, str], list[tuple[list[str], str]]],
+    ]:
+        """Translate all batches, grouping results per module language.
+
+        Returns the translations and the (keys, error) of failed batches.
+        """
+        jobs = [
+            (target, batch)
+            for target, sources in pending.items()
+            for batch in translator.split_batches(sources)
+        ]
+        with span("translate", batches=len(jobs)):
+            results = await translator.translate_batches(
+                [(lang_code, batch) for (_, lang_code), batch in jobs]
+            )
+
+        grouped: dict[tuple[str, str], dict[str, str]] = {
+            target: {} for target in pending
+        }
+        errors: dict[tuple[str, str], list[tuple[list[str], str]]] = {}
+        for (target, batch), result in zip(jobs, results):
+            if isinstance(result, Exception):
+                errors.setdefault(target, []).append((list(batch), str(result)))
+                continue
+            for key in batch:
+                if result.get(key):
+                    grouped[target][key] = result[key]
+
+        return grouped, errors
+
+    def _apply(
+        self,
+        report: BackfillReport,
+        module: "ModuleConfig",
+        lang_code: str,
+        sources: dict[str, str],
+        requested: dict[str, str],
+        translated: dict[str, str],
+        errors: list[tuple[list[str], str]],
+        reused: dict[str, str],
+    ) -> None:
+        """Validate and write the translations of one language file.
+
+        sources holds every pending string, requested the ones sent to the
+        API and reused the ones filled from existing translations.
+        """
+        counts = report.counts(module.name, lang_code)
+        failures = [BackfillFailure(module.name, lang_code, k, e) for k, e in errors]
+        failed_batches = {key for keys, _ in errors for key in keys}
+
+        accepted: dict[str, str] = {}
+        unanswered = []
+        for key, source in requested.items():
+            if key in failed_batches:
+                continue
+            value = translated.get(key)
+            if not value:
+                unanswered.append(key)
+                continue
+            mismatch = placeholder_mismatch(source, value)
+            if mismatch:
+                failures.append(
+                    BackfillFailure(
+                        module.name, lang_code, [key], f"placeholders: {mismatch}"
+                    )
+                )
+                continue
+            accepted[key] = value
+
+        if unanswered:
+            failures.append(
+                BackfillFailure(
+                    module.name, lang_code, unanswered, "no translation returned"
+                )
+            )
+        report.failures.extend(failures)
+        counts.failed = sum(len(failure.keys) for failure in failures)
+        counts.translated = len(accepted)
+        accepted.update(reused)
+        if not accepted:
+            return
+
+        StringsXmlParser.update_entries(
+            self.loader.strings_path(module, lang_code), accepted
+        )
+        report.files_written += 1
+
+        for key in accepted:
+            entry = TranslationEntry(key=key, translations={"values": sources[key]})
+            self.loader.tracker.record(module.name, entry, [lang_code])
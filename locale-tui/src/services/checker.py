@@ -0,0 +1,168 @@
+"""Localization health check service."""
+
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Optional, TYPE_CHECKING
+
+from services.module_loader import ModuleLoader
+from services.placeholders import placeholder_mismatch
+from services.source_tracker import SourceTracker
+
+if TYPE_CHECKING:
+    from config import Config, ModuleConfig
+    from models.entry import TranslationEntry
+    from services.workspace import WorkspaceIndex
+
+
+# Metrics that can be limited by check thresholds
+METRICS = ("missing", "dead", "stale", "placeholder_mismatch", "duplicates")
+
+
+@dataclass
+class LanguageHealth:
+    """Problem counters of one module language."""
+
+    missing: int = 0
+    stale: int = 0
+    placeholder_mismatch: int = 0
+    # Entries whose value equals the value of another entry
+    duplicates: int = 0
+
+
+@dataclass
+class ModuleHealth:
+    """Problem counters of a module."""
+
+    module: str
+    total: int = 0
+    dead: int = 0
+    languages: dict[str, LanguageHealth] = field(default_factory=dict)
+
+    @classmethod
+    def from_entries(
+        cls, module_name: str, entries: list["TranslationEntry"], lang_codes: list[str]
+    ) -> "ModuleHealth":
+        """Compute counters from loaded entries."""
+        health = cls(module=module_name, total=len(entries))
+        health.dead = sum(1 for entry in entries if entry.is_dead)
+
+        for code in lang_codes:
+            lang = health.languages[code] = LanguageHealth()
+            values = Counter()
+            for entry in entries:
+                value = entry.get_translation(code)
+                if value:
+                    values[value] += 1
+                if code == "values":
+                    continue
+                source = entry.get_translation("values")
+                if not source or not entry.translatable:
+                    continue
+                if not value:
+                    lang.missing += 1
+                    continue
+                if code in entry.stale_languages:
+                    lang.stale += 1
+                if placeholder_mismatch(source, value):
+                    lang.placeholder_mismatch += 1
+            lang.duplicates = sum(count for count in values.values() if count > 1)
+        return health
+
+
+@dataclass
+class CheckReport:
+    """Result of a check run."""
+
+    modules: list[ModuleHealth] = field(default_factory=list)
+    wall_time: float = 0.0
+
+    def totals(self) -> dict[str, int]:
+        """Metric totals over all modules and languages."""
+        totals = dict.fromkeys(METRICS, 0)
+        for health in self.modules:
+            totals["dead"] += health.dead
+            for lang in health.languages.values():
+                totals["missing"] += lang.missing
+                totals["stale"] += lang.stale
+                totals["placeholder_mismatch"] += lang.placeholder_mismatch
+                totals["duplicates"] += lang.duplicates
+        return totals
+
+    def violations(self, thresholds: dict[str, int]) -> list[tuple[str, int, int]]:
+        """(metric, value, limit) of every exceeded threshold."""
+        totals = self.totals()
+        return [
+            (metric, totals[metric], limit)
+            for metric, limit in thresholds.items()
+            if limit is not None and totals[metric] > limit
+        ]
+
+    def to_dict(self, thresholds: Optional[dict[str, int]] = None) -> dict:
+        """JSON serializable report."""
+        return {
+            "totals": self.totals(),
+            "modules": {
+                health.module: {
+                    "total": health.total,
+                    "dead": health.dead,
+                    "languages": {
+                        code: vars(lang) for code, lang in health.languages.items()
+                    },
+                }
+                for health in self.modules
+            },
+            "violations": [
+                {"metric": metric, "value": value, "limit": limit}
+                for metric, value, limit in self.violations(thresholds or {})
+            ],
+            "wall_time": round(self.wall_time, 3),
+        }
+
+
+def check_module(config: "Config", module: "ModuleConfig") -> ModuleHealth:
+    """Load a module and compute its health, runs in worker processes."""
+    # Workers share the state file, new fingerprints are not written back
+    tracker = SourceTracker(config.state_path, autosave=False)
+    entries = ModuleLoader(config, tracker).load(module)
+    return ModuleHealth.from_entries(module.name, entries, config.get_language_codes())
+
+
+class HealthChecker:
+    """Check all modules, one worker process per module.
+
+    With a workspace the already loaded modules are checked in-process.
+    """
+
+    def __init__(self, config: "Config", workspace: Optional["WorkspaceIndex"] = None):
+        self.config = config
+        self.workspace = workspace
+
+    def run(
+        self, modules: list["ModuleConfig"], workers: Optional[int] = None
+    ) -> CheckReport:
+        """Check modules and return the report in module order."""
+        start = time.perf_counter()
+        workers = min(len(modules), workers or os.cpu_count() or 1)
+
+        if self.workspace is not None:
+            self.workspace.refresh(modules)
+            lang_codes = self.config.get_language_codes()
+            results = [
+                ModuleHealth.from_entries(
+                    module.name, self.workspace.entries(module.name), lang_codes
+                )
+                for module in modules
+            ]
+        elif workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(
+                    pool.map(check_module, [self.config] * len(modules), modules)
+                )
+        else:
+            # A pool only adds start-up cost on a single core
+            results = [check_module(self.config, module) for module in modules]
+
+        return CheckReport(modules=results, wall_time=time.perf_counter() - start)
@@ -0,0 +1,258 @@
+"""Resident daemon answering CLI commands over a Unix socket.
+
+Protocol: the client sends one JSON object per line and receives one JSON
+object per line in return.
+
+    {"command": "run", "argv": [...], "cwd": "..."}
+        -> {"ok": true, "stdout": "...", "stderr": "...", "exit_code": 0}
+    {"command": "status"} -> {"ok": true, "pid": ..., "uptime": ..., ...}
+    {"command": "stop"}   -> {"ok": true}
+
+Editor integrations can talk to the socket directly, the CLI forwards the
+commands in ROUTED_COMMANDS when a daemon is running.
+"""
+
+import contextlib
+import io
+import json
+import os
+import socket
+import socketserver
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from config import Config
+    from services.workspace import WorkspaceIndex
+
+
+# Socket file created next to config.yml
+SOCKET_NAME = ".locale-tui.sock"
+
+# Commands the CLI forwards to a running daemon
+ROUTED_COMMANDS = {"add", "set", "list-keys", "search", "where", "check"}
+
+# Seconds to wait for a daemon to accept a connection
+CONNECT_TIMEOUT = 5.0
+
+# Seconds the CLI waits for the reply to a forwarded command
+RUN_TIMEOUT = 60.0
+
+# Runs CLI arguments in this process, returns the exit code
+CommandRunner = Callable[[list[str]], int]
+
+
+@dataclass
+class DaemonSession:
+    """Configuration and parsed modules kept in memory by the daemon."""
+
+    config_path: Path
+    config: "Config"
+    workspace: "WorkspaceIndex"
+    config_mtime_ns: int = 0
+    started: float = field(default_factory=time.time)
+    requests: int = 0
+
+
+# Set inside the daemon process, commands reuse its config and workspace
+session: Optional[DaemonSession] = None
+
+
+def socket_path(config_path: Path) -> Path:
+    """Socket path of the daemon serving a config file."""
+    return config_path.resolve().parent / SOCKET_NAME
+
+
+class DaemonError(Exception):
+    """A daemon accepted a request but sent no usable reply."""
+
+    pass
+
+
+def request(path: Path, payload: dict, timeout: Optional[float] = None) -> Optional[dict]:
+    """Send a request, None when no daemon accepts the connection.
+
+    Once connected the request may have been acted on, so a failure after
+    that point, e.g. timeout seconds without a reply, raises DaemonError.
+    """
+    if not path.exists():
+        return None
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.settimeout(CONNECT_TIMEOUT if timeout is None else timeout)
+            sock.connect(str(path))
+        except OSError:
+            # Stale socket of a daemon that died or of another user
+            return None
+        try:
+            sock.settimeout(timeout)
+            sock.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as f:
+                line = f.readline()
+        except OSError as e:
+            raise DaemonError(str(e) or type(e).__name__)
+    if not line:
+        raise DaemonError("connection closed without a reply")
+    try:
+        return json.loads(line)
+    except ValueError:
+        raise DaemonError("invalid reply")
+
+
+def probe(path: Path, timeout: float = 1.0) -> Optional[dict]:
+    """Status of the daemon, None when none answers."""
+    try:
+        return request(path, {"command": "status"}, timeout=timeout)
+    except DaemonError:
+        return None
+
+
+def open_session(config_path: Path, config: "Config") -> DaemonSession:
+    """Create a session and index every module."""
+    from services.workspace import WorkspaceIndex
+
+    workspace = WorkspaceIndex(config)
+    workspace.refresh()
+    return DaemonSession(
+        config_path=config_path,
+        config=config,
+        workspace=workspace,
+        config_mtime_ns=config_path.stat().st_mtime_ns,
+    )
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Handle one client connection."""
+
+    server: "DaemonServer"
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            payload = json.loads(line)
+            response = self.server.dispatch(payload)
+        except Exception as e:
+            response = {"ok": False, "error": str(e)}
+        self.wfile.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+
+
+class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Serve CLI commands from one process that keeps modules loaded.
+
+    Commands run one at a time because they redirect the process-wide
+    stdout, stderr and working directory. A watcher thread polls the
+    project files so changes are reindexed before the next request, it
+    takes the same lock so it never refreshes while a command runs.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        path: Path,
+        config_path: Path,
+        load_config: Callable[[], "Config"],
+        run_command: CommandRunner,
+        interval: float = 1.0,
+    ):
+        self.path = path
+        self.config_path = config_path
+        self.load_config = load_config
+        self.run_command = run_command
+        self.interval = interval
+        self._command_lock = threading.Lock()
+        self._stopped = threading.Event()
+
+        if path.exists():
+            if probe(path) is not None:
+                raise RuntimeError(f"Daemon already running on {path}")
+            path.unlink()
+        super().__init__(str(path), _Handler)
+
+        global session
+        session = open_session(config_path, load_config())
+
+    def serve(self) -> None:
+        """Serve until stopped, then remove the socket."""
+        watcher = threading.Thread(target=self._watch, daemon=True)
+        watcher.start()
+        try:
+            self.serve_forever(poll_interval=0.2)
+        finally:
+            self._stopped.set()
+            self.server_close()
+            with contextlib.suppress(OSError):
+                self.path.unlink()
+
+    def _watch(self) -> None:
+        """Reload config and reindex changed modules in the background."""
+        global session
+        while not self._stopped.wait(self.interval):
+            try:
+                mtime_ns = self.config_path.stat().st_mtime_ns
+                if mtime_ns == session.config_mtime_ns:
+                    # Commands read and refresh the same loader and index
+                    with self._command_lock:
+                        # Only stats files, an idle tick records no spans
+                        changed = session.workspace.changed_modules()
+                        if changed:
+                            session.workspace.refresh(changed)
+                    continue
+                # A new session shares nothing until it is swapped in
+                reloaded = open_session(self.config_path, self.load_config())
+                with self._command_lock:
+                    reloaded.requests = session.requests
+                    session = reloaded
+            except (Exception, SystemExit):
+                # Broken files are reported by the next command instead
+                continue
+
+    def dispatch(self, payload: dict) -> dict:
+        """Answer a decoded request."""
+        command = payload.get("command")
+        if command == "run":
+            return self._run(payload.get("argv") or [], payload.get("cwd"))
+        if command == "status":
+            return {
+                "ok": True,
+                "pid": os.getpid(),
+                "uptime": round(time.time() - session.started, 1),
+                "requests": session.requests,
+                "config": str(session.config_path),
+                "modules": {
+                    name: len(session.workspace.entries(name))
+                    for name in session.workspace.fingerprints()
+                },
+            }
+        if command == "stop":
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return {"ok": True}
+        return {"ok": False, "error": f"Unknown command: {command}"}
+
+    def _run(self, argv: list[str], cwd: Optional[str]) -> dict:
+        """Run a CLI command in this process and capture its output."""
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        with self._command_lock:
+            session.requests += 1
+            previous_cwd = os.getcwd()
+            try:
+                if cwd:
+                    os.chdir(cwd)
+                with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(
+                    stderr
+                ):
+                    exit_code = self.run_command(argv)
+            finally:
+                os.chdir(previous_cwd)
+        return {
+            "ok": True,
+            "stdout": stdout.getvalue(),
+            "stderr": stderr.getvalue(),
+            "exit_code": exit_code,
+        }
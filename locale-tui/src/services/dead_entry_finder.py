@@ -1,16 +1,27 @@
 """Dead entry finder service."""
 
+import os
 import re
+from bisect import bisect_right
 from pathlib import Path
-from typing import Set, TYPE_CHECKING
+from typing import Container, Optional, Set, TYPE_CHECKING
 import glob as glob_module
 
 if TYPE_CHECKING:
     from models.entry import TranslationEntry
 
 
+# (source file, line number) of a string reference
+ReferenceSite = tuple[Path, int]
+
+
 class DeadEntryFinder:
-    """Detect unreferenced translation entries in code."""
+    """Detect unreferenced translation entries in code.
+
+    References found in a source file are cached with the file's mtime and
+    size, so repeated scans only read files that changed. Source patterns
+    are only globbed again when a directory they searched changed.
+    """
 
     # Patterns to match R.string.xxx, stringResource(R.string.xxx), etc.
     PATTERNS = [
@@ -20,52 +31,175 @@ class DeadEntryFinder:
         r"@string/(\w+)",
     ]
 
+    # Layout XML files are always checked
+    LAYOUT_PATTERNS = [
+        "**/res/layout*/*.xml",
+        "**/res/menu/*.xml",
+        "**/res/navigation/*.xml",
+    ]
+
     # System reserved keys that should not be marked as dead
     RESERVED_KEYS = {"app_name"}
 
     def __init__(self, project_root: Path):
         self.project_root = project_root
         self.compiled_patterns = [re.compile(p) for p in self.PATTERNS]
+        # {path: (mtime_ns, size, {key: [line, ...]})}
+        self._file_cache: dict[str, tuple[int, int, dict[str, list[int]]]] = {}
+        # {pattern: ({directory: mtime_ns}, [file, ...])}
+        self._glob_cache: dict[str, tuple[dict[str, int], list[str]]] = {}
+
+    def source_files(
+        self, source_patterns: list[str], mtimes: Optional[dict[str, int]] = None
+    ) -> list[str]:
+        """Expand source and layout patterns to file paths.
+
+        mtimes memoizes directory stats, calls sharing it state every
+        directory once, e.g. the layout directories of all modules.
+        """
+        files: dict[str, None] = {}
+        for pattern in [*source_patterns, *self.LAYOUT_PATTERNS]:
+            for file_path in self._glob(pattern, mtimes):
+                files[file_path] = None
+        return list(files)
+
+    def _glob(self, pattern: str, mtimes: Optional[dict[str, int]] = None) -> list[str]:
+        """Files matching a pattern, cached while its directories are unchanged.
+
+        Adding, removing or renaming a file changes the mtime of its
+        directory, so stating the searched directories is enough to know
+        the cached matches are still complete.
+        """
+        if mtimes is None:
+            mtimes = {}
+
+        def mtime_ns(directory: str) -> int:
+            value = mtimes.get(directory)
+            if value is None:
+                value = mtimes[directory] = _mtime_ns(directory)
+            return value
+
+        cached = self._glob_cache.get(pattern)
+        if cached is not None and all(
+            mtime_ns(directory) == recorded
+            for directory, recorded in cached[0].items()
+        ):
+            return cached[1]
+        # Directories are stated first, changes during the glob show next time
+        directories = self._searched_directories(pattern)
+        files = glob_module.glob(str(self.project_root / pattern), recursive=True)
+        self._glob_cache[pattern] = (directories, files)
+        return files
+
+    def _searched_directories(self, pattern: str) -> dict[str, int]:
+        """{directory: mtime_ns} of the directories a pattern can match in."""
+        parts = Path(pattern).parts
+        fixed = []
+        for part in parts[:-1]:
+            if glob_module.has_magic(part):
+                break
+            fixed.append(part)
+        base = self.project_root.joinpath(*fixed)
+        # A missing directory shows up as a change of its nearest ancestor
+        while not base.is_dir() and base != self.project_root:
+            base = base.parent
+
+        directories = {str(base): _mtime_ns(str(base))}
+        if len(fixed) < len(parts) - 1:
+            for root, names, _ in os.walk(base):
+                # Like glob, wildcards do not match hidden directories
+                names[:] = [name for name in names if not name.startswith(".")]
+                for name in names:
+                    path = os.path.join(root, name)
+                    directories[path] = _mtime_ns(path)
+        return directories
+
+    def source_stats(
+        self, source_patterns: list[str], mtimes: Optional[dict[str, int]] = None
+    ) -> list[tuple[str, int, int]]:
+        """(path, mtime_ns, size) of every scanned source and layout file."""
+        result = []
+        for file_path in self.source_files(source_patterns, mtimes):
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue
+            result.append((file_path, stat.st_mtime_ns, stat.st_size))
+        return result
 
     def find_referenced_keys(self, source_patterns: list[str]) -> Set[str]:
         """Find all referenced string keys from source code."""
         referenced = set()
-
-        for pattern in source_patterns:
-            full_pattern = str(self.project_root / pattern)
-            for file_path in glob_module.glob(full_pattern, recursive=True):
-                referenced.update(self._extract_keys_from_file(Path(file_path)))
-
-        # Also check layout XML files
-        layout_patterns = [
-            "**/res/layout*/*.xml",
-            "**/res/menu/*.xml",
-            "**/res/navigation/*.xml",
-        ]
-        for pattern in layout_patterns:
-            full_pattern = str(self.project_root / pattern)
-            for file_path in glob_module.glob(full_pattern, recursive=True):
-                referenced.update(self._extract_keys_from_file(Path(file_path)))
-
+        for file_path in self.source_files(source_patterns):
+            referenced.update(self._file_references(file_path))
         return referenced
 
-    def _extract_keys_from_file(self, file_path: Path) -> Set[str]:
-        """Extract string keys from a single file."""
-        keys = set()
+    def find_references(
+        self, source_patterns: list[str], stats: Optional[dict] = None
+    ) -> dict[str, list[ReferenceSite]]:
+        """Find every reference site of every key.
+
+        stats receives the number of scanned files and of files answered
+        from the cache.
+        """
+        references: dict[str, list[ReferenceSite]] = {}
+        files = self.source_files(source_patterns)
+        hits = [0]
+        for file_path in files:
+            path = Path(file_path)
+            for key, lines in self._file_references(file_path, hits).items():
+                references.setdefault(key, []).extend((path, line) for line in lines)
+        if stats is not None:
+            stats["files"] = len(files)
+            stats["cached_files"] = hits[0]
+        return references
+
+    def _file_references(
+        self, file_path: str, hits: Optional[list[int]] = None
+    ) -> dict[str, list[int]]:
+        """Referenced keys of a file with their line numbers, cached.
+
+        hits[0] is incremented when the cached result is used.
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return {}
+        cached = self._file_cache.get(file_path)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            if hits is not None:
+                hits[0] += 1
+            return cached[2]
+
+        result = self._extract_references(Path(file_path))
+        self._file_cache[file_path] = (stat.st_mtime_ns, stat.st_size, result)
+        return result
+
+    def _extract_references(self, file_path: Path) -> dict[str, list[int]]:
+        """Extract string keys and their line numbers from a single file."""
         try:
             content = file_path.read_text(encoding="utf-8")
-            for pattern in self.compiled_patterns:
-                matches = pattern.findall(content)
-                keys.update(matches)
         except Exception:
-            pass
-        return keys
+            return {}
 
-    def mark_dead_entries(
-        self, entries: list["TranslationEntry"], source_patterns: list[str]
+        line_starts = [0]
+        line_starts.extend(m.end() for m in re.finditer("\n", content))
+
+        references: dict[str, set[int]] = {}
+        for pattern in self.compiled_patterns:
+            for match in pattern.finditer(content):
+                line = bisect_right(line_starts, match.start(1))
+                references.setdefault(match.group(1), set()).add(line)
+        return {key: sorted(lines) for key, lines in references.items()}
+
+    def _extract_keys_from_file(self, file_path: Path) -> Set[str]:
+        """Extract string keys from a single file."""
+        return set(self._file_references(str(file_path)))
+
+    def mark_dead(
+        self, entries: list["TranslationEntry"], referenced: Container[str]
     ) -> int:
-        """Mark unreferenced entries, returns dead entry count."""
-        referenced = self.find_referenced_keys(source_patterns)
+        """Mark entries missing from referenced, returns dead entry count."""
         dead_count = 0
 
         for entry in entries:
@@ -79,3 +213,17 @@ class DeadEntryFinder:
                 dead_count += 1
 
         return dead_count
+
+    def mark_dead_entries(
+        self, entries: list["TranslationEntry"], source_patterns: list[str]
+    ) -> int:
+        """Mark unreferenced entries, returns dead entry count."""
+        return self.mark_dead(entries, self.find_referenced_keys(source_patterns))
+
+
+def _mtime_ns(path: str) -> int:
+    """Modification time of a path, -1 when it does not exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
@@ -0,0 +1,190 @@
+"""Load balancing of translation requests over several API keys and endpoints."""
+
+import asyncio
+import re
+import time
+from dataclasses import dataclass
+from typing import Optional, TYPE_CHECKING
+from urllib.parse import urlparse
+
+from openai import AsyncOpenAI, APIConnectionError, APIStatusError
+
+if TYPE_CHECKING:
+    from config import EndpointConfig
+
+# First cooldown after a failure, doubled for every further failure in a row
+BASE_COOLDOWN = 2.0
+MAX_COOLDOWN = 120.0
+
+# Statuses that say nothing about the endpoint, only about the request
+REQUEST_ERRORS = {400, 404, 413, 422}
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def parse_duration(text: Optional[str]) -> Optional[float]:
+    """Seconds of a rate limit reset like "1m30s", "250ms" or "12"."""
+    if not text:
+        return None
+    text = text.strip()
+    try:
+        return float(text)
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(text)
+    if not parts:
+        return None
+    return sum(float(value) * _DURATION_UNITS[unit] for value, unit in parts)
+
+
+def _header_int(headers, name: str) -> Optional[int]:
+    try:
+        return int(headers.get(name))
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class RateLimit:
+    """Remaining share of one x-ratelimit-* window."""
+
+    remaining: int
+    limit: int
+    # time.monotonic() when the window resets
+    reset_at: float
+
+    def headroom(self, now: float) -> float:
+        if now >= self.reset_at or self.limit <= 0:
+            return 1.0
+        return max(0.0, self.remaining / self.limit)
+
+
+class EndpointState:
+    """Client and health of one endpoint key."""
+
+    def __init__(self, endpoint: "EndpointConfig", max_retries: int):
+        self.endpoint = endpoint
+        host = urlparse(endpoint.base_url).netloc or endpoint.base_url
+        self.name = f"{host}…{endpoint.api_key[-4:]}"
+        self.client = AsyncOpenAI(
+            api_key=endpoint.api_key,
+            base_url=endpoint.base_url,
+            max_retries=max_retries,
+            # Some reverse proxies/WAF rules block the SDK default OpenAI/Python UA.
+            default_headers={"User-Agent": "locale-tui/1.0"},
+        )
+        self.in_flight = 0
+        self.requests = 0
+        self.errors = 0
+        self.rate_limited = 0
+        # Failures in a row, reset by a success
+        self.failures = 0
+        self.cooldown_until = 0.0
+        # False once the endpoint rejected a response_format json_schema
+        self.structured_output = True
+        # {"requests" | "tokens": window} from the last response headers
+        self.limits: dict[str, RateLimit] = {}
+
+    def headroom(self, now: float) -> float:
+        """Smallest remaining share of the known rate limit windows."""
+        if not self.limits:
+            return 1.0
+        return min(limit.headroom(now) for limit in self.limits.values())
+
+    def update_limits(self, headers, now: float) -> None:
+        for kind in ("requests", "tokens"):
+            remaining = _header_int(headers, f"x-ratelimit-remaining-{kind}")
+            limit = _header_int(headers, f"x-ratelimit-limit-{kind}")
+            if remaining is None or limit is None:
+                continue
+            reset = parse_duration(headers.get(f"x-ratelimit-reset-{kind}"))
+            self.limits[kind] = RateLimit(remaining, limit, now + (reset or 60.0))
+
+
+class EndpointPool:
+    """Spread requests over endpoints by weight and rate limit headroom.
+
+    acquire() picks the endpoint with the highest weight × headroom per
+    request in flight; among equals the one with the fewest requests per
+    weight, so sequential requests follow the weights too. An endpoint
+    answering 429, a server error or not at all is skipped for a cooldown,
+    Retry-After when given, doubling with every failure in a row otherwise.
+    """
+
+    def __init__(self, endpoints: list["EndpointConfig"]):
+        # The pool fails over itself, the SDK only retries a lone endpoint
+        max_retries = 2 if len(endpoints) == 1 else 0
+        self.members = [EndpointState(e, max_retries) for e in endpoints]
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def _pick(self, now: float) -> Optional[EndpointState]:
+        ready = [
+            m for m in self.members if m.cooldown_until <= now and m.endpoint.weight > 0
+        ]
+        if not ready:
+            return None
+        return max(
+            ready,
+            key=lambda m: (
+                m.endpoint.weight * m.headroom(now) / (1 + m.in_flight),
+                -m.requests / m.endpoint.weight,
+            ),
+        )
+
+    async def acquire(self) -> EndpointState:
+        """Endpoint for the next request, waits while all are cooling down."""
+        if not self.members:
+            raise RuntimeError("No API key configured")
+        while True:
+            now = time.monotonic()
+            member = self._pick(now)
+            if member is not None:
+                member.in_flight += 1
+                member.requests += 1
+                return member
+            waiting = [m.cooldown_until for m in self.members if m.endpoint.weight > 0]
+            if not waiting:
+                raise RuntimeError("No API endpoint with a positive weight")
+            await asyncio.sleep(max(0.0, min(waiting) - now))
+
+    def release(
+        self, member: EndpointState, headers=None, error: Optional[Exception] = None
+    ) -> None:
+        """Record the outcome of a request made with acquire()."""
+        now = time.monotonic()
+        member.in_flight -= 1
+        if headers is not None:
+            member.update_limits(headers, now)
+        if error is None:
+            member.failures = 0
+            return
+        member.errors += 1
+        if not is_endpoint_failure(error):
+            return
+        if isinstance(error, APIStatusError) and error.status_code == 429:
+            member.rate_limited += 1
+        member.failures += 1
+        retry_after = parse_duration(headers.get("retry-after")) if headers else None
+        delay = retry_after or BASE_COOLDOWN * 2 ** (member.failures - 1)
+        member.cooldown_until = now + min(MAX_COOLDOWN, delay)
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """{endpoint name: counters} for reports."""
+        return {
+            m.name: {
+                "requests": m.requests,
+                "errors": m.errors,
+                "rate_limited": m.rate_limited,
+            }
+            for m in self.members
+        }
+
+
+def is_endpoint_failure(error: Exception) -> bool:
+    """Whether an error means the endpoint, not the request, is unhealthy."""
+    if isinstance(error, APIStatusError):
+        return error.status_code not in REQUEST_ERRORS
+    return isinstance(error, APIConnectionError)
@@ -0,0 +1,203 @@
+"""Similar existing translations as few-shot examples for the prompt."""
+
+import functools
+import heapq
+import math
+import re
+from typing import Optional, TYPE_CHECKING
+
+from models.entry import TranslationEntry
+from services.perf import span
+from services.placeholders import PLACEHOLDER_PATTERN
+from services.reuse import choose_translation, normalize
+
+if TYPE_CHECKING:
+    from services.workspace import WorkspaceIndex
+
+_WORD = re.compile(r"\w+")
+
+# Terms in more than this share of the texts are too common to find
+# similar ones, they still count towards the similarity score
+MAX_DOC_FREQUENCY = 0.05
+
+
+@functools.lru_cache(maxsize=65536)
+def _stem(word: str) -> str:
+    """Crude English stem so "saved", "saves" and "save" share a term."""
+    for suffix in ("ing", "ed", "es", "s"):
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            return word[: -len(suffix)]
+    return word
+
+
+def terms(text: str) -> set[str]:
+    """Word unigrams and bigrams of a source text, placeholders removed."""
+    words = [
+        _stem(word)
+        for word in _WORD.findall(normalize(PLACEHOLDER_PATTERN.sub(" ", text)))
+    ]
+    result = set(words)
+    result.update(f"{a} {b}" for a, b in zip(words, words[1:]))
+    return result
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count, about 4 ASCII characters or 1 other character each."""
+    ascii_chars = sum(1 for char in text if char.isascii())
+    return (len(text) - ascii_chars) + -(-ascii_chars // 4)
+
+
+class ExampleIndex:
+    """Inverted index over the source texts of all indexed modules.
+
+    Texts are compared by the IDF weighted cosine similarity of their word
+    unigrams and bigrams. Only terms rarer than MAX_DOC_FREQUENCY have
+    posting lists, so a lookup touches a few hundred texts even in large
+    workspaces. Translations per language are resolved on first use with
+    the same rules as TranslationMemory.
+    """
+
+    def __init__(
+        self,
+        workspace: "WorkspaceIndex",
+        max_examples: int = 5,
+        max_tokens: int = 400,
+        min_score: float = 0.3,
+    ):
+        self.max_examples = max_examples
+        self.max_tokens = max_tokens
+        self.min_score = min_score
+
+        # {source text: [entry, ...]} of every module
+        by_text: dict[str, list[TranslationEntry]] = {}
+        for module in workspace.config.modules:
+            for entry in workspace.entries(module.name):
+                source = entry.get_translation("values")
+                if source and entry.translatable:
+                    by_text.setdefault(source, []).append(entry)
+        self._texts = list(by_text)
+        self._entries = list(by_text.values())
+
+        postings: dict[str, list[int]] = {}
+        text_terms = []
+        for doc, text in enumerate(self._texts):
+            doc_terms = terms(text)
+            text_terms.append(doc_terms)
+            for term in doc_terms:
+                postings.setdefault(term, []).append(doc)
+
+        count = len(self._texts)
+        self._idf = {
+            term: math.log(1 + count / len(docs)) for term, docs in postings.items()
+        }
+        # Terms never seen weigh like the rarest ones
+        self._unseen_idf = math.log(1 + count) if count else 1.0
+        max_docs = max(50, int(count * MAX_DOC_FREQUENCY))
+        self._postings = {
+            term: docs for term, docs in postings.items() if len(docs) <= max_docs
+        }
+        self._norms = [
+            math.sqrt(sum(self._idf[term] ** 2 for term in doc_terms)) or 1.0
+            for doc_terms in text_terms
+        ]
+        # {lang_code: {doc: translation}}
+        self._targets: dict[str, dict[int, str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def _translations(self, lang_code: str) -> dict[int, str]:
+        targets = self._targets.get(lang_code)
+        if targets is None:
+            targets = {}
+            for doc, (text, entries) in enumerate(zip(self._texts, self._entries)):
+                value = choose_translation(entries, text, lang_code)
+                if value is not None:
+                    targets[doc] = value
+            self._targets[lang_code] = targets
+        return targets
+
+    def similar(self, text: str, lang_code: str) -> dict[int, float]:
+        """{doc: similarity} of translated texts scoring at least min_score."""
+        query = terms(text)
+        if not query:
+            return {}
+        targets = self._translations(lang_code)
+        query_norm = math.sqrt(
+            sum(self._idf.get(term, self._unseen_idf) ** 2 for term in query)
+        )
+
+        scores: dict[int, float] = {}
+        for term in query:
+            docs = self._postings.get(term)
+            if docs is None:
+                continue
+            weight = self._idf[term] ** 2
+            for doc in docs:
+                scores[doc] = scores.get(doc, 0.0) + weight
+
+        result = {}
+        for doc, score in scores.items():
+            if doc not in targets:
+                continue
+            score /= query_norm * self._norms[doc]
+            if score >= self.min_score:
+                result[doc] = score
+        return result
+
+    def select(self, sources: dict[str, str], lang_code: str) -> dict[str, str]:
+        """{source: translation} examples for a batch, within max_tokens.
+
+        Every text takes its best match first, then the remaining matches
+        fill up to max_examples by similarity.
+        """
+        if self.max_examples <= 0 or not self._texts:
+            return {}
+        targets = self._translations(lang_code)
+
+        best: dict[int, float] = {}
+        firsts: list[int] = []
+        for text in dict.fromkeys(sources.values()):
+            scores = self.similar(text, lang_code)
+            if not scores:
+                continue
+            firsts.append(max(scores, key=scores.__getitem__))
+            for doc, score in scores.items():
+                if score > best.get(doc, 0.0):
+                    best[doc] = score
+
+        ranked = sorted(firsts, key=best.__getitem__, reverse=True)
+        ranked.extend(
+            heapq.nlargest(self.max_examples * 2, best, key=best.__getitem__)
+        )
+
+        examples: dict[str, str] = {}
+        tokens = 0
+        for doc in ranked:
+            if len(examples) >= self.max_examples:
+                break
+            text = self._texts[doc]
+            if text in examples:
+                continue
+            # Quotes, colon and separator of the JSON pair
+            cost = estimate_tokens(text) + estimate_tokens(targets[doc]) + 4
+            if tokens + cost > self.max_tokens:
+                continue
+            examples[text] = targets[doc]
+            tokens += cost
+        return examples
+
+
+def build_example_index(workspace: "WorkspaceIndex") -> Optional[ExampleIndex]:
+    """Example index configured by translation.examples, None when disabled."""
+    config = workspace.config
+    if config.example_count <= 0:
+        return None
+    with span("examples") as index_span:
+        index = ExampleIndex(
+            workspace,
+            max_examples=config.example_count,
+            max_tokens=config.example_max_tokens,
+        )
+        index_span.attrs["texts"] = len(index)
+    return index
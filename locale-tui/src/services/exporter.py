@@ -0,0 +1,173 @@
+"""Streaming translation export service."""
+
+import csv
+import json
+from dataclasses import dataclass
+from typing import BinaryIO, Callable, Iterator, Optional, TextIO, TYPE_CHECKING
+
+from services.module_loader import ModuleLoader
+from services.importer import XLIFF_NS
+from services.perf import span
+
+if TYPE_CHECKING:
+    from config import Config, ModuleConfig
+    from models.entry import TranslationEntry
+
+
+EntryFilter = Callable[["TranslationEntry"], bool]
+
+
+@dataclass
+class ExportReport:
+    """Result of an export run."""
+
+    modules: int = 0
+    rows: int = 0
+
+
+class TranslationExporter:
+    """Write module entries to CSV, JSONL or XLIFF one module at a time.
+
+    Only the module being written is held in memory, so exporting every
+    module does not build the whole module x language matrix.
+    """
+
+    def __init__(self, config: "Config", loader: Optional[ModuleLoader] = None):
+        self.config = config
+        self.loader = loader or ModuleLoader(config)
+
+    def iter_modules(
+        self,
+        modules: list["ModuleConfig"],
+        entry_filter: Optional[EntryFilter] = None,
+    ) -> Iterator[tuple["ModuleConfig", list["TranslationEntry"]]]:
+        """Load modules one by one and yield their matching entries."""
+        for module in modules:
+            entries = self.loader.load(module)
+            if entry_filter is not None:
+                entries = [e for e in entries if entry_filter(e)]
+            yield module, entries
+            # Release the module before loading the next one
+            self.loader.invalidate(module)
+
+    def write_csv(
+        self,
+        out: TextIO,
+        modules: list["ModuleConfig"],
+        lang_codes: list[str],
+        entry_filter: Optional[EntryFilter] = None,
+    ) -> ExportReport:
+        """Wide CSV: module,key,<lang>... plus dead and stale flags."""
+        report = ExportReport()
+        writer = csv.writer(out)
+        writer.writerow(["module", "key", *lang_codes, "dead", "stale"])
+
+        for module, entries in self.iter_modules(modules, entry_filter):
+            with span("export", module=module.name, format="csv", rows=len(entries)):
+                for entry in entries:
+                    writer.writerow(
+                        [
+                            module.name,
+                            entry.key,
+                            *(entry.get_translation(code) or "" for code in lang_codes),
+                            "1" if entry.is_dead else "",
+                            " ".join(sorted(entry.stale_languages)),
+                        ]
+                    )
+            report.modules += 1
+            report.rows += len(entries)
+        return report
+
+    def write_jsonl(
+        self,
+        out: TextIO,
+        modules: list["ModuleConfig"],
+        lang_codes: list[str],
+        entry_filter: Optional[EntryFilter] = None,
+    ) -> ExportReport:
+        """One {module, key, translations, dead, stale} record per line."""
+        report = ExportReport()
+
+        for module, entries in self.iter_modules(modules, entry_filter):
+            with span(
+                "export", module=module.name, format="jsonl", rows=len(entries)
+            ):
+                for entry in entries:
+                    record = {
+                        "module": module.name,
+                        "key": entry.key,
+                        "translations": {
+                            code: entry.get_translation(code) for code in lang_codes
+                        },
+                        "dead": entry.is_dead,
+                        "stale": sorted(entry.stale_languages),
+                    }
+                    out.write(json.dumps(record, ensure_ascii=False))
+                    out.write("\n")
+            report.modules += 1
+            report.rows += len(entries)
+        return report
+
+    def write_xliff(
+        self,
+        out: BinaryIO,
+        modules: list["ModuleConfig"],
+        lang_codes: list[str],
+        entry_filter: Optional[EntryFilter] = None,
+    ) -> ExportReport:
+        """XLIFF 1.2 with one <file> per module and target language."""
+        from lxml import etree
+
+        report = ExportReport()
+        target_codes = [code for code in lang_codes if code != "values"]
+
+        with etree.xmlfile(out, encoding="utf-8") as xf:
+            xf.write_declaration()
+            root_attrs = {"version": "1.2"}
+            with xf.element(f"{{{XLIFF_NS}}}xliff", root_attrs, nsmap={None: XLIFF_NS}):
+                for module, entries in self.iter_modules(modules, entry_filter):
+                    with span(
+                        "export", module=module.name, format="xliff", rows=len(entries)
+                    ):
+                        for code in target_codes:
+                            self._write_xliff_file(xf, module, code, entries)
+                    report.modules += 1
+                    report.rows += len(entries)
+        return report
+
+    @staticmethod
+    def _write_xliff_file(
+        xf,
+        module: "ModuleConfig",
+        lang_code: str,
+        entries: list["TranslationEntry"],
+    ) -> None:
+        """Write the <file> element of one module language."""
+        target_language = lang_code.removeprefix("values-").replace("-r", "-")
+        attrs = {
+            "original": module.name,
+            "source-language": "en",
+            "target-language": target_language,
+            "datatype": "plaintext",
+        }
+        xf.write("\n")
+        with xf.element(f"{{{XLIFF_NS}}}file", attrs):
+            with xf.element(f"{{{XLIFF_NS}}}body"):
+                for entry in entries:
+                    source = entry.get_translation("values")
+                    if not source:
+                        continue
+                    xf.write("\n")
+                    unit_attrs = {"id": entry.key, "resname": entry.key}
+                    with xf.element(f"{{{XLIFF_NS}}}trans-unit", unit_attrs):
+                        with xf.element(f"{{{XLIFF_NS}}}source"):
+                            xf.write(source)
+                        target = entry.get_translation(lang_code)
+                        if target:
+                            target_attrs = {}
+                            if lang_code in entry.stale_languages:
+                                target_attrs["state"] = "needs-review-translation"
+                            with xf.element(f"{{{XLIFF_NS}}}target", target_attrs):
+                                xf.write(target)
+                xf.write("\n")
+        xf.write("\n")
@@ -0,0 +1,463 @@
+"""Bulk translation import service."""
+
+import csv
+import json
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator, Optional, TextIO, TYPE_CHECKING
+
+from models.entry import TranslationEntry
+from services.xml_parser import StringsXmlParser
+from services.placeholders import placeholder_mismatch
+from services.source_tracker import SourceTracker
+from services.perf import span
+
+if TYPE_CHECKING:
+    from config import Config, ModuleConfig
+
+
+SUFFIX_FORMATS = {
+    ".csv": "csv",
+    ".json": "json",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".xlf": "xliff",
+    ".xliff": "xliff",
+}
+
+XLIFF_NS = "urn:oasis:names:tc:xliff:document:1.2"
+
+
+class ImportFileError(Exception):
+    """Invalid import file."""
+
+    pass
+
+
+@dataclass
+class ImportRow:
+    """Single translated string from an import file."""
+
+    key: str
+    lang: str  # language code as written in the file
+    value: str  # JSON files may carry other types, reported on import
+    module: Optional[str] = None
+
+
+@dataclass
+class ImportIssue:
+    """Row that was not applied."""
+
+    module: str
+    lang: str
+    key: str
+    reason: str
+
+
+@dataclass
+class ImportReport:
+    """Result of an import run."""
+
+    rows: int = 0
+    applied: int = 0
+    unchanged: int = 0
+    skipped: int = 0
+    files_written: int = 0
+    # {(module, lang_code): applied count}
+    per_file: dict[tuple[str, str], int] = field(default_factory=dict)
+    issues: list[ImportIssue] = field(default_factory=list)
+
+
+def detect_format(path: Path) -> Optional[str]:
+    """Guess import format from a file suffix."""
+    return SUFFIX_FORMATS.get(path.suffix.lower())
+
+
+def read_rows(path: Path, fmt: str) -> Iterator[ImportRow]:
+    """Stream rows from an import file."""
+    if fmt == "csv":
+        return _read_csv(path)
+    if fmt == "jsonl":
+        return _read_jsonl(path)
+    if fmt == "json":
+        return _read_json(path)
+    if fmt == "xliff":
+        return _read_xliff(path)
+    raise ImportFileError(f"Unsupported format: {fmt}")
+
+
+def _read_csv(path: Path) -> Iterator[ImportRow]:
+    """Read long (key,lang,value) or wide (key,<lang>,<lang>...) CSV."""
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.DictReader(f)
+        columns = reader.fieldnames or []
+        if "key" not in columns:
+            raise ImportFileError("CSV needs a 'key' column")
+
+        long_format = "lang" in columns and "value" in columns
+        # Source and flag columns (as written by export) are not translations
+        ignored = {"key", "module", "source", "values", "dead", "stale"}
+        lang_columns = [c for c in columns if c not in ignored]
+
+        for record in reader:
+            key = (record.get("key") or "").strip()
+            if not key:
+                continue
+            module = record.get("module") or None
+            if long_format:
+                yield ImportRow(key, record["lang"], record["value"] or "", module)
+                continue
+            for column in lang_columns:
+                if record.get(column):
+                    yield ImportRow(key, column, record[column], module)
+
+
+def _rows_from_record(record: dict) -> Iterator[ImportRow]:
+    """Rows from a {key, lang, value} or {key, translations} record."""
+    key = record.get("key")
+    if not key or not isinstance(key, str):
+        return
+    module = record.get("module")
+    if not isinstance(module, str):
+        module = None
+    if "translations" in record:
+        translations = record["translations"]
+        if not isinstance(translations, dict):
+            return
+        for lang, value in translations.items():
+            if value and lang != "values":
+                yield ImportRow(key, lang, value, module)
+    elif isinstance(record.get("lang"), str):
+        yield ImportRow(key, record["lang"], record.get("value") or "", module)
+
+
+def _read_jsonl(path: Path) -> Iterator[ImportRow]:
+    """Read one JSON record per line."""
+    with open(path, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                raise ImportFileError(f"Line {line_no}: {e}")
+            if isinstance(record, dict):
+                yield from _rows_from_record(record)
+
+
+class _JsonStream:
+    """Incremental reader of one JSON document from a text file.
+
+    Objects and arrays are walked member by member with members() and
+    items(), scalars and nested values are decoded with value(). Only the
+    value being decoded has to fit in memory, not the whole document.
+    """
+
+    CHUNK_SIZE = 1 << 16
+    _WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+    def __init__(self, f: TextIO):
+        self._file = f
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        # Characters dropped from the front of the buffer, for error offsets
+        self._offset = 0
+        self._eof = False
+
+    def _fill(self, size: int) -> None:
+        """Read more text, dropping what was consumed already."""
+        chunk = self._file.read(size)
+        if not chunk:
+            self._eof = True
+        self._offset += self._pos
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+
+    def _error(self, message: str, pos: Optional[int] = None) -> ImportFileError:
+        pos = self._pos if pos is None else pos
+        return ImportFileError(f"{message}: char {self._offset + pos}")
+
+    def peek(self) -> str:
+        """Next character after whitespace, "" at the end of the file."""
+        char = self._buffer[self._pos : self._pos + 1]
+        if char and char not in " \t\n\r":
+            return char
+        while True:
+            self._pos = self._WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer) or self._eof:
+                break
+            self._fill(self.CHUNK_SIZE)
+        return self._buffer[self._pos : self._pos + 1]
+
+    def expect(self, chars: str) -> str:
+        """Consume the next character, which must be one of chars."""
+        char = self.peek()
+        if not char or char not in chars:
+            raise self._error(f"Expected one of {chars!r}")
+        self._pos += 1
+        return char
+
+    def value(self):
+        """Decode the next value."""
+        if not self.peek():
+            raise self._error("Expected a value")
+        size = self.CHUNK_SIZE
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as e:
+                if self._eof:
+                    raise self._error(e.msg, e.pos)
+            else:
+                # A number at the end of the buffer can continue in the file
+                if end < len(self._buffer) or self._eof:
+                    self._pos = end
+                    return value
+            # Incomplete value, read more, larger reads for large values
+            self._fill(size)
+            size *= 2
+
+    def members(self) -> Iterator[str]:
+        """Keys of the object at the cursor, the caller consumes each value."""
+        self.expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            if self.peek() != '"':
+                raise self._error("Expected a property name")
+            key = self.value()
+            self.expect(":")
+            yield key
+            if self.expect(",}") == "}":
+                return
+
+    def items(self) -> Iterator:
+        """Elements of the array at the cursor."""
+        self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.expect(",]") == "]":
+                return
+
+    def end(self) -> None:
+        """Check nothing but whitespace follows the document."""
+        if self.peek():
+            raise self._error("Extra data")
+
+
+def _read_json(path: Path) -> Iterator[ImportRow]:
+    """Read records, {lang: {key: value}} or {module: {lang: {key: value}}}.
+
+    The file is streamed: records are decoded one at a time, maps one
+    language of one module at a time, which is what import keeps per
+    language file anyway. Decoding a language map in one call is several
+    times faster than walking it key by key.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        stream = _JsonStream(f)
+        first = stream.peek()
+        if first == "[":
+            for record in stream.items():
+                if isinstance(record, dict):
+                    yield from _rows_from_record(record)
+        elif first == "{":
+            for outer in stream.members():
+                if stream.peek() != "{":
+                    raise ImportFileError(f"Expected an object for '{outer}'")
+                for name in stream.members():
+                    value = stream.value()
+                    if not isinstance(value, dict):
+                        # {lang: {key: value}}
+                        yield ImportRow(name, outer, value or "")
+                        continue
+                    # {module: {lang: {key: value}}}
+                    for key, text in value.items():
+                        yield ImportRow(key, name, text or "", outer)
+        else:
+            raise ImportFileError("JSON must be a list or an object")
+        stream.end()
+
+
+def _read_xliff(path: Path) -> Iterator[ImportRow]:
+    """Stream trans-units of an XLIFF 1.2 file."""
+    from lxml import etree
+
+    file_tag = f"{{{XLIFF_NS}}}file"
+    unit_tag = f"{{{XLIFF_NS}}}trans-unit"
+    target_tag = f"{{{XLIFF_NS}}}target"
+
+    lang = None
+    module = None
+    try:
+        for event, elem in etree.iterparse(
+            str(path), events=("start", "end"), tag=(file_tag, unit_tag)
+        ):
+            if elem.tag == file_tag:
+                if event == "start":
+                    lang = elem.get("target-language")
+                    module = elem.get("original") or None
+                else:
+                    elem.clear()
+                continue
+
+            if event != "end":
+                continue
+            key = elem.get("resname") or elem.get("id")
+            target = elem.find(target_tag)
+            if key and target is not None and lang:
+                yield ImportRow(key, lang, "".join(target.itertext()), module)
+            # Free memory of processed units
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+    except etree.XMLSyntaxError as e:
+        raise ImportFileError(f"Invalid XLIFF: {e}")
+
+
+class TranslationImporter:
+    """Validate import rows and apply them with one write per file."""
+
+    def __init__(self, config: "Config", tracker: Optional[SourceTracker] = None):
+        self.config = config
+        self.tracker = tracker or SourceTracker(config.state_path)
+
+    def _strings_path(self, module: "ModuleConfig", lang_code: str) -> Path:
+        return self.config.project_root / module.res_path / lang_code / "strings.xml"
+
+    def run(
+        self,
+        rows: Iterator[ImportRow],
+        default_module: "ModuleConfig",
+        default_lang: Optional[str] = None,
+        validate: bool = True,
+        dry_run: bool = False,
+        override_module: bool = False,
+    ) -> ImportReport:
+        """Group rows by module and language, validate and apply them.
+
+        Rows without a module go to default_module, with override_module all
+        rows do.
+        """
+        report = ImportReport()
+        modules = {m.name: m for m in self.config.modules}
+
+        # {(module, lang_code): {key: value}}
+        groups: dict[tuple[str, str], dict[str, str]] = defaultdict(dict)
+
+        with span("import.read") as read_span:
+            for row in rows:
+                report.rows += 1
+                module_name = row.module or default_module.name
+                if override_module:
+                    module_name = default_module.name
+                lang_code = self.config.resolve_language(
+                    row.lang or default_lang or ""
+                )
+
+                if module_name not in modules:
+                    report.issues.append(
+                        ImportIssue(module_name, row.lang, row.key, "unknown module")
+                    )
+                elif lang_code is None:
+                    report.issues.append(
+                        ImportIssue(module_name, row.lang, row.key, "unknown language")
+                    )
+                elif lang_code == "values":
+                    report.issues.append(
+                        ImportIssue(module_name, row.lang, row.key, "source language")
+                    )
+                elif not isinstance(row.value, str):
+                    report.issues.append(
+                        ImportIssue(
+                            module_name, lang_code, row.key, "value is not a string"
+                        )
+                    )
+                elif not row.value:
+                    report.issues.append(
+                        ImportIssue(module_name, lang_code, row.key, "empty value")
+                    )
+                else:
+                    groups[(module_name, lang_code)][row.key] = row.value
+            read_span.attrs["rows"] = report.rows
+
+        with span("import.apply", files=len(groups)):
+            sources: dict[str, dict[str, str]] = {}
+            for (module_name, lang_code), updates in sorted(groups.items()):
+                module = modules[module_name]
+                if module_name not in sources:
+                    sources[module_name] = StringsXmlParser.parse(
+                        self._strings_path(module, "values")
+                    )
+                self._apply_file(
+                    report,
+                    module,
+                    lang_code,
+                    updates,
+                    sources[module_name],
+                    validate,
+                    dry_run,
+                )
+
+        report.skipped = len(report.issues)
+        if not dry_run:
+            self.tracker.save()
+        return report
+
+    def _apply_file(
+        self,
+        report: ImportReport,
+        module: "ModuleConfig",
+        lang_code: str,
+        updates: dict[str, str],
+        source: dict[str, str],
+        validate: bool,
+        dry_run: bool,
+    ) -> None:
+        """Validate and write updates of a single language file."""
+        path = self._strings_path(module, lang_code)
+        current = StringsXmlParser.parse(path)
+
+        accepted: dict[str, str] = {}
+        for key, value in updates.items():
+            if key not in source:
+                report.issues.append(
+                    ImportIssue(module.name, lang_code, key, "key not in source")
+                )
+                continue
+            if validate:
+                mismatch = placeholder_mismatch(source[key], value)
+                if mismatch:
+                    report.issues.append(
+                        ImportIssue(
+                            module.name, lang_code, key, f"placeholders: {mismatch}"
+                        )
+                    )
+                    continue
+            if current.get(key) == value:
+                report.unchanged += 1
+                continue
+            accepted[key] = value
+
+        if not accepted:
+            return
+
+        report.applied += len(accepted)
+        report.per_file[(module.name, lang_code)] = len(accepted)
+        if dry_run:
+            return
+
+        with span("save", module=module.name, language=lang_code):
+            StringsXmlParser.update_entries(path, accepted)
+        report.files_written += 1
+
+        for key in accepted:
+            entry = TranslationEntry(key=key, translations={"values": source[key]})
+            self.tracker.record(module.name, entry, [lang_code])
@@ -0,0 +1,199 @@
+"""Module entry loading service."""
+
+import threading
+from pathlib import Path
+from typing import Optional, TYPE_CHECKING
+
+from models.entry import TranslationEntry
+from services.xml_parser import StringsXmlParser
+from services.dead_entry_finder import DeadEntryFinder, ReferenceSite
+from services.source_tracker import SourceTracker
+from services.perf import span
+
+if TYPE_CHECKING:
+    from config import Config, ModuleConfig
+
+
+# (lang_code, mtime_ns, size) of every language file of a module, followed
+# by (path, mtime_ns, size) of every source file scanned for references
+Fingerprint = tuple[tuple[str, int, int], ...]
+
+
+class ModuleLoader:
+    """Load translation entries of a module from all language files.
+
+    Loaded entries are cached per module and reused as long as none of the
+    module's strings.xml files changed on disk. When only source files
+    changed, the cached entries are kept and their dead flags and reference
+    sites are rescanned, rereading just the changed files. The loader is
+    safe to share between worker threads.
+    """
+
+    def __init__(self, config: "Config", tracker: Optional[SourceTracker] = None):
+        self.config = config
+        self.tracker = tracker or SourceTracker(config.state_path)
+        self.finder = DeadEntryFinder(config.project_root)
+        self._cache: dict[str, tuple[Fingerprint, list[TranslationEntry]]] = {}
+        # {module: {key: reference sites}} from the last dead entry scan
+        self._references: dict[str, dict[str, list[ReferenceSite]]] = {}
+        self._lock = threading.Lock()
+        # {module: lock} held while a module loads
+        self._module_locks: dict[str, threading.Lock] = {}
+
+    def strings_path(self, module: "ModuleConfig", lang_code: str) -> Path:
+        """Resolve strings.xml path of a module language."""
+        return self.config.project_root / module.res_path / lang_code / "strings.xml"
+
+    def strings_fingerprint(self, module: "ModuleConfig") -> Fingerprint:
+        """Stat all language files of a module."""
+        result = []
+        for lang in self.config.languages:
+            path = self.strings_path(module, lang.code)
+            try:
+                stat = path.stat()
+                result.append((lang.code, stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                result.append((lang.code, 0, -1))
+        return tuple(result)
+
+    def fingerprint(
+        self, module: "ModuleConfig", mtimes: Optional[dict[str, int]] = None
+    ) -> Fingerprint:
+        """Stat all language files and scanned source files of a module.
+
+        mtimes memoizes directory stats across the modules of one check.
+        """
+        result = self.strings_fingerprint(module)
+        if module.source_patterns:
+            result += tuple(self.finder.source_stats(module.source_patterns, mtimes))
+        return result
+
+    def cached_fingerprint(self, module: "ModuleConfig") -> Optional[Fingerprint]:
+        """Fingerprint the cached entries of a module were loaded at."""
+        with self._lock:
+            cached = self._cache.get(module.name)
+        return cached[0] if cached is not None else None
+
+    def is_cached(self, module: "ModuleConfig") -> bool:
+        """Check whether a module can be served from cache."""
+        with self._lock:
+            cached = self._cache.get(module.name)
+        return cached is not None and cached[0] == self.fingerprint(module)
+
+    def load(
+        self, module: "ModuleConfig", use_cache: bool = True
+    ) -> list[TranslationEntry]:
+        """Parse all languages and mark dead and stale entries.
+
+        Loads of the same module run one at a time, so concurrent callers
+        share one entries list instead of each caching their own.
+        """
+        with self._module_lock(module.name), span(
+            "load", module=module.name
+        ) as load_span:
+            fingerprint = self.fingerprint(module)
+            with self._lock:
+                cached = self._cache.get(module.name) if use_cache else None
+
+            hit = cached is not None and cached[0] == fingerprint
+            # Same strings files, only references can have changed
+            languages = len(self.config.languages)
+            rescan = (
+                not hit
+                and cached is not None
+                and cached[0][:languages] == fingerprint[:languages]
+            )
+            if hit:
+                entries = cached[1]
+            else:
+                if rescan:
+                    entries = cached[1]
+                    self._scan(module, entries)
+                else:
+                    entries = self._parse(module)
+                with self._lock:
+                    self._cache[module.name] = (fingerprint, entries)
+
+            load_span.attrs["entries"] = len(entries)
+            load_span.attrs["cached"] = hit
+            load_span.attrs["rescanned"] = rescan
+        return entries
+
+    def _module_lock(self, name: str) -> threading.Lock:
+        with self._lock:
+            return self._module_locks.setdefault(name, threading.Lock())
+
+    def _parse(self, module: "ModuleConfig") -> list[TranslationEntry]:
+        """Build entries of a module from disk."""
+        all_keys: set[str] = set()
+        translations_by_lang: dict[str, dict[str, str]] = {}
+        untranslatable: set[str] = set()
+
+        # Collect translations from all languages
+        with span("parse", module=module.name, files=len(self.config.languages)):
+            for lang in self.config.languages:
+                translations = StringsXmlParser.parse(
+                    self.strings_path(module, lang.code),
+                    untranslatable if lang.code == "values" else None,
+                )
+                translations_by_lang[lang.code] = translations
+                all_keys.update(translations.keys())
+
+        # Create entries
+        entries = []
+        for key in sorted(all_keys):
+            entry = TranslationEntry(key=key, translatable=key not in untranslatable)
+            for lang_code, translations in translations_by_lang.items():
+                entry.translations[lang_code] = translations.get(key)
+            entries.append(entry)
+
+        self._scan(module, entries)
+
+        with span("stale", module=module.name):
+            self.tracker.mark_stale_entries(module.name, entries)
+
+        return entries
+
+    def _scan(self, module: "ModuleConfig", entries: list[TranslationEntry]) -> None:
+        """Mark dead entries and record the reference sites of a module."""
+        # Modules without strings have nothing to scan
+        if not module.source_patterns or not entries:
+            return
+        with span("scan", module=module.name) as scan_span:
+            references = self.finder.find_references(
+                module.source_patterns, scan_span.attrs
+            )
+            scan_span.attrs["dead"] = self.finder.mark_dead(entries, references)
+        with self._lock:
+            self._references[module.name] = references
+
+    def references(self, module: "ModuleConfig") -> dict[str, list[ReferenceSite]]:
+        """Reference sites found by the last load of a module."""
+        with self._lock:
+            return self._references.get(module.name, {})
+
+    def touch(
+        self,
+        module: "ModuleConfig",
+        entries: Optional[list[TranslationEntry]] = None,
+    ) -> None:
+        """Accept the current files after in-memory entries were written out.
+
+        entries is the list that was written, it replaces the cached one.
+        Source files keep their old stats, so changes to them since the last
+        load are still rescanned.
+        """
+        languages = len(self.config.languages)
+        with self._module_lock(module.name), self._lock:
+            cached = self._cache.get(module.name)
+            if cached is not None:
+                fingerprint = self.strings_fingerprint(module) + cached[0][languages:]
+                self._cache[module.name] = (
+                    fingerprint,
+                    cached[1] if entries is None else entries,
+                )
+
+    def invalidate(self, module: "ModuleConfig") -> None:
+        """Drop cached entries, e.g. after discarding unsaved edits."""
+        with self._lock:
+            self._cache.pop(module.name, None)
@@ -0,0 +1,121 @@
+"""Timing instrumentation shared by the TUI and CLI."""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator, Optional
+
+
+@dataclass
+class Span:
+    """A timed operation."""
+
+    name: str
+    start: float  # time.perf_counter() at start
+    duration: float = 0.0  # seconds
+    attrs: dict[str, Any] = field(default_factory=dict)
+    depth: int = 0  # nesting level within its thread
+    thread_id: int = 0
+    # False for operations timed elsewhere, e.g. overlapping asyncio tasks
+    nested: bool = True
+
+    @property
+    def duration_ms(self) -> float:
+        return self.duration * 1000
+
+
+SpanListener = Callable[[Span], None]
+
+
+class PerfRecorder:
+    """Collect spans and keep the most recent one per name.
+
+    Listeners are called synchronously when a span finishes, possibly from
+    worker threads.
+    """
+
+    def __init__(self):
+        self.latest: dict[str, Span] = {}
+        self._listeners: list[SpanListener] = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def add_listener(self, listener: SpanListener) -> None:
+        """Subscribe to finished spans."""
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: SpanListener) -> None:
+        """Unsubscribe from finished spans."""
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    @contextmanager
+    def span(self, name: str, **attrs: Any) -> Iterator[Span]:
+        """Time a block. Attributes can be added to the yielded span."""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+
+        span = Span(
+            name=name,
+            start=time.perf_counter(),
+            attrs=attrs,
+            depth=len(stack),
+            thread_id=threading.get_ident(),
+        )
+        stack.append(span)
+        try:
+            yield span
+        finally:
+            span.duration = time.perf_counter() - span.start
+            stack.pop()
+            self._finish(span)
+
+    def record(self, name: str, duration: float, **attrs: Any) -> Span:
+        """Record an operation that was timed elsewhere and just finished.
+
+        Unlike span() this does not touch the nesting stack, so it is safe
+        for operations that overlap on one thread, like asyncio tasks.
+        """
+        span = Span(
+            name=name,
+            start=time.perf_counter() - duration,
+            duration=duration,
+            attrs=attrs,
+            thread_id=threading.get_ident(),
+            nested=False,
+        )
+        self._finish(span)
+        return span
+
+    def _finish(self, span: Span) -> None:
+        with self._lock:
+            self.latest[span.name] = span
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener(span)
+
+
+def memory_usage() -> Optional[int]:
+    """Resident set size of this process in bytes, None if unknown."""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    # Peak instead of current usage, reported in KiB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if os.uname().sysname == "Darwin" else peak * 1024
+
+
+# Process-wide recorder
+recorder = PerfRecorder()
+span = recorder.span
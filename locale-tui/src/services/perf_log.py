@@ -0,0 +1,179 @@
+"""Rotating JSONL log of operation timings and its trend summary."""
+
+import json
+import math
+import os
+import statistics
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from services.perf import recorder, Span
+
+
+# Log file created next to config.yml
+LOG_NAME = ".locale-perf.jsonl"
+
+# Spans written to the log
+LOGGED_SPANS = ("command", "workspace", "load", "scan", "translate", "save")
+
+
+class PerfLog:
+    """Append finished spans to a JSONL file, rotating it by size.
+
+    Each line holds the span name, duration, start time and attributes like
+    entry counts, file counts and cache hits. When the file exceeds
+    max_bytes it is renamed to <name>.1, older files shift up to backups.
+    """
+
+    def __init__(self, path: Path, max_bytes: int = 1_000_000, backups: int = 3):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._lock = threading.Lock()
+
+    def install(self) -> None:
+        """Log spans of this process until uninstall()."""
+        recorder.add_listener(self.log)
+
+    def uninstall(self) -> None:
+        recorder.remove_listener(self.log)
+
+    def log(self, span: Span) -> None:
+        """Append a span if it is one of LOGGED_SPANS."""
+        if span.name not in LOGGED_SPANS:
+            return
+        record = {
+            "time": round(time.time() - (time.perf_counter() - span.start), 3),
+            "name": span.name,
+            "ms": round(span.duration_ms, 2),
+            "pid": os.getpid(),
+            "attrs": span.attrs,
+        }
+        line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            try:
+                self._rotate()
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(line)
+            except OSError:
+                # Timing records are never worth failing a command
+                pass
+
+    def _rotate(self) -> None:
+        try:
+            if self.path.stat().st_size < self.max_bytes:
+                return
+        except FileNotFoundError:
+            return
+        for n in range(self.backups - 1, 0, -1):
+            older = self.backup_path(n)
+            if older.exists():
+                os.replace(older, self.backup_path(n + 1))
+        if self.backups:
+            os.replace(self.path, self.backup_path(1))
+        else:
+            self.path.unlink()
+
+    def backup_path(self, n: int) -> Path:
+        return self.path.with_name(f"{self.path.name}.{n}")
+
+    def records(self) -> Iterator[dict]:
+        """All records, oldest first, including rotated files."""
+        paths = [self.backup_path(n) for n in range(self.backups, 0, -1)]
+        for path in [*paths, self.path]:
+            try:
+                f = open(path, "r", encoding="utf-8")
+            except FileNotFoundError:
+                continue
+            with f:
+                for line in f:
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        # Line cut short by a crash or a concurrent write
+                        continue
+
+
+@dataclass
+class PerfTrend:
+    """Timings of one operation over time."""
+
+    name: str
+    # Module or command the records belong to, "" when they have none
+    subject: str
+    count: int = 0
+    median_ms: float = 0.0
+    p95_ms: float = 0.0
+    last_ms: float = 0.0
+    # Median per time bucket, oldest first
+    buckets: list[float] = field(default_factory=list)
+    first_time: float = 0.0
+    last_time: float = 0.0
+    # Attributes of the latest record, e.g. entries and files
+    latest: dict = field(default_factory=dict)
+    # Share of records served from cache, None when not applicable
+    cache_hit_rate: Optional[float] = None
+
+    @property
+    def change(self) -> Optional[float]:
+        """Change of the last bucket against the first one in percent."""
+        if len(self.buckets) < 2 or not self.buckets[0]:
+            return None
+        return (self.buckets[-1] / self.buckets[0] - 1) * 100
+
+
+def _subject(record: dict) -> str:
+    attrs = record.get("attrs") or {}
+    return str(attrs.get("module") or attrs.get("command") or "")
+
+
+def _cache_hit_rate(records: list[dict]) -> Optional[float]:
+    """Cached loads, or cached source files of scans, over all of them."""
+    hits = total = 0
+    for record in records:
+        attrs = record.get("attrs") or {}
+        if "cached" in attrs:
+            hits += bool(attrs["cached"])
+            total += 1
+        elif "cached_files" in attrs and attrs.get("files"):
+            hits += attrs["cached_files"]
+            total += attrs["files"]
+    return hits / total if total else None
+
+
+def summarize(records: Iterable[dict], buckets: int = 5) -> list[PerfTrend]:
+    """Group records by operation and subject and compute their trend."""
+    groups: dict[tuple[str, str], list[dict]] = {}
+    for record in records:
+        if "name" not in record or "ms" not in record:
+            continue
+        groups.setdefault((record["name"], _subject(record)), []).append(record)
+
+    trends = []
+    for (name, subject), group in groups.items():
+        group.sort(key=lambda r: r.get("time", 0))
+        durations = [r["ms"] for r in group]
+        size = max(1, -(-len(group) // max(1, buckets)))
+        chunks = [durations[i : i + size] for i in range(0, len(durations), size)]
+        trends.append(
+            PerfTrend(
+                name=name,
+                subject=subject,
+                count=len(group),
+                median_ms=round(statistics.median(durations), 2),
+                p95_ms=sorted(durations)[math.ceil(0.95 * len(durations)) - 1],
+                last_ms=durations[-1],
+                buckets=[round(statistics.median(chunk), 2) for chunk in chunks],
+                first_time=group[0].get("time", 0),
+                last_time=group[-1].get("time", 0),
+                latest=group[-1].get("attrs") or {},
+                cache_hit_rate=_cache_hit_rate(group),
+            )
+        )
+
+    order = {name: i for i, name in enumerate(LOGGED_SPANS)}
+    trends.sort(key=lambda t: (order.get(t.name, len(order)), t.name, t.subject))
+    return trends
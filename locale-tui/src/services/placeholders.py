@@ -0,0 +1,47 @@
+"""Android format placeholder helpers."""
+
+import re
+from collections import Counter
+from typing import Optional
+
+# %s, %d, %1$s, %2$.2f, %-5d ... but not an escaped %%
+PLACEHOLDER_PATTERN = re.compile(
+    r"%(?!%)(?:\d+\$)?[-#+ 0,(]*\d*(?:\.\d+)?[sSdfeEgGxXoc]"
+)
+
+
+def extract_placeholders(text: Optional[str]) -> Counter:
+    """Count format placeholders in a string.
+
+    Placeholders without an index are numbered in order, so %d and %1$d
+    count as the same placeholder.
+    """
+    if not text:
+        return Counter()
+    result = Counter()
+    position = 0
+    for placeholder in PLACEHOLDER_PATTERN.findall(text.replace("%%", "")):
+        if "$" not in placeholder:
+            position += 1
+            placeholder = f"%{position}${placeholder[1:]}"
+        result[placeholder] += 1
+    return result
+
+
+def placeholder_mismatch(
+    source: Optional[str], translation: Optional[str]
+) -> Optional[str]:
+    """Describe placeholder differences, None when they match."""
+    expected = extract_placeholders(source)
+    actual = extract_placeholders(translation)
+    if expected == actual:
+        return None
+
+    missing = expected - actual
+    extra = actual - expected
+    parts = []
+    if missing:
+        parts.append("missing " + " ".join(sorted(missing.elements())))
+    if extra:
+        parts.append("unexpected " + " ".join(sorted(extra.elements())))
+    return ", ".join(parts)
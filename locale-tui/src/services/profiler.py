@@ -0,0 +1,92 @@
+"""cProfile statistics and Chrome trace output of a run."""
+
+import cProfile
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+from services.perf import recorder, Span
+
+
+class Profiler:
+    """Profile the calling thread and trace the spans of every thread.
+
+    stop() writes <prefix>.prof, pstats data for `python -m pstats` or
+    snakeviz, and <prefix>.trace.json, Chrome trace events for
+    chrome://tracing or ui.perfetto.dev. cProfile only sees the thread that
+    called start(), the trace also covers worker threads.
+    """
+
+    def __init__(self, prefix: Path):
+        self.prefix = prefix
+        self._profile = cProfile.Profile()
+        self._origin = 0.0
+        # (span, thread name) in finishing order
+        self._spans: list[tuple[Span, str]] = []
+
+    @property
+    def stats_path(self) -> Path:
+        return self.prefix.with_name(self.prefix.name + ".prof")
+
+    @property
+    def trace_path(self) -> Path:
+        return self.prefix.with_name(self.prefix.name + ".trace.json")
+
+    def start(self) -> None:
+        """Start profiling and collecting spans."""
+        self._origin = time.perf_counter()
+        recorder.add_listener(self._collect)
+        self._profile.enable()
+
+    def stop(self) -> None:
+        """Stop and write the stats and trace files."""
+        self._profile.disable()
+        recorder.remove_listener(self._collect)
+
+        self.prefix.parent.mkdir(parents=True, exist_ok=True)
+        self._profile.dump_stats(self.stats_path)
+        self.trace_path.write_text(
+            json.dumps(self.trace(), ensure_ascii=False, default=str),
+            encoding="utf-8",
+        )
+
+    def _collect(self, span: Span) -> None:
+        # Listeners run on the thread that finished the span
+        self._spans.append((span, threading.current_thread().name))
+
+    def trace(self) -> dict:
+        """Collected spans as Chrome trace events."""
+        pid = os.getpid()
+        events = []
+        threads = {}
+        for span_id, (span, thread_name) in enumerate(self._spans):
+            threads[span.thread_id] = thread_name
+            event = {
+                "name": span.name,
+                "cat": "locale-tui",
+                "pid": pid,
+                "tid": span.thread_id,
+                "args": span.attrs,
+            }
+            ts = (span.start - self._origin) * 1e6
+            dur = span.duration * 1e6
+            if span.nested:
+                events.append({**event, "ph": "X", "ts": ts, "dur": dur})
+            else:
+                # Overlapping operations become async slices on their own track
+                events.append({**event, "ph": "b", "id": span_id, "ts": ts})
+                events.append({**event, "ph": "e", "id": span_id, "ts": ts + dur})
+
+        for tid, name in threads.items():
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"name": name},
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
@@ -0,0 +1,122 @@
+"""Bulk removal of dead entries."""
+
+import difflib
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Iterable, Optional, TYPE_CHECKING
+
+from services.xml_parser import StringsXmlParser
+from services.workspace import WorkspaceIndex
+from services.perf import span
+
+if TYPE_CHECKING:
+    from config import Config, ModuleConfig
+
+
+# @string/key references inside string values
+STRING_REFERENCE = re.compile(r"@string/(\w+)")
+
+
+@dataclass
+class PrunePlan:
+    """Keys of a module to delete and keys kept by the double-check."""
+
+    module: "ModuleConfig"
+    keys: list[str] = field(default_factory=list)
+    # {key: reason}
+    kept: dict[str, str] = field(default_factory=dict)
+
+
+class DeadEntryPruner:
+    """Delete dead entries of a module with one rewrite per language file.
+
+    Before anything is deleted the candidates are checked again against a
+    fresh scan of every module's sources and against @string/ references in
+    string values, since resources are shared across modules.
+    """
+
+    def __init__(self, config: "Config", workspace: Optional[WorkspaceIndex] = None):
+        self.config = config
+        self.workspace = workspace or WorkspaceIndex(config)
+        self.loader = self.workspace.loader
+
+    def plan(
+        self, module: "ModuleConfig", keys: Optional[Iterable[str]] = None
+    ) -> PrunePlan:
+        """Select dead entries (or the given keys) that are safe to delete."""
+        self.workspace.refresh()
+        plan = PrunePlan(module)
+
+        with span("prune.check", module=module.name) as check_span:
+            referenced = self._referenced_keys()
+            entries = self.workspace.entries(module.name)
+            if keys is None:
+                candidates = [entry for entry in entries if entry.is_dead]
+            else:
+                wanted = set(keys)
+                candidates = [entry for entry in entries if entry.key in wanted]
+                for key in sorted(wanted - {entry.key for entry in candidates}):
+                    plan.kept[key] = "not found"
+
+            for entry in candidates:
+                if entry.key in self.loader.finder.RESERVED_KEYS:
+                    plan.kept[entry.key] = "reserved"
+                elif not entry.is_dead:
+                    plan.kept[entry.key] = "not dead"
+                elif entry.key in referenced:
+                    plan.kept[entry.key] = "referenced"
+                else:
+                    plan.keys.append(entry.key)
+            check_span.attrs["keys"] = len(plan.keys)
+
+        return plan
+
+    def _referenced_keys(self) -> set[str]:
+        """Keys used by any module's sources or by another string."""
+        referenced = set()
+        finder = self.loader.finder
+        for module in self.config.modules:
+            referenced.update(finder.find_referenced_keys(module.source_patterns))
+            for entry in self.workspace.entries(module.name):
+                for value in entry.translations.values():
+                    if value and "@string/" in value:
+                        referenced.update(STRING_REFERENCE.findall(value))
+        return referenced
+
+    def diff(self, plan: PrunePlan) -> str:
+        """Unified diff of every language file the plan changes."""
+        chunks = []
+        for lang in self.config.languages:
+            path = self.loader.strings_path(plan.module, lang.code)
+            current, result = StringsXmlParser.preview_delete(path, plan.keys)
+            if current == result:
+                continue
+            name = os.path.relpath(path, self.config.project_root)
+            chunks.extend(
+                difflib.unified_diff(
+                    current.splitlines(keepends=True),
+                    result.splitlines(keepends=True),
+                    fromfile=f"a/{name}",
+                    tofile=f"b/{name}",
+                    n=1,
+                )
+            )
+        return "".join(chunks)
+
+    def apply(self, plan: PrunePlan) -> int:
+        """Delete the planned keys, returns the number of files written."""
+        if not plan.keys:
+            return 0
+
+        written = 0
+        with span("save", module=plan.module.name, keys=len(plan.keys)) as save_span:
+            for lang in self.config.languages:
+                path = self.loader.strings_path(plan.module, lang.code)
+                if StringsXmlParser.delete_entries(path, plan.keys):
+                    written += 1
+            save_span.attrs["files"] = written
+
+        self.loader.tracker.forget(plan.module.name, plan.keys)
+        self.loader.tracker.save()
+        return written
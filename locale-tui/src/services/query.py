@@ -0,0 +1,440 @@
+"""Search query language.
+
+A query is a list of terms combined with implicit AND. Terms:
+
+    text            key or any translation contains text (case-insensitive)
+    "some text"     quoted text, may contain spaces or keywords
+    /regex/         key or any translation matches regex (/regex/i ignores case)
+    key:<value>     key matches value
+    lang:<code>:<value>, <code>:<value>
+                    translation of a language matches value
+    lang:<code>     language has a translation
+    missing[:<code>]
+                    translation missing (in any or the given language)
+    stale[:<code>]  translation outdated (in any or the given language)
+    dead            entry not referenced from code
+
+Values are substrings, globs when they contain `*` (anchored, e.g.
+`key:setting_*`), or /regex/ literals. Terms can be negated with `-` or NOT,
+combined with OR and grouped with parentheses.
+"""
+
+import re
+from typing import Callable, Iterable, Optional, TYPE_CHECKING
+
+from config import resolve_language_code
+
+if TYPE_CHECKING:
+    from models.entry import TranslationEntry
+    from services.search_index import SearchIndex
+
+
+# Looks up keys whose key or any value contains a lowercase needle
+SearchFn = Callable[[str], set[str]]
+
+# Needles shorter than this cannot be narrowed by the trigram index
+MIN_INDEXED_LENGTH = 3
+
+
+class QueryError(Exception):
+    """Invalid search query."""
+
+    pass
+
+
+class _Node:
+    """Compiled query node."""
+
+    def matches(self, entry: "TranslationEntry") -> bool:
+        raise NotImplementedError
+
+    def candidates(self, search: SearchFn) -> Optional[set[str]]:
+        """Superset of matching keys from the index, None if unknown."""
+        return None
+
+
+class _Everything(_Node):
+    def matches(self, entry: "TranslationEntry") -> bool:
+        return True
+
+
+class _Text(_Node):
+    """Substring, glob or regex over the key and every translation."""
+
+    def __init__(
+        self,
+        test: Callable[[str], bool],
+        needle: Optional[str],
+        hint: Optional[str],
+        index: Optional["SearchIndex"],
+    ):
+        self.test = test
+        self.needle = needle
+        self.hint = hint
+        self.index = index
+
+    def matches(self, entry: "TranslationEntry") -> bool:
+        if self.needle is not None and self.index is not None:
+            # Reuse pre-lowercased index text when matching plain substrings
+            return self.index.matches(entry.key, self.needle)
+        if self.test(entry.key):
+            return True
+        return any(self.test(v) for v in entry.translations.values() if v)
+
+    def candidates(self, search: SearchFn) -> Optional[set[str]]:
+        if self.needle is not None:
+            return search(self.needle)
+        if self.hint is not None:
+            return search(self.hint)
+        return None
+
+
+class _Field(_Node):
+    """Value test on the key or a single language."""
+
+    def __init__(
+        self,
+        lang_code: Optional[str],
+        test: Callable[[str], bool],
+        hint: Optional[str],
+    ):
+        self.lang_code = lang_code
+        self.test = test
+        self.hint = hint
+
+    def matches(self, entry: "TranslationEntry") -> bool:
+        if self.lang_code is None:
+            return self.test(entry.key)
+        return self.test(entry.translations.get(self.lang_code) or "")
+
+    def candidates(self, search: SearchFn) -> Optional[set[str]]:
+        # The index covers key and all values, so it yields a superset
+        if self.hint is not None:
+            return search(self.hint)
+        return None
+
+
+class _HasTranslation(_Node):
+    def __init__(self, lang_code: str):
+        self.lang_code = lang_code
+
+    def matches(self, entry: "TranslationEntry") -> bool:
+        return bool(entry.translations.get(self.lang_code))
+
+
+class _Missing(_Node):
+    def __init__(self, lang_codes: list[str]):
+        self.lang_codes = lang_codes
+
+    def matches(self, entry: "TranslationEntry") -> bool:
+        return entry.has_missing_translations(self.lang_codes)
+
+
+class _Stale(_Node):
+    def __init__(self, lang_code: Optional[str]):
+        self.lang_code = lang_code
+
+    def matches(self, entry: "TranslationEntry") -> bool:
+        if self.lang_code is None:
+            return entry.is_stale
+        return self.lang_code in entry.stale_languages
+
+
+class _Dead(_Node):
+    def matches(self, entry: "TranslationEntry") -> bool:
+        return entry.is_dead
+
+
+class _Not(_Node):
+    def __init__(self, node: _Node):
+        self.node = node
+
+    def matches(self, entry: "TranslationEntry") -> bool:
+        return not self.node.matches(entry)
+
+
+class _And(_Node):
+    def __init__(self, nodes: list[_Node]):
+        self.nodes = nodes
+
+    def matches(self, entry: "TranslationEntry") -> bool:
+        return all(node.matches(entry) for node in self.nodes)
+
+    def candidates(self, search: SearchFn) -> Optional[set[str]]:
+        result: Optional[set[str]] = None
+        for node in self.nodes:
+            keys = node.candidates(search)
+            if keys is None:
+                continue
+            result = set(keys) if result is None else result & keys
+        return result
+
+
+class _Or(_Node):
+    def __init__(self, nodes: list[_Node]):
+        self.nodes = nodes
+
+    def matches(self, entry: "TranslationEntry") -> bool:
+        return any(node.matches(entry) for node in self.nodes)
+
+    def candidates(self, search: SearchFn) -> Optional[set[str]]:
+        result: set[str] = set()
+        for node in self.nodes:
+            keys = node.candidates(search)
+            if keys is None:
+                return None
+            result |= keys
+        return result
+
+
+class Query:
+    """Compiled search query."""
+
+    def __init__(self, text: str, root: _Node):
+        self.text = text
+        self._root = root
+
+    def matches(self, entry: "TranslationEntry") -> bool:
+        """Check a single entry."""
+        return self._root.matches(entry)
+
+    def candidates(self, search: SearchFn) -> Optional[set[str]]:
+        """Narrow keys through the search index, None if it cannot help."""
+        return self._root.candidates(search)
+
+    def filter(
+        self,
+        entries: Iterable["TranslationEntry"],
+        search: Optional[SearchFn] = None,
+    ) -> list["TranslationEntry"]:
+        """Return matching entries, keeping their order."""
+        keys = self.candidates(search) if search is not None else None
+        if keys is not None:
+            entries = (e for e in entries if e.key in keys)
+        return [e for e in entries if self._root.matches(e)]
+
+
+class QueryCompiler:
+    """Compile query strings into predicates."""
+
+    def __init__(
+        self, lang_codes: list[str], index: Optional["SearchIndex"] = None
+    ):
+        self.lang_codes = lang_codes
+        self.index = index
+
+    def compile(self, text: str) -> Query:
+        """Compile a query string."""
+        tokens = self._tokenize(text)
+        if not tokens:
+            return Query(text, _Everything())
+
+        self._tokens = tokens
+        self._pos = 0
+        root = self._parse_or()
+        if self._pos < len(tokens):
+            raise QueryError(f"Unexpected '{tokens[self._pos]}'")
+        return Query(text, root)
+
+    # Tokenizer
+
+    def _tokenize(self, text: str) -> list[str]:
+        """Split into parentheses and raw terms, keeping quotes and regexes."""
+        tokens = []
+        i, n = 0, len(text)
+        while i < n:
+            ch = text[i]
+            if ch.isspace():
+                i += 1
+                continue
+            if ch in "()":
+                tokens.append(ch)
+                i += 1
+                continue
+
+            start = i
+            value_start = True
+            while i < n and not text[i].isspace() and text[i] not in "()":
+                ch = text[i]
+                if ch == '"' or (ch == "/" and value_start):
+                    i = self._skip_literal(text, i, ch)
+                    if ch == "/" and i < n and text[i] == "i":
+                        i += 1
+                    value_start = False
+                    continue
+                value_start = ch in ":-"
+                i += 1
+            tokens.append(text[start:i])
+        return tokens
+
+    @staticmethod
+    def _skip_literal(text: str, start: int, delimiter: str) -> int:
+        """Return the index after a quoted or /regex/ literal."""
+        i = start + 1
+        while i < len(text):
+            if text[i] == "\\":
+                i += 2
+                continue
+            if text[i] == delimiter:
+                return i + 1
+            i += 1
+        raise QueryError(f"Unterminated {delimiter} in query")
+
+    # Parser
+
+    def _peek(self) -> Optional[str]:
+        return self._tokens[self._pos] if self._pos < len(self._tokens) else None
+
+    def _parse_or(self) -> _Node:
+        nodes = [self._parse_and()]
+        while self._peek() is not None and self._peek().upper() == "OR":
+            self._pos += 1
+            nodes.append(self._parse_and())
+        return nodes[0] if len(nodes) == 1 else _Or(nodes)
+
+    def _parse_and(self) -> _Node:
+        nodes = []
+        while True:
+            token = self._peek()
+            if token is None or token == ")" or token.upper() == "OR":
+                break
+            if token.upper() == "AND":
+                self._pos += 1
+                continue
+            nodes.append(self._parse_unary())
+        if not nodes:
+            raise QueryError("Expected a search term")
+        return nodes[0] if len(nodes) == 1 else _And(nodes)
+
+    def _parse_unary(self) -> _Node:
+        token = self._peek()
+        if token is None:
+            raise QueryError("Expected a search term")
+        if token.upper() == "NOT":
+            self._pos += 1
+            return _Not(self._parse_unary())
+        if token == "(":
+            self._pos += 1
+            node = self._parse_or()
+            if self._peek() != ")":
+                raise QueryError("Missing ')'")
+            self._pos += 1
+            return node
+        self._pos += 1
+        if token.startswith("-") and len(token) > 1:
+            return _Not(self._parse_term(token[1:]))
+        return self._parse_term(token)
+
+    # Terms
+
+    def _parse_term(self, raw: str) -> _Node:
+        """Compile a single raw term."""
+        lowered = raw.lower()
+        if lowered == "dead":
+            return _Dead()
+        if lowered == "stale":
+            return _Stale(None)
+        if lowered == "missing":
+            return _Missing(self.lang_codes)
+
+        if not raw.startswith(('"', "/")):
+            field, sep, rest = raw.partition(":")
+            if sep:
+                node = self._parse_field(field.lower(), rest)
+                if node is not None:
+                    return node
+
+        test, needle, hint = self._value_test(raw)
+        return _Text(test, needle, hint, self.index)
+
+    def _parse_field(self, field: str, rest: str) -> Optional[_Node]:
+        """Compile a field:value term, None if field is not recognized."""
+        if field == "key":
+            test, _, hint = self._value_test(rest)
+            return _Field(None, test, hint)
+
+        if field == "lang":
+            code, sep, value = rest.partition(":")
+            lang_code = self._require_lang(code)
+            if not sep:
+                return _HasTranslation(lang_code)
+            test, _, hint = self._value_test(value)
+            return _Field(lang_code, test, hint)
+
+        if field == "missing":
+            return _Missing([self._require_lang(rest)] if rest else self.lang_codes)
+
+        if field == "stale":
+            return _Stale(self._require_lang(rest) if rest else None)
+
+        lang_code = self.resolve_language(field)
+        if lang_code is not None:
+            test, _, hint = self._value_test(rest)
+            return _Field(lang_code, test, hint)
+
+        return None
+
+    def resolve_language(self, code: str) -> Optional[str]:
+        """Resolve short codes like zh or ko-rKR to configured language codes."""
+        return resolve_language_code(code, self.lang_codes)
+
+    def _require_lang(self, code: str) -> str:
+        lang_code = self.resolve_language(code)
+        if lang_code is None:
+            raise QueryError(f"Unknown language '{code}'")
+        return lang_code
+
+    @staticmethod
+    def _value_test(
+        raw: str,
+    ) -> tuple[Callable[[str], bool], Optional[str], Optional[str]]:
+        """Build a value test with hints for the search index.
+
+        Returns (test, needle, hint). needle is the lowercase substring when
+        the value is a plain substring, hint a lowercase substring every match
+        must contain and that is long enough for the trigram index.
+        """
+        if not raw:
+            raise QueryError("Empty search value")
+
+        # Regex literal
+        if raw.startswith("/"):
+            flags = 0
+            body = raw[1:]
+            if body.endswith("/i"):
+                flags = re.IGNORECASE
+                body = body[:-2]
+            elif body.endswith("/"):
+                body = body[:-1]
+            try:
+                pattern = re.compile(body, flags)
+            except re.error as e:
+                raise QueryError(f"Invalid regex: {e}")
+            return (lambda v: pattern.search(v) is not None), None, None
+
+        if raw.startswith('"') and raw.endswith('"') and len(raw) >= 2:
+            raw = re.sub(r"\\(.)", r"\1", raw[1:-1])
+            if not raw:
+                raise QueryError("Empty search value")
+
+        needle = raw.lower()
+
+        # Anchored glob
+        if "*" in needle:
+            pattern = re.compile(
+                ".*".join(re.escape(part) for part in needle.split("*")) + r"\Z",
+                re.IGNORECASE | re.DOTALL,
+            )
+            longest = max(needle.split("*"), key=len)
+            hint = longest if len(longest) >= MIN_INDEXED_LENGTH else None
+            return (lambda v: pattern.match(v) is not None), None, hint
+
+        hint = needle if len(needle) >= MIN_INDEXED_LENGTH else None
+        return (lambda v: needle in v.lower()), needle, hint
+
+
+def compile_query(
+    text: str, lang_codes: list[str], index: Optional["SearchIndex"] = None
+) -> Query:
+    """Compile a query string against configured languages."""
+    return QueryCompiler(lang_codes, index).compile(text)
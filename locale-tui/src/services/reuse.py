@@ -0,0 +1,88 @@
+"""Reuse of existing translations across modules."""
+
+import re
+import unicodedata
+from collections import Counter
+from typing import Optional, TYPE_CHECKING
+
+from models.entry import TranslationEntry
+from services.placeholders import placeholder_mismatch
+
+if TYPE_CHECKING:
+    from services.workspace import WorkspaceIndex
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize(text: str) -> str:
+    """Source text with case, width and whitespace differences removed."""
+    text = unicodedata.normalize("NFKC", text)
+    return _WHITESPACE.sub(" ", text).strip().casefold()
+
+
+def choose_translation(
+    entries: list[TranslationEntry], source: str, lang_code: str
+) -> Optional[str]:
+    """Most common usable translation of entries for a source text."""
+    votes: Counter = Counter()
+    for entry in entries:
+        value = entry.get_translation(lang_code)
+        if (
+            not value
+            or not entry.translatable
+            or lang_code in entry.stale_languages
+            or placeholder_mismatch(source, value)
+        ):
+            continue
+        votes[value] += 1
+    if not votes:
+        return None
+    # most_common keeps insertion order among equal counts
+    return votes.most_common(1)[0][0]
+
+
+class TranslationMemory:
+    """Translations of every indexed module, looked up by source text.
+
+    A source text matches entries with the same text first and entries that
+    only differ in case, width or whitespace second. Stale, untranslatable
+    and placeholder-mismatched translations are never reused; when matches
+    disagree the most common translation wins, ties go to the first module
+    in config order.
+    """
+
+    def __init__(self, workspace: "WorkspaceIndex"):
+        self.workspace = workspace
+        self._order = {m.name: i for i, m in enumerate(workspace.config.modules)}
+        # {normalized source: [entry, ...]} in config module order
+        self._normalized: dict[str, list[TranslationEntry]] = {}
+        for module in workspace.config.modules:
+            for entry in workspace.entries(module.name):
+                source = entry.get_translation("values")
+                if source and entry.translatable:
+                    self._normalized.setdefault(normalize(source), []).append(entry)
+
+    def lookup(self, source: str, lang_code: str) -> Optional[str]:
+        """Existing translation of a source text, None when there is none."""
+        exact = [
+            entry
+            for _, entry in sorted(
+                self.workspace.find_source(source),
+                key=lambda match: self._order.get(match[0], len(self._order)),
+            )
+        ]
+        value = choose_translation(exact, source, lang_code)
+        if value is None:
+            value = choose_translation(
+                self._normalized.get(normalize(source), []), source, lang_code
+            )
+        return value
+
+    def match(self, sources: dict[str, str], lang_code: str) -> dict[str, str]:
+        """{key: translation} of the sources that have one."""
+        matches = {}
+        for key, source in sources.items():
+            value = self.lookup(source, lang_code)
+            if value is not None:
+                matches[key] = value
+        return matches
@@ -0,0 +1,129 @@
+"""Priority order of pending translation batches."""
+
+import asyncio
+from collections import deque
+from typing import Iterable, Optional
+
+# Priority tiers, lower runs first
+VISIBLE, FILTERED, REST = 0, 1, 2
+
+
+class TranslationScheduler:
+    """Hand out batches of pending strings, most important keys first.
+
+    Keys are ranked in tiers: rows on screen, rows matching the current
+    filter, everything else. A batch is taken for the language of the most
+    important pending string and filled up to batch_size with the next most
+    important strings of that language. prioritize() can be called while a
+    run is in progress, batches already handed out are not affected.
+
+    pause() holds back new batches until resume(), cancel() stops handing
+    them out for good. Batches already in flight finish either way.
+    """
+
+    def __init__(self, pending: dict[str, dict[str, str]], batch_size: int):
+        # {lang_code: {key: source}} not handed out yet
+        self._pending = {lang: dict(sources) for lang, sources in pending.items()}
+        self.batch_size = max(1, batch_size)
+        self.total = sum(len(sources) for sources in self._pending.values())
+        # Strings of batches that came back, translated or not
+        self.finished = 0
+        self.cancelled = False
+        self._resumed = asyncio.Event()
+        self._resumed.set()
+        # [tier] -> {lang_code: keys} in priority order, keys handed out
+        # since the last prioritize() are skipped lazily
+        self._tiers: list[dict[str, deque[str]]] = []
+        self._ranking: Optional[tuple[tuple[str, ...], tuple[str, ...]]] = None
+        self.prioritize()
+
+    def __len__(self) -> int:
+        """Strings not handed out yet."""
+        return sum(len(sources) for sources in self._pending.values())
+
+    @property
+    def paused(self) -> bool:
+        return not self._resumed.is_set()
+
+    def pause(self) -> None:
+        if not self.cancelled:
+            self._resumed.clear()
+
+    def resume(self) -> None:
+        self._resumed.set()
+
+    def cancel(self) -> None:
+        """Hand out no more batches, also wakes paused workers."""
+        self.cancelled = True
+        self._resumed.set()
+
+    async def wait_resumed(self) -> None:
+        """Return once the scheduler is not paused."""
+        await self._resumed.wait()
+
+    def prioritize(
+        self, visible: Iterable[str] = (), filtered: Iterable[str] = ()
+    ) -> bool:
+        """Rank visible keys first and filtered keys second.
+
+        Returns False when the ranking did not change.
+        """
+        ranking = (tuple(visible), tuple(filtered))
+        if ranking == self._ranking:
+            return False
+        self._ranking = ranking
+
+        tier_of: dict[str, int] = {}
+        for tier, keys in ((FILTERED, ranking[1]), (VISIBLE, ranking[0])):
+            for key in keys:
+                tier_of[key] = tier
+        # Position of each key within its tier, keys outside keep input order
+        position = {key: i for i, key in enumerate(ranking[0] + ranking[1])}
+
+        self._tiers = [{} for _ in (VISIBLE, FILTERED, REST)]
+        for lang, sources in self._pending.items():
+            ranked: list[list[str]] = [[], [], []]
+            for key in sources:
+                ranked[tier_of.get(key, REST)].append(key)
+            for tier, keys in enumerate(ranked):
+                if not keys:
+                    continue
+                if tier != REST:
+                    keys.sort(key=position.__getitem__)
+                self._tiers[tier][lang] = deque(keys)
+        return True
+
+    def next_batch(self) -> Optional[tuple[str, dict[str, str]]]:
+        """(lang_code, {key: source}) of the next batch, None when done."""
+        if self.cancelled:
+            return None
+        lang = self._first_language()
+        if lang is None:
+            return None
+        sources = self._pending[lang]
+        batch: dict[str, str] = {}
+        for tier in self._tiers:
+            keys = tier.get(lang)
+            while keys and len(batch) < self.batch_size:
+                key = keys.popleft()
+                if key in sources:
+                    batch[key] = sources.pop(key)
+            if len(batch) >= self.batch_size:
+                break
+        if not sources:
+            del self._pending[lang]
+        return lang, batch
+
+    def _first_language(self) -> Optional[str]:
+        """Language of the most important pending string."""
+        for tier in self._tiers:
+            for lang, keys in tier.items():
+                pending = self._pending.get(lang)
+                if pending is None:
+                    keys.clear()
+                    continue
+                while keys and keys[0] not in pending:
+                    keys.popleft()
+                if keys:
+                    return lang
+        return None
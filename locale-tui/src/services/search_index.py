@@ -0,0 +1,108 @@
+"""Search index service."""
+
+from typing import Iterable, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from models.entry import TranslationEntry
+
+
+class SearchIndex:
+    """Pre-lowercased trigram index over translation entries.
+
+    The index is built on first use, so screens that never search do not
+    pay for it.
+    """
+
+    # Joins key and values so that no trigram spans two fields
+    SEPARATOR = "\x00"
+
+    def __init__(self, entries: Iterable["TranslationEntry"] = ()):
+        self._texts: dict[str, str] = {}
+        self._postings: dict[str, set[str]] = {}
+        self._pending: Optional[dict[str, "TranslationEntry"]] = {
+            entry.key: entry for entry in entries
+        }
+
+    def __len__(self) -> int:
+        self._build()
+        return len(self._texts)
+
+    def _build(self) -> None:
+        """Index entries passed to the constructor."""
+        if self._pending is None:
+            return
+        pending, self._pending = self._pending, None
+        for entry in pending.values():
+            self.add(entry)
+
+    @staticmethod
+    def _trigrams(text: str) -> set[str]:
+        """Split text into its distinct trigrams."""
+        return {text[i : i + 3] for i in range(len(text) - 2)}
+
+    def _entry_text(self, entry: "TranslationEntry") -> str:
+        """Build lowercased searchable text for an entry."""
+        parts = [entry.key]
+        parts.extend(v for v in entry.translations.values() if v)
+        return self.SEPARATOR.join(parts).lower()
+
+    def add(self, entry: "TranslationEntry") -> None:
+        """Index a single entry."""
+        self._build()
+        text = self._entry_text(entry)
+        self._texts[entry.key] = text
+        for gram in self._trigrams(text):
+            self._postings.setdefault(gram, set()).add(entry.key)
+
+    def remove(self, key: str) -> None:
+        """Remove a single entry from the index."""
+        self._build()
+        text = self._texts.pop(key, None)
+        if text is None:
+            return
+        for gram in self._trigrams(text):
+            keys = self._postings.get(gram)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._postings[gram]
+
+    def update(self, entry: "TranslationEntry") -> None:
+        """Re-index an entry after its key or values changed."""
+        self.remove(entry.key)
+        self.add(entry)
+
+    def matches(self, key: str, query: str) -> bool:
+        """Check a single indexed entry against a query."""
+        self._build()
+        text = self._texts.get(key)
+        return text is not None and query.lower() in text
+
+    def search(self, query: str, candidates: Optional[set[str]] = None) -> set[str]:
+        """Return keys whose key or any value contains query (case-insensitive).
+
+        When candidates is given, only those keys are considered. This lets a
+        longer query narrow down the results of a previous, shorter one.
+        """
+        self._build()
+        query = query.lower()
+        pool = self._texts.keys() if candidates is None else candidates
+
+        if len(query) >= 3:
+            # Intersect posting lists, smallest first
+            postings = sorted(
+                (self._postings.get(gram, set()) for gram in self._trigrams(query)),
+                key=len,
+            )
+            matched = set(postings[0])
+            for keys in postings[1:]:
+                if not matched:
+                    break
+                matched &= keys
+            if candidates is not None:
+                matched &= candidates
+            pool = matched
+
+        # Trigrams only prove presence, verify the actual substring
+        texts = self._texts
+        return {key for key in pool if key in texts and query in texts[key]}
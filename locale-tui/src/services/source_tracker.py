@@ -0,0 +1,145 @@
+"""Source fingerprint tracker for stale translation detection."""
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Iterable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from models.entry import TranslationEntry
+
+
+class SourceTracker:
+    """Remember which source text each translation was made from.
+
+    A translation is stale when the source string changed after the
+    translation was recorded. Translations without a record are recorded
+    against the current source the first time they are seen.
+
+    Without autosave, new records are only kept in memory until save() is
+    called, which lets several processes read the same state safely.
+    """
+
+    def __init__(self, state_path: Path, autosave: bool = True):
+        self.state_path = state_path
+        self.autosave = autosave
+        # {module: {key: {lang_code: source_fingerprint}}}
+        self._state: dict[str, dict[str, dict[str, str]]] = {}
+        self._dirty = False
+        # mtime of the state file as last read or written
+        self._mtime_ns = 0
+        self._lock = threading.RLock()
+        self._load()
+
+    def _load(self) -> None:
+        """Load state file if present."""
+        if not self.state_path.exists():
+            return
+        try:
+            self._mtime_ns = self.state_path.stat().st_mtime_ns
+            self._state = json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self._state = {}
+
+    def sync(self) -> None:
+        """Reload state written by another process, unless there are unsaved records."""
+        try:
+            mtime_ns = self.state_path.stat().st_mtime_ns
+        except OSError:
+            return
+        with self._lock:
+            if not self._dirty and mtime_ns != self._mtime_ns:
+                self._load()
+
+    @staticmethod
+    def fingerprint(text: str) -> str:
+        """Short stable fingerprint of a source string."""
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()[:12]
+
+    def mark_stale_entries(
+        self, module_name: str, entries: list["TranslationEntry"]
+    ) -> int:
+        """Mark stale translations, returns stale entry count."""
+        stale_count = 0
+        with self._lock:
+            self.sync()
+            for entry in entries:
+                self.refresh_entry(module_name, entry)
+                if entry.is_stale:
+                    stale_count += 1
+            if self._dirty and self.autosave:
+                self.save()
+        return stale_count
+
+    def refresh_entry(
+        self, module_name: str, entry: "TranslationEntry", record_new: bool = True
+    ) -> None:
+        """Recompute stale languages of a single entry.
+
+        Without record_new, translations without a record are left
+        unrecorded, for entries holding unsaved values.
+        """
+        entry.stale_languages = set()
+        source = entry.get_translation("values")
+        if not source:
+            return
+
+        current = self.fingerprint(source)
+        with self._lock:
+            recorded = self._state.setdefault(module_name, {}).setdefault(
+                entry.key, {}
+            )
+            for lang_code, value in entry.translations.items():
+                if lang_code == "values" or not value:
+                    continue
+                known = recorded.get(lang_code)
+                if known is None:
+                    if not record_new:
+                        continue
+                    recorded[lang_code] = current
+                    self._dirty = True
+                elif known != current:
+                    entry.stale_languages.add(lang_code)
+
+    def record(
+        self,
+        module_name: str,
+        entry: "TranslationEntry",
+        lang_codes: Iterable[str],
+    ) -> None:
+        """Record that translations were made from the current source."""
+        source = entry.get_translation("values")
+        if not source:
+            return
+
+        current = self.fingerprint(source)
+        with self._lock:
+            recorded = self._state.setdefault(module_name, {}).setdefault(
+                entry.key, {}
+            )
+            for lang_code in lang_codes:
+                if lang_code == "values":
+                    continue
+                recorded[lang_code] = current
+                entry.stale_languages.discard(lang_code)
+            self._dirty = True
+
+    def forget(self, module_name: str, keys: Iterable[str]) -> None:
+        """Drop records of deleted keys."""
+        with self._lock:
+            recorded = self._state.get(module_name, {})
+            for key in keys:
+                if recorded.pop(key, None) is not None:
+                    self._dirty = True
+
+    def save(self) -> None:
+        """Write state file."""
+        with self._lock:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            self.state_path.write_text(
+                json.dumps(self._state, ensure_ascii=False, indent=1, sort_keys=True),
+                encoding="utf-8",
+            )
+            self._mtime_ns = self.state_path.stat().st_mtime_ns
+            self._dirty = False
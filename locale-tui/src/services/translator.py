@@ -1,13 +1,35 @@
 """AI translation service using OpenAI SDK."""
 
+import asyncio
 import json
+import time
+from dataclasses import dataclass
 from typing import Optional, Callable, TYPE_CHECKING
 
-from openai import AsyncOpenAI
+from openai import APIError, APIStatusError
+
+from services.endpoint_pool import EndpointPool, is_endpoint_failure
+from services.examples import estimate_tokens
+from services.perf import recorder
 
 if TYPE_CHECKING:
     from config import Config
-    from models.entry import TranslationEntry
+    from services.endpoint_pool import EndpointState
+    from services.examples import ExampleIndex
+    from services.scheduler import TranslationScheduler
+
+# Introduces the few-shot examples in the prompt
+EXAMPLES_HEADER = (
+    "Existing translations in this app, keep wording and terms consistent "
+    "with them:"
+)
+
+# Endpoints a failed request is tried on before its batch fails
+MAX_ATTEMPTS = 3
+
+# Statuses of endpoints that reject response_format, the request is then
+# sent again without it
+STRUCTURED_OUTPUT_ERRORS = {400, 422}
 
 
 class TranslationError(Exception):
@@ -16,105 +38,379 @@ class TranslationError(Exception):
     pass
 
 
+@dataclass
+class TokenUsage:
+    """Token usage accumulated over API requests."""
+
+    requests: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    # Requests sent and not answered yet
+    in_flight: int = 0
+    # Estimated tokens the compact encoding saved over the indented one
+    saved_tokens: int = 0
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+    def cost(self, input_price: float, output_price: float) -> float:
+        """Cost in USD for prices per million prompt and completion tokens."""
+        return (
+            self.prompt_tokens * input_price + self.completion_tokens * output_price
+        ) / 1_000_000
+
+
+def encode_strings(
+    entries: dict[str, str], compact: bool
+) -> tuple[str, Optional[dict[str, str]]]:
+    """JSON of a batch for the prompt and its {alias: key} map.
+
+    The compact form replaces keys by "1", "2", ... and drops whitespace,
+    the model echoes the aliases and decode_result() maps them back.
+    """
+    if not compact:
+        return json.dumps(entries, ensure_ascii=False, indent=2), None
+    aliases = {str(i): key for i, key in enumerate(entries, 1)}
+    text = json.dumps(
+        {alias: entries[key] for alias, key in aliases.items()},
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return text, aliases
+
+
+def decode_result(result, aliases: Optional[dict[str, str]]):
+    """Response object with aliases replaced by their keys.
+
+    Keys the model returned in full are kept as they are.
+    """
+    if aliases is None or not isinstance(result, dict):
+        return result
+    return {aliases.get(str(k), k): v for k, v in result.items()}
+
+
+def response_schema(keys) -> dict:
+    """response_format requiring a string for each key and nothing else."""
+    keys = list(keys)
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": "translations",
+            "strict": True,
+            "schema": {
+                "type": "object",
+                "properties": {key: {"type": "string"} for key in keys},
+                "required": keys,
+                "additionalProperties": False,
+            },
+        },
+    }
+
+
+def parse_response(content: str):
+    """JSON of a response, with or without a markdown code block around it.
+
+    Text around the object, like a sentence before the code block, is
+    ignored as a last resort.
+    """
+    content = content.strip()
+    try:
+        return json.loads(content)
+    except json.JSONDecodeError as e:
+        error = e
+    if content.startswith("```"):
+        # Remove markdown code block
+        lines = content.split("\n")
+        try:
+            return json.loads("\n".join(lines[1:-1]))
+        except json.JSONDecodeError as e:
+            error = e
+    start, end = content.find("{"), content.rfind("}")
+    if start < 0 or end <= start:
+        raise error
+    return json.loads(content[start : end + 1])
+
+
+def compact_savings(entries: dict[str, str], examples: Optional[dict[str, str]]) -> int:
+    """Estimated tokens a compact batch saves over the indented encoding.
+
+    The model answers in the layout it was given, so the response is
+    assumed to save as much as the source strings.
+    """
+    verbose = estimate_tokens(json.dumps(entries, ensure_ascii=False, indent=2))
+    compact = estimate_tokens(encode_strings(entries, True)[0])
+    saved = 2 * (verbose - compact)
+    if examples:
+        saved += estimate_tokens(
+            json.dumps(examples, ensure_ascii=False, indent=2)
+        ) - estimate_tokens(
+            json.dumps(examples, ensure_ascii=False, separators=(",", ":"))
+        )
+    return max(0, saved)
+
+
 class AITranslator:
     """AI translation service."""
 
     def __init__(self, config: "Config"):
         self.config = config
-        self.client = AsyncOpenAI(
-            api_key=config.openai_api_key,
-            base_url=config.openai_base_url,
-            # Some reverse proxies/WAF rules block the SDK default OpenAI/Python UA.
-            default_headers={"User-Agent": "locale-tui/1.0"},
+        self.usage = TokenUsage()
+        # Similar existing translations added to every prompt when set
+        self.examples: Optional["ExampleIndex"] = None
+        self.pool = EndpointPool(config.api_endpoints)
+
+    @property
+    def cost(self) -> float:
+        """Estimated cost of the requests so far in USD."""
+        return self.usage.cost(self.config.input_price, self.config.output_price)
+
+    def over_budget(self) -> bool:
+        """Whether the configured budget is used up.
+
+        Requests already in flight when it runs out still complete, so the
+        final cost can exceed the budget by up to max_concurrency requests.
+        """
+        return 0 < self.config.budget <= self.cost
+
+    async def _complete(self, prompt: str, response_format: Optional[dict] = None):
+        """Chat completion from the pool, failing over to other endpoints.
+
+        response_format is left out for endpoints that rejected it before;
+        an endpoint rejecting it now gets the request again without it and
+        is remembered when that succeeds. Returns the response and the name
+        of the endpoint that answered.
+        """
+        attempts = max(1, min(MAX_ATTEMPTS, len(self.pool)))
+        for attempt in range(attempts):
+            member = await self.pool.acquire()
+            structured = response_format if member.structured_output else None
+            try:
+                try:
+                    raw = await self._create(member, prompt, structured)
+                except APIStatusError as e:
+                    if (
+                        structured is None
+                        or e.status_code not in STRUCTURED_OUTPUT_ERRORS
+                    ):
+                        raise
+                    raw = await self._create(member, prompt, None)
+                    member.structured_output = False
+            except APIError as e:
+                response = getattr(e, "response", None)
+                self.pool.release(member, getattr(response, "headers", None), e)
+                if attempt + 1 < attempts and is_endpoint_failure(e):
+                    continue
+                raise
+            except BaseException:
+                self.pool.release(member)
+                raise
+            self.pool.release(member, raw.headers)
+            return raw.parse(), member.name
+
+    async def _create(
+        self,
+        member: "EndpointState",
+        prompt: str,
+        response_format: Optional[dict],
+    ):
+        """One raw chat completion request to an endpoint of the pool."""
+        kwargs = {}
+        if response_format is not None:
+            kwargs["response_format"] = response_format
+        return await member.client.chat.completions.with_raw_response.create(
+            model=self.config.translation_model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.3,
+            **kwargs,
         )
 
     async def translate_batch(
         self,
         entries: dict[str, str],  # {key: source_text}
         target_language: str,
+        examples: Optional[dict[str, str]] = None,  # {source_text: translation}
     ) -> dict[str, str]:
         """Translate a batch of entries."""
-        prompt = self.config.translation_prompt.format(
+        compact = self.config.compact_prompt
+        source_strings, aliases = encode_strings(entries, compact)
+        examples_text = ""
+        if examples:
+            if compact:
+                examples_json = json.dumps(
+                    examples, ensure_ascii=False, separators=(",", ":")
+                )
+            else:
+                examples_json = json.dumps(examples, ensure_ascii=False, indent=2)
+            examples_text = f"{EXAMPLES_HEADER}\n{examples_json}\n"
+        template = self.config.translation_prompt
+        prompt = template.format(
             target_language=target_language,
-            source_strings=json.dumps(entries, ensure_ascii=False, indent=2),
+            source_strings=source_strings,
+            examples=examples_text,
         )
+        if examples_text and "{examples}" not in template:
+            prompt = f"{prompt.rstrip()}\n\n{examples_text}"
 
+        # Batches run concurrently, so they are recorded instead of nested spans
+        start = time.perf_counter()
+        endpoint = None
+        self.usage.in_flight += 1
         try:
-            response = await self.client.chat.completions.create(
-                model=self.config.translation_model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.3,
-            )
+            try:
+                response, endpoint = await self._complete(
+                    prompt,
+                    response_schema(aliases or entries)
+                    if self.config.structured_output
+                    else None,
+                )
+            finally:
+                self.usage.in_flight -= 1
+                recorder.record(
+                    "translate.batch",
+                    time.perf_counter() - start,
+                    lang=target_language,
+                    keys=len(entries),
+                    examples=len(examples or ()),
+                    endpoint=endpoint,
+                )
+            self.usage.requests += 1
+            if compact:
+                self.usage.saved_tokens += compact_savings(entries, examples)
+            if response.usage is not None:
+                self.usage.prompt_tokens += response.usage.prompt_tokens or 0
+                self.usage.completion_tokens += response.usage.completion_tokens or 0
 
             content = response.choices[0].message.content
             if not content:
                 raise TranslationError("Empty response from API")
 
-            # Parse JSON response - handle potential markdown code blocks
-            content = content.strip()
-            if content.startswith("```"):
-                # Remove markdown code block
-                lines = content.split("\n")
-                content = "\n".join(lines[1:-1])
-
-            result = json.loads(content)
-            return result
+            result = decode_result(parse_response(content), aliases)
+            if not isinstance(result, dict):
+                raise TranslationError("Unexpected response format")
+            # Models ignoring the schema may answer numbers or null, callers
+            # count keys without a string as untranslated
+            return {
+                key: value
+                for key, value in result.items()
+                if isinstance(value, str) and value
+            }
 
         except json.JSONDecodeError as e:
             raise TranslationError(f"Failed to parse response: {e}")
+        except TranslationError:
+            raise
         except Exception as e:
             raise TranslationError(f"Translation failed: {e}")
 
-    async def translate_all_missing(
+    async def translate_languages(
         self,
-        entries: list["TranslationEntry"],
+        entries: dict[str, str],  # {key: source_text}
         target_languages: list[str],
-        progress_callback: Optional[Callable[[str, int, int, str], None]] = None,
-    ) -> int:
-        """Translate all missing entries."""
-        total_translated = 0
-        batch_size = self.config.batch_size
-
-        for lang_code in target_languages:
-            if lang_code == "values":
+    ) -> tuple[dict[str, dict[str, str]], dict[str, str]]:
+        """Translate the same entries to several languages concurrently.
+
+        Returns ({lang_code: {key: value}}, {lang_code: error}). At most
+        max_concurrency requests are in flight at once.
+        """
+        jobs = [
+            (lang_code, batch)
+            for lang_code in target_languages
+            if lang_code != "values"
+            for batch in self.split_batches(entries)
+        ]
+        results = await self.translate_batches(jobs)
+
+        translations: dict[str, dict[str, str]] = {}
+        errors: dict[str, str] = {}
+        for (lang_code, batch), result in zip(jobs, results):
+            if isinstance(result, TranslationError):
+                errors[lang_code] = str(result)
                 continue
+            translated = translations.setdefault(lang_code, {})
+            for key in batch:
+                if result.get(key):
+                    translated[key] = result[key]
+        return translations, errors
 
-            lang_name = self.config.get_language_name(lang_code)
+    def split_batches(self, entries: dict[str, str]) -> list[dict[str, str]]:
+        """Split entries into batches of batch_size."""
+        keys = list(entries.keys())
+        batch_size = max(1, self.config.batch_size)
+        return [
+            {k: entries[k] for k in keys[i : i + batch_size]}
+            for i in range(0, len(keys), batch_size)
+        ]
 
-            # Collect entries missing for this language
-            missing_entries = {}
-            for entry in entries:
-                source = entry.get_translation("values")
-                if source and not entry.get_translation(lang_code):
-                    missing_entries[entry.key] = source
+    def select_examples(
+        self, entries: dict[str, str], lang_code: str
+    ) -> Optional[dict[str, str]]:
+        """Few-shot examples for a batch, None without an example index."""
+        if self.examples is None:
+            return None
+        return self.examples.select(entries, lang_code)
 
-            if not missing_entries:
-                continue
+    async def translate_batches(
+        self,
+        jobs: list[tuple[str, dict[str, str]]],  # [(lang_code, {key: source})]
+    ) -> list[dict[str, str] | TranslationError]:
+        """Run batches concurrently, at most max_concurrency at once.
+
+        Results are in job order, failed batches yield their TranslationError.
+        """
+        semaphore = asyncio.Semaphore(max(1, self.config.max_concurrency))
 
-            # Translate in batches
-            keys = list(missing_entries.keys())
-            for i in range(0, len(keys), batch_size):
-                batch_keys = keys[i : i + batch_size]
-                batch = {k: missing_entries[k] for k in batch_keys}
-
-                if progress_callback:
-                    progress_callback(
-                        lang_code,
-                        i,
-                        len(keys),
-                        f"Translating to {lang_name}... ({i}/{len(keys)})",
+        async def run(lang_code: str, batch: dict[str, str]):
+            async with semaphore:
+                if self.over_budget():
+                    return TranslationError("Budget exceeded")
+                try:
+                    result = await self.translate_batch(
+                        batch,
+                        self.config.get_language_name(lang_code),
+                        self.select_examples(batch, lang_code),
                     )
+                except TranslationError as e:
+                    return e
+            return result
+
+        return await asyncio.gather(*(run(lang_code, batch) for lang_code, batch in jobs))
 
+    async def translate_scheduled(
+        self,
+        scheduler: "TranslationScheduler",
+        on_result: Callable[
+            [str, dict[str, str], dict[str, str] | TranslationError], None
+        ],
+    ) -> None:
+        """Translate batches in scheduler order until it runs dry.
+
+        max_concurrency workers each take the next batch when they are free,
+        so priority changes, pausing and cancelling apply to every batch not
+        started yet. The scheduler is cancelled when the budget runs out.
+        on_result(lang_code, batch, result or error) runs as batches finish.
+        """
+
+        async def worker() -> None:
+            while True:
+                await scheduler.wait_resumed()
+                if self.over_budget():
+                    scheduler.cancel()
+                job = scheduler.next_batch()
+                if job is None:
+                    return
+                lang_code, batch = job
                 try:
-                    translations = await self.translate_batch(batch, lang_name)
-
-                    # Update entries
-                    for entry in entries:
-                        if entry.key in translations:
-                            entry.set_translation(lang_code, translations[entry.key])
-                            total_translated += 1
-                except TranslationError:
-                    # Continue with other batches on error
-                    continue
+                    result = await self.translate_batch(
+                        batch,
+                        self.config.get_language_name(lang_code),
+                        self.select_examples(batch, lang_code),
+                    )
+                except TranslationError as e:
+                    result = e
+                scheduler.finished += len(batch)
+                on_result(lang_code, batch, result)
 
-        return total_translated
+        await asyncio.gather(
+            *(worker() for _ in range(max(1, self.config.max_concurrency)))
+        )
@@ -0,0 +1,166 @@
+"""Workspace-wide index over all configured modules."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, TYPE_CHECKING
+
+from models.entry import TranslationEntry
+from services.dead_entry_finder import ReferenceSite
+from services.module_loader import ModuleLoader, Fingerprint
+from services.perf import span
+
+if TYPE_CHECKING:
+    from config import Config, ModuleConfig
+
+
+class WorkspaceIndex:
+    """Entries, source texts and reference sites of every module.
+
+    Modules are loaded through a shared ModuleLoader, so refreshing only
+    reparses modules whose strings.xml files changed and rescans references
+    of modules whose source or layout files changed, rereading just those
+    files. Modules are reindexed when either changed. Lookups across modules
+    are answered from memory.
+    """
+
+    def __init__(self, config: "Config", loader: Optional[ModuleLoader] = None):
+        self.config = config
+        self.loader = loader or ModuleLoader(config)
+        self._modules = {m.name: m for m in config.modules}
+        # {module: (fingerprint, entries)} as of the last indexing
+        self._indexed: dict[str, tuple[Fingerprint, list[TranslationEntry]]] = {}
+        # {module: {key: entry}}
+        self._entries: dict[str, dict[str, TranslationEntry]] = {}
+        # {module: source texts} indexed for the module, to undo them later
+        self._sources: dict[str, set[str]] = {}
+        # {key: {module, ...}}
+        self._owners: dict[str, set[str]] = {}
+        # {source text: {module: [key, ...]}}
+        self._by_source: dict[str, dict[str, list[str]]] = {}
+        self._lock = threading.RLock()
+
+    def refresh(self, modules: Optional[list["ModuleConfig"]] = None) -> list[str]:
+        """Load modules in parallel and reindex the changed ones.
+
+        Returns the names of the reindexed modules.
+        """
+        modules = self.config.modules if modules is None else modules
+        if not modules:
+            return []
+
+        with span("workspace", modules=len(modules)) as refresh_span:
+            with ThreadPoolExecutor(max_workers=min(8, len(modules))) as pool:
+                loaded = list(pool.map(self.loader.load, modules))
+
+            changed = []
+            with self._lock:
+                for module, entries in zip(modules, loaded):
+                    # Stats of the strings and source files the load used
+                    fingerprint = self.loader.cached_fingerprint(
+                        module
+                    ) or self.loader.fingerprint(module)
+                    indexed = self._indexed.get(module.name)
+                    if (
+                        indexed is not None
+                        and indexed[0] == fingerprint
+                        and indexed[1] is entries
+                    ):
+                        continue
+                    self._index_module(module.name, fingerprint, entries)
+                    changed.append(module.name)
+            refresh_span.attrs["reindexed"] = len(changed)
+        return changed
+
+    def changed_modules(self) -> list["ModuleConfig"]:
+        """Modules whose strings or source files changed since indexing."""
+        with self._lock:
+            indexed = {name: value[0] for name, value in self._indexed.items()}
+        # Modules share layout directories, each is stated once
+        mtimes: dict[str, int] = {}
+        return [
+            module
+            for module in self.config.modules
+            if indexed.get(module.name) != self.loader.fingerprint(module, mtimes)
+        ]
+
+    def update_module(self, module: "ModuleConfig") -> None:
+        """Reindex a module after its loaded entries were edited in memory."""
+        with self._lock:
+            indexed = self._indexed.get(module.name)
+            if indexed is not None:
+                self._index_module(module.name, indexed[0], indexed[1])
+
+    def _index_module(
+        self, name: str, fingerprint: Fingerprint, entries: list[TranslationEntry]
+    ) -> None:
+        """Replace the lookup tables of one module."""
+        self._unindex_module(name)
+
+        sources = set()
+        for entry in entries:
+            self._owners.setdefault(entry.key, set()).add(name)
+            source = entry.get_translation("values")
+            if source:
+                sources.add(source)
+                self._by_source.setdefault(source, {}).setdefault(name, []).append(
+                    entry.key
+                )
+
+        self._indexed[name] = (fingerprint, entries)
+        self._entries[name] = {entry.key: entry for entry in entries}
+        self._sources[name] = sources
+
+    def _unindex_module(self, name: str) -> None:
+        """Drop a module from the lookup tables."""
+        for key in self._entries.pop(name, {}):
+            owners = self._owners.get(key)
+            if owners is not None:
+                owners.discard(name)
+                if not owners:
+                    del self._owners[key]
+        for source in self._sources.pop(name, set()):
+            by_module = self._by_source.get(source)
+            if by_module is not None:
+                by_module.pop(name, None)
+                if not by_module:
+                    del self._by_source[source]
+        self._indexed.pop(name, None)
+
+    def entries(self, module_name: str) -> list[TranslationEntry]:
+        """Indexed entries of a module."""
+        with self._lock:
+            indexed = self._indexed.get(module_name)
+            return indexed[1] if indexed is not None else []
+
+    def entry(self, module_name: str, key: str) -> Optional[TranslationEntry]:
+        """Entry of a module by key."""
+        with self._lock:
+            return self._entries.get(module_name, {}).get(key)
+
+    def modules_for_key(self, key: str) -> list[str]:
+        """Modules defining a key, in config order."""
+        with self._lock:
+            owners = self._owners.get(key, set())
+        return [name for name in self._modules if name in owners]
+
+    def find_source(self, text: str) -> list[tuple[str, TranslationEntry]]:
+        """(module, entry) of every entry with exactly this source text."""
+        with self._lock:
+            by_module = self._by_source.get(text, {})
+            return [
+                (name, self._entries[name][key])
+                for name, keys in by_module.items()
+                for key in keys
+            ]
+
+    def references(self, module_name: str, key: str) -> list[ReferenceSite]:
+        """Source locations referencing a key of a module."""
+        module = self._modules.get(module_name)
+        if module is None:
+            return []
+        return self.loader.references(module).get(key, [])
+
+    def fingerprints(self) -> dict[str, Fingerprint]:
+        """Strings and source file fingerprints of the indexed modules."""
+        with self._lock:
+            return {name: indexed[0] for name, indexed in self._indexed.items()}
@@ -1,15 +1,25 @@
 """Android strings.xml parser service."""
 
+import os
 from pathlib import Path
+from typing import Iterable, Optional
 from lxml import etree
 
+from services.perf import span
+
 
 class StringsXmlParser:
     """Android strings.xml parser."""
 
     @staticmethod
-    def parse(file_path: Path) -> dict[str, str]:
-        """Parse strings.xml file, returns {name: value} dict."""
+    def parse(
+        file_path: Path, untranslatable: Optional[set[str]] = None
+    ) -> dict[str, str]:
+        """Parse strings.xml file, returns {name: value} dict.
+
+        Names of strings marked translatable="false" are added to
+        untranslatable when given.
+        """
         if not file_path.exists():
             return {}
 
@@ -24,6 +34,11 @@ class StringsXmlParser:
                 if name:
                     value = StringsXmlParser._get_text_content(string_elem)
                     result[name] = value
+                    if (
+                        untranslatable is not None
+                        and string_elem.get("translatable") == "false"
+                    ):
+                        untranslatable.add(name)
 
             return result
         except Exception:
@@ -37,81 +52,180 @@ class StringsXmlParser:
         return ""
 
     @staticmethod
-    def write(file_path: Path, entries: dict[str, str]) -> None:
+    def write(
+        file_path: Path, entries: dict[str, str], untranslatable: Iterable[str] = ()
+    ) -> None:
         """Write strings.xml file."""
         root = etree.Element("resources")
+        untranslatable = set(untranslatable)
 
         for name in sorted(entries.keys()):
             value = entries[name]
             string_elem = etree.SubElement(root, "string")
             string_elem.set("name", name)
+            if name in untranslatable:
+                string_elem.set("translatable", "false")
             string_elem.text = value
 
         # Ensure directory exists
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
         etree.indent(root, space="  ")
-        tree = etree.ElementTree(root)
-        tree.write(
-            str(file_path), encoding="utf-8", xml_declaration=True, pretty_print=True
+        StringsXmlParser._save(file_path, etree.ElementTree(root))
+
+    @staticmethod
+    def _serialize(tree, trailing_newline: bool = False) -> bytes:
+        """Serialize a tree the way it is written to disk."""
+        data = etree.tostring(
+            tree, encoding="UTF-8", xml_declaration=True, pretty_print=True
         )
+        if trailing_newline:
+            data += b"\n"
+        return data
+
+    @staticmethod
+    def _save(file_path: Path, tree, trailing_newline: bool = False) -> None:
+        """Write a tree atomically so readers never see a half-written file."""
+        with span("write", file=file_path.parent.name):
+            data = StringsXmlParser._serialize(tree, trailing_newline)
+
+            tmp_path = file_path.with_name(f".{file_path.name}.{os.getpid()}.tmp")
+            try:
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, file_path)
+            finally:
+                if tmp_path.exists():
+                    tmp_path.unlink()
 
     @staticmethod
     def update_entry(file_path: Path, key: str, value: str) -> None:
         """Update single entry."""
+        StringsXmlParser.update_entries(file_path, {key: value})
+
+    @staticmethod
+    def update_entries(file_path: Path, updates: dict[str, str]) -> int:
+        """Update many entries with a single parse and write.
+
+        Returns the number of entries whose value changed or that were added.
+        """
+        if not updates:
+            return 0
+
         if not file_path.exists():
-            StringsXmlParser.write(file_path, {key: value})
-            return
+            StringsXmlParser.write(file_path, updates)
+            return len(updates)
 
         with open(file_path, 'r', encoding='utf-8') as f:
             tree = etree.parse(f)
         root = tree.getroot()
 
-        # Find existing entry
-        found = False
+        # Update existing entries
+        pending = dict(updates)
+        changed = 0
         for string_elem in root.findall("string"):
-            if string_elem.get("name") == key:
-                string_elem.text = value
-                found = True
-                break
-
-        # Add if not exists
-        if not found:
+            name = string_elem.get("name")
+            if name in pending:
+                value = pending.pop(name)
+                if string_elem.text != value:
+                    string_elem.text = value
+                    changed += 1
+
+        # Append new entries
+        for key, value in pending.items():
             string_elem = etree.SubElement(root, "string")
             string_elem.set("name", key)
             string_elem.text = value
+            changed += 1
+
+        if not changed:
+            return 0
 
         # Clean up whitespace and format
         etree.indent(root, space="  ")
 
-        tree.write(
-            str(file_path), encoding="utf-8", xml_declaration=True, pretty_print=True
-        )
-
         # Add newline at end of file
-        with open(file_path, 'a', encoding='utf-8') as f:
-            f.write('\n')
+        StringsXmlParser._save(file_path, tree, trailing_newline=True)
+
+        return changed
+
+    @staticmethod
+    def set_translatable(
+        file_path: Path, keys: Iterable[str], translatable: bool
+    ) -> int:
+        """Set or clear translatable="false" with a single parse and write.
+
+        Returns the number of changed entries.
+        """
+        if not file_path.exists():
+            return 0
+
+        with open(file_path, 'r', encoding='utf-8') as f:
+            tree = etree.parse(f)
+        root = tree.getroot()
+
+        keys = set(keys)
+        changed = 0
+        for string_elem in root.findall("string"):
+            if string_elem.get("name") not in keys:
+                continue
+            if translatable and string_elem.get("translatable") == "false":
+                del string_elem.attrib["translatable"]
+                changed += 1
+            elif not translatable and string_elem.get("translatable") != "false":
+                string_elem.set("translatable", "false")
+                changed += 1
+
+        if changed:
+            StringsXmlParser._save(file_path, tree)
+        return changed
 
     @staticmethod
     def delete_entry(file_path: Path, key: str) -> bool:
         """Delete single entry."""
+        return StringsXmlParser.delete_entries(file_path, [key]) > 0
+
+    @staticmethod
+    def delete_entries(file_path: Path, keys: Iterable[str]) -> int:
+        """Delete many entries with a single parse and write.
+
+        Returns the number of deleted entries.
+        """
+        tree, removed = StringsXmlParser._remove_entries(file_path, keys)
+        if removed:
+            StringsXmlParser._save(file_path, tree)
+        return removed
+
+    @staticmethod
+    def preview_delete(file_path: Path, keys: Iterable[str]) -> tuple[str, str]:
+        """Current file content and the content after deleting entries."""
         if not file_path.exists():
-            return False
+            return "", ""
+        current = file_path.read_text(encoding="utf-8")
+        tree, removed = StringsXmlParser._remove_entries(file_path, keys)
+        if not removed:
+            return current, current
+        return current, StringsXmlParser._serialize(tree).decode("utf-8")
+
+    @staticmethod
+    def _remove_entries(file_path: Path, keys: Iterable[str]):
+        """Parse a file and drop entries, returns (tree, removed count)."""
+        if not file_path.exists():
+            return None, 0
 
         with open(file_path, 'r', encoding='utf-8') as f:
             tree = etree.parse(f)
         root = tree.getroot()
 
+        keys = set(keys)
+        removed = 0
         for string_elem in root.findall("string"):
-            if string_elem.get("name") == key:
+            if string_elem.get("name") in keys:
                 root.remove(string_elem)
-                etree.indent(root, space="  ")
-                tree.write(
-                    str(file_path),
-                    encoding="utf-8",
-                    xml_declaration=True,
-                    pretty_print=True,
-                )
-                return True
-
-        return False
+                removed += 1
+
+        if removed:
+            etree.indent(root, space="  ")
+            if not len(root):
+                root.text = "\n"
+        return tree, removed
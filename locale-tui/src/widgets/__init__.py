@@ -1,3 +1,4 @@
 from .edit_modal import EditModal
+from .perf_hud import PerfHud
 
-__all__ = ["EditModal"]
+__all__ = ["EditModal", "PerfHud"]
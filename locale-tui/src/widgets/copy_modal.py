@@ -0,0 +1,78 @@
+"""Copy values between languages modal widget."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from textual.app import ComposeResult
+from textual.screen import ModalScreen
+from textual.widgets import Static, Button, Label, Select, Checkbox
+from textual.containers import Container, Horizontal, Vertical
+
+if TYPE_CHECKING:
+    from config import LanguageConfig
+
+
+class CopyLanguageModal(ModalScreen[dict | None]):
+    """Choose source and target language for copying values."""
+
+    BINDINGS = [
+        ("escape", "cancel", "Cancel"),
+        ("ctrl+s", "copy", "Copy"),
+    ]
+
+    def __init__(self, languages: list["LanguageConfig"], count: int) -> None:
+        super().__init__()
+        self.languages = languages
+        self.count = count
+
+    def compose(self) -> ComposeResult:
+        options = [
+            (f"{lang.name} ({lang.code})", lang.code) for lang in self.languages
+        ]
+        targets = [option for option in options if option[1] != "values"]
+
+        with Container(id="copy-modal"):
+            yield Static(
+                f"Copy values of [bold]{self.count}[/bold] entries", id="modal-title"
+            )
+            with Vertical(id="copy-form"):
+                yield Label("From:")
+                yield Select(
+                    options, value=options[0][1], allow_blank=False, id="copy-from"
+                )
+                yield Label("To:")
+                yield Select(
+                    targets, value=targets[0][1], allow_blank=False, id="copy-to"
+                )
+                yield Checkbox("Overwrite existing values", id="copy-overwrite")
+
+            with Horizontal(id="button-row"):
+                yield Button("Copy", variant="primary", id="copy-btn")
+                yield Button("Cancel", variant="default", id="cancel-btn")
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "copy-btn":
+            self.action_copy()
+        else:
+            self.action_cancel()
+
+    def action_copy(self) -> None:
+        """Confirm the copy."""
+        source = self.query_one("#copy-from", Select).value
+        target = self.query_one("#copy-to", Select).value
+        if source == target:
+            self.notify("Source and target language are the same", severity="warning")
+            return
+
+        self.dismiss(
+            {
+                "from": source,
+                "to": target,
+                "overwrite": self.query_one("#copy-overwrite", Checkbox).value,
+            }
+        )
+
+    def action_cancel(self) -> None:
+        """Cancel copy."""
+        self.dismiss(None)
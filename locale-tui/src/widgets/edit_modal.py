@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 
 from textual.app import ComposeResult
 from textual.screen import ModalScreen
@@ -23,15 +23,22 @@ class EditModal(ModalScreen[dict | None]):
     ]
 
     def __init__(
-        self, entry: "TranslationEntry", languages: list["LanguageConfig"]
+        self,
+        entry: "TranslationEntry",
+        languages: list["LanguageConfig"],
+        context: Optional[list[str]] = None,
     ) -> None:
         super().__init__()
         self.entry = entry
         self.languages = languages
+        # Hint lines shown under the title, e.g. where the key is used
+        self.context = context or []
 
     def compose(self) -> ComposeResult:
         with Container(id="edit-modal"):
             yield Static(f"Edit: [bold]{self.entry.key}[/bold]", id="modal-title")
+            if self.context:
+                yield Static("\n".join(self.context), id="edit-context", markup=False)
 
             with VerticalScroll(id="edit-form"):
                 for lang in self.languages:
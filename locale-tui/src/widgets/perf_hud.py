@@ -0,0 +1,80 @@
+"""Performance HUD widget."""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+
+from textual.widgets import Static
+
+from services.perf import recorder, memory_usage
+
+
+class PerfHud(Static):
+    """Overlay showing the latest operation timings and event loop stalls."""
+
+    # (span name, label) rows in display order
+    ROWS = [
+        ("load", "Load"),
+        ("parse", "  parse"),
+        ("scan", "  dead scan"),
+        ("stale", "  stale scan"),
+        ("filter", "Filter"),
+        ("render", "Render"),
+        ("save", "Save"),
+        ("translate", "Translate"),
+    ]
+
+    # Event loop probe interval in seconds
+    TICK = 0.1
+    # Probes kept for the stall statistics (~5 seconds)
+    WINDOW = 50
+
+    def __init__(self) -> None:
+        super().__init__(id="perf-hud")
+        self._last_tick = 0.0
+        self._stalls: deque[float] = deque(maxlen=self.WINDOW)
+        self._ticks = 0
+
+    def on_mount(self) -> None:
+        self._last_tick = time.perf_counter()
+        self.set_interval(self.TICK, self._tick)
+        self.render_stats()
+
+    def _tick(self) -> None:
+        """Measure how late the event loop ran this timer."""
+        now = time.perf_counter()
+        self._stalls.append(max(0.0, now - self._last_tick - self.TICK))
+        self._last_tick = now
+
+        # Redraw every half second
+        self._ticks += 1
+        if self._ticks % 5 == 0:
+            self.render_stats()
+
+    def render_stats(self) -> None:
+        """Redraw the HUD content."""
+        lines = ["[bold]Performance[/bold]"]
+        for name, label in self.ROWS:
+            span = recorder.latest.get(name)
+            if span is None:
+                lines.append(f"{label:14} [dim]-[/dim]")
+                continue
+            details = ", ".join(
+                f"{key} {value}" for key, value in span.attrs.items() if key != "module"
+            )
+            lines.append(f"{label:14} {span.duration_ms:8.1f} ms  [dim]{details}[/dim]")
+
+        memory = memory_usage()
+        lines.append("")
+        lines.append(
+            f"{'Memory':14} "
+            + (f"{memory / 1024 / 1024:8.1f} MB" if memory is not None else "       -")
+        )
+
+        if self._stalls:
+            last = self._stalls[-1] * 1000
+            worst = max(self._stalls) * 1000
+            lines.append(f"{'Loop stall':14} {last:8.1f} ms  [dim]max {worst:.1f} ms / 5s[/dim]")
+
+        self.update("\n".join(lines))